@@ -0,0 +1,80 @@
+"""add partial composite indexes for pdf feedback and annotation lookups
+
+Revision ID: 008_feedback_annotation_idx
+Revises: 007_fix_image_annotations_fk
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008_feedback_annotation_idx'
+down_revision: Union[str, None] = '007_fix_image_annotations_fk'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns) - all indexes only cover live (non soft-deleted) rows
+INDEXES = [
+    # Page feedback list + page average rating (pdf_file_uuid, page_number, extraction_job_uuid, rating)
+    (
+        'ix_pdf_file_page_feedback_page_active',
+        'pdf_file_page_feedback',
+        ['pdf_file_uuid', 'page_number', 'extraction_job_uuid', 'rating'],
+    ),
+    # Rating breakdown per extraction job
+    (
+        'ix_pdf_file_page_feedback_job_active',
+        'pdf_file_page_feedback',
+        ['extraction_job_uuid'],
+    ),
+    # Annotations list ordered by page and newest first
+    (
+        'ix_pdf_file_annotations_page_active',
+        'pdf_file_annotations',
+        ['pdf_file_uuid', 'page_number', sa.text('created_at DESC')],
+    ),
+]
+
+
+def upgrade() -> None:
+    """
+    Create partial indexes (WHERE deleted_at IS NULL) backing the feedback and annotation queries.
+    """
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+
+    for index_name, table_name, columns in INDEXES:
+        if table_name not in existing_tables:
+            continue
+        existing_indexes = {idx['name'] for idx in inspector.get_indexes(table_name)}
+        if index_name in existing_indexes:
+            continue
+        op.create_index(
+            index_name,
+            table_name,
+            columns,
+            unique=False,
+            postgresql_where=sa.text('deleted_at IS NULL'),
+        )
+
+
+def downgrade() -> None:
+    """
+    Drop the partial indexes created in upgrade().
+    """
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+
+    for index_name, table_name, _columns in INDEXES:
+        if table_name not in existing_tables:
+            continue
+        existing_indexes = {idx['name'] for idx in inspector.get_indexes(table_name)}
+        if index_name in existing_indexes:
+            op.drop_index(index_name, table_name=table_name)
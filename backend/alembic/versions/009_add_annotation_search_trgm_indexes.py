@@ -0,0 +1,74 @@
+"""add pg_trgm GIN indexes for annotation text/comment search
+
+Revision ID: 009_annotation_search_trgm
+Revises: 008_feedback_annotation_idx
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009_annotation_search_trgm'
+down_revision: Union[str, None] = '008_feedback_annotation_idx'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, column) - trigram indexes let ILIKE '%q%' avoid a sequential scan
+INDEXES = [
+    ('ix_pdf_file_annotations_text_trgm', 'pdf_file_annotations', 'text'),
+    ('ix_pdf_file_annotations_comment_trgm', 'pdf_file_annotations', 'comment'),
+]
+
+
+def upgrade() -> None:
+    """
+    Enable pg_trgm and create GIN trigram indexes on annotation text and comment.
+    """
+    connection = op.get_bind()
+    if connection.dialect.name != 'postgresql':
+        return
+
+    inspector = sa.inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    for index_name, table_name, column_name in INDEXES:
+        if table_name not in existing_tables:
+            continue
+        existing_indexes = {idx['name'] for idx in inspector.get_indexes(table_name)}
+        if index_name in existing_indexes:
+            continue
+        op.create_index(
+            index_name,
+            table_name,
+            [column_name],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={column_name: 'gin_trgm_ops'},
+            postgresql_where=sa.text('deleted_at IS NULL'),
+        )
+
+
+def downgrade() -> None:
+    """
+    Drop the trigram indexes created in upgrade(). The pg_trgm extension is left installed.
+    """
+    connection = op.get_bind()
+    if connection.dialect.name != 'postgresql':
+        return
+
+    inspector = sa.inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+
+    for index_name, table_name, _column_name in INDEXES:
+        if table_name not in existing_tables:
+            continue
+        existing_indexes = {idx['name'] for idx in inspector.get_indexes(table_name)}
+        if index_name in existing_indexes:
+            op.drop_index(index_name, table_name=table_name)
@@ -0,0 +1,84 @@
+"""add unique partial index for per-user page feedback upserts
+
+Revision ID: 010_page_feedback_unique
+Revises: 009_annotation_search_trgm
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '010_page_feedback_unique'
+down_revision: Union[str, None] = '009_annotation_search_trgm'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLE_NAME = 'pdf_file_page_feedback'
+INDEX_NAME = 'uq_pdf_file_page_feedback_user_page_job_active'
+INDEX_COLUMNS = ['pdf_file_uuid', 'page_number', 'extraction_job_uuid', 'user_id']
+
+
+def upgrade() -> None:
+    """
+    Enforce a single live feedback row per (document, page, extraction job, user).
+    Older live duplicates left behind by concurrent submissions are soft deleted first,
+    keeping the most recent row.
+    """
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+
+    if TABLE_NAME not in existing_tables:
+        return
+
+    existing_indexes = {idx['name'] for idx in inspector.get_indexes(TABLE_NAME)}
+    if INDEX_NAME in existing_indexes:
+        return
+
+    op.execute(
+        sa.text(
+            """
+            UPDATE pdf_file_page_feedback AS f
+            SET deleted_at = now()
+            FROM (
+                SELECT uuid,
+                       row_number() OVER (
+                           PARTITION BY pdf_file_uuid, page_number, extraction_job_uuid, user_id
+                           ORDER BY created_at DESC, uuid DESC
+                       ) AS rn
+                FROM pdf_file_page_feedback
+                WHERE deleted_at IS NULL AND user_id IS NOT NULL
+            ) AS d
+            WHERE f.uuid = d.uuid AND d.rn > 1
+            """
+        )
+    )
+
+    op.create_index(
+        INDEX_NAME,
+        TABLE_NAME,
+        INDEX_COLUMNS,
+        unique=True,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """
+    Drop the unique partial index. Soft-deleted duplicates are not restored.
+    """
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+
+    if TABLE_NAME not in existing_tables:
+        return
+
+    existing_indexes = {idx['name'] for idx in inspector.get_indexes(TABLE_NAME)}
+    if INDEX_NAME in existing_indexes:
+        op.drop_index(INDEX_NAME, table_name=TABLE_NAME)
@@ -0,0 +1,80 @@
+"""add partial indexes for pdf annotation, page content and extraction job lookups
+
+Revision ID: 011_pdf_soft_delete_idx
+Revises: 010_page_feedback_unique
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '011_pdf_soft_delete_idx'
+down_revision: Union[str, None] = '010_page_feedback_unique'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns) - all indexes only cover live (non soft-deleted) rows
+INDEXES = [
+    # Annotation listing filtered by document (+ job, page) and ordered by creation date
+    (
+        'ix_pdf_file_annotations_job_page_active',
+        'pdf_file_annotations',
+        ['pdf_file_uuid', 'extraction_job_uuid', 'page_number', 'created_at'],
+    ),
+    # Page content soft delete per extraction job (retry)
+    (
+        'ix_pdf_file_page_content_job_active',
+        'pdf_file_page_content',
+        ['extraction_job_uuid'],
+    ),
+    # Extraction job lookup within a document
+    (
+        'ix_pdf_file_extraction_jobs_file_active',
+        'pdf_file_extraction_jobs',
+        ['pdf_file_uuid', 'uuid'],
+    ),
+]
+
+
+def upgrade() -> None:
+    """
+    Create partial indexes (WHERE deleted_at IS NULL) backing the annotation, page content and job queries.
+    """
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+
+    for index_name, table_name, columns in INDEXES:
+        if table_name not in existing_tables:
+            continue
+        existing_indexes = {idx['name'] for idx in inspector.get_indexes(table_name)}
+        if index_name in existing_indexes:
+            continue
+        op.create_index(
+            index_name,
+            table_name,
+            columns,
+            unique=False,
+            postgresql_where=sa.text('deleted_at IS NULL'),
+        )
+
+
+def downgrade() -> None:
+    """
+    Drop the partial indexes created in upgrade().
+    """
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+
+    for index_name, table_name, _columns in INDEXES:
+        if table_name not in existing_tables:
+            continue
+        existing_indexes = {idx['name'] for idx in inspector.get_indexes(table_name)}
+        if index_name in existing_indexes:
+            op.drop_index(index_name, table_name=table_name)
@@ -0,0 +1,70 @@
+"""add pdf_file_extraction_retry_outbox table
+
+Revision ID: 012_extraction_retry_outbox
+Revises: 011_pdf_soft_delete_idx
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '012_extraction_retry_outbox'
+down_revision: Union[str, None] = '011_pdf_soft_delete_idx'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLE_NAME = 'pdf_file_extraction_retry_outbox'
+
+
+def upgrade() -> None:
+    """
+    Create the retry outbox table. A row is written in the same transaction that resets a
+    job for retry; enqueued_at is set once the Celery task has been dispatched.
+    """
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+
+    if TABLE_NAME in existing_tables:
+        return
+
+    op.create_table(
+        TABLE_NAME,
+        sa.Column('uuid', sa.String(), primary_key=True),
+        sa.Column(
+            'extraction_job_uuid',
+            sa.String(),
+            sa.ForeignKey('pdf_file_extraction_jobs.uuid'),
+            nullable=False,
+        ),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('enqueued_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(f'ix_{TABLE_NAME}_uuid', TABLE_NAME, ['uuid'], unique=False)
+    op.create_index(
+        f'ix_{TABLE_NAME}_extraction_job_uuid', TABLE_NAME, ['extraction_job_uuid'], unique=False
+    )
+    op.create_index(
+        f'ix_{TABLE_NAME}_pending',
+        TABLE_NAME,
+        ['created_at'],
+        unique=False,
+        postgresql_where=sa.text('enqueued_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """
+    Drop the retry outbox table.
+    """
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+
+    if TABLE_NAME in existing_tables:
+        op.drop_table(TABLE_NAME)
@@ -0,0 +1,63 @@
+"""add partial index for keyset pagination of pdf annotations
+
+Revision ID: 013_annotation_keyset_idx
+Revises: 012_extraction_retry_outbox
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '013_annotation_keyset_idx'
+down_revision: Union[str, None] = '012_extraction_retry_outbox'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLE_NAME = 'pdf_file_annotations'
+INDEX_NAME = 'ix_pdf_file_annotations_keyset_active'
+
+
+def upgrade() -> None:
+    """
+    Create a partial index on (pdf_file_uuid, created_at, uuid) over live rows, matching the
+    ORDER BY / keyset predicate of the annotation listing.
+    """
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+
+    if TABLE_NAME not in existing_tables:
+        return
+
+    existing_indexes = {idx['name'] for idx in inspector.get_indexes(TABLE_NAME)}
+    if INDEX_NAME in existing_indexes:
+        return
+
+    op.create_index(
+        INDEX_NAME,
+        TABLE_NAME,
+        ['pdf_file_uuid', 'created_at', 'uuid'],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """
+    Drop the keyset pagination index.
+    """
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+
+    if TABLE_NAME not in existing_tables:
+        return
+
+    existing_indexes = {idx['name'] for idx in inspector.get_indexes(TABLE_NAME)}
+    if INDEX_NAME in existing_indexes:
+        op.drop_index(INDEX_NAME, table_name=TABLE_NAME)
@@ -12,6 +12,13 @@ def is_s3_available() -> bool:
     """Check if S3 is configured and available"""
     return bool(AWS_BUCKET_NAME and AWS_REGION)
 
+# Serve S3-backed document downloads via a short-lived pre-signed URL redirect instead of
+# proxying the bytes through the API. Off by default: the PDF viewer fetches the file from the
+# app origin, so following the redirect needs a bucket CORS rule for the frontend origin
+# (see DEVELOPEMENT.md, "Direct S3 downloads").
+S3_PRESIGNED_DOWNLOADS = os.getenv("S3_PRESIGNED_DOWNLOADS", "false").lower() == "true"
+S3_PRESIGNED_URL_EXPIRY_SECONDS = int(os.getenv("S3_PRESIGNED_URL_EXPIRY_SECONDS", "300"))
+
 TOPK = 3
 RETRY = 1
 
@@ -35,13 +42,26 @@ DB_USER = os.getenv("DB_USER", "postgres")
 DB_PASSWORD = os.getenv("DB_PASSWORD", "")
 
 # Construct database URLs from environment variables
+# (TASKS_DATABASE_URL is the Celery workers' psycopg 3 engine)
 # Handle case where no password is set
 if DB_PASSWORD:
     DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
     ASYNC_DATABASE_URL = f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+    TASKS_DATABASE_URL = f"postgresql+psycopg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 else:
     DATABASE_URL = f"postgresql://{DB_USER}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
     ASYNC_DATABASE_URL = f"postgresql+asyncpg://{DB_USER}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+    TASKS_DATABASE_URL = f"postgresql+psycopg://{DB_USER}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+
+# asyncpg prepared statement caches. Set DB_STATEMENT_CACHE_SIZE=0 when connecting through
+# pgbouncer in transaction pooling mode (server-side prepared statements are not safe there).
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "1024"))
+DB_PREPARED_STATEMENT_CACHE_SIZE = 512 if DB_STATEMENT_CACHE_SIZE else 0
+
+# Celery worker connection pool. Size it to the worker's concurrency (-c) so every
+# task slot can hold a connection without waiting; overflow covers beat/telemetry bursts.
+TASKS_DB_POOL_SIZE = int(os.getenv("TASKS_DB_POOL_SIZE", "10"))
+TASKS_DB_MAX_OVERFLOW = int(os.getenv("TASKS_DB_MAX_OVERFLOW", "20"))
 
 MATHPIX_APP_ID = os.getenv('MATHPIX_APP_ID')
 MATHPIX_APP_KEY = os.getenv('MATHPIX_APP_KEY')
@@ -64,6 +84,8 @@ UPLOADS_DIR = os.getenv("UPLOADS_DIR", "/app/uploads")
 # Shared volume and stage configuration
 STAGE = os.getenv("STAGE", "development")
 SHARED_VOLUME_PATH = os.getenv("SHARED_VOLUME_PATH", "/app/shared_volume")
+# S3 objects up to this size are read into memory in one call when copied to the shared volume
+S3_SINGLE_READ_MAX_BYTES = int(os.getenv("S3_SINGLE_READ_MAX_BYTES", str(32 * 1024 * 1024)))
 
 # Stage-dependent configs
 if STAGE == "production":
@@ -100,10 +122,57 @@ EXTRACTOR_RETRY_CONFIG = {
 # Default for unknown extractors
 DEFAULT_RETRY_CONFIG = {"max_retries": 2, "countdown": 10}
 
+# Upper bound for exponential retry backoff (the extractor's countdown is the base)
+RETRY_BACKOFF_MAX_SECONDS = 300
+
+# Celery queues: local extractors finish in seconds and go to FAST_EXTRACTION_QUEUE (prefork worker);
+# API-backed extractors can take many minutes, mostly waiting on the network, and go to the
+# gevent worker (prefetch 1) so quick jobs never queue behind them. Each API vendor has its own
+# queue, which the gevent worker consumes round-robin, so a burst of jobs for one vendor cannot
+# hold up the others. SLOW_EXTRACTION_QUEUE carries async-job polling.
+FAST_EXTRACTION_QUEUE = "extract.fast"
+SLOW_EXTRACTION_QUEUE = "extract.slow"
+VENDOR_EXTRACTION_QUEUES = {
+    # PDF / image API extractors
+    "Textract": "extract.slow.aws",
+    "Mathpix": "extract.slow.mathpix",
+    "LlamaParse": "extract.slow.llamaparse",
+    "AzureDI": "extract.slow.azure",
+    "gpt-4o-mini": "extract.slow.openai",
+    "gpt-4o": "extract.slow.openai",
+    "gpt-5": "extract.slow.openai",
+    "gpt-5-mini": "extract.slow.openai",
+    # Audio transcription APIs
+    "whisper-openai": "extract.slow.openai",
+    "assemblyai": "extract.slow.assemblyai",
+    "aws-transcribe": "extract.slow.aws",
+}
+IO_BOUND_EXTRACTORS = frozenset(VENDOR_EXTRACTION_QUEUES)
+
+# Images per process_images_batch message when an upload fans out to a local image extractor
+IMAGE_EXTRACTION_BATCH_SIZE = 20
+
 # Circuit breaker settings
 CIRCUIT_BREAKER_THRESHOLD = 50  # consecutive failures before breaking
 CIRCUIT_BREAKER_TIMEOUT = 10  # seconds before resetting circuit
 
+# Retry outbox: the beat task only re-enqueues pending retry dispatches older than this
+# visibility timeout. Keep it above the longest time a retry can wait in the extraction
+# queues, or a dispatch that did reach the broker is sent a second time.
+RETRY_OUTBOX_VISIBILITY_TIMEOUT_SECONDS = int(os.getenv("RETRY_OUTBOX_VISIBILITY_TIMEOUT_SECONDS", "900"))
+RETRY_OUTBOX_POLL_INTERVAL_SECONDS = 30
+
+# Async extractor polling: backoff starts at the initial interval and is capped at the max interval
+EXTRACTION_POLL_INITIAL_INTERVAL_SECONDS = 5
+EXTRACTION_POLL_MAX_INTERVAL_SECONDS = 60
+EXTRACTION_POLL_TIMEOUT_SECONDS = 1800  # 30 minutes max polling time
+
+# Stale job reaper: a job left in PROCESSING this long lost its worker (a redelivered task skips
+# jobs that are already claimed), so the beat task marks it FAILURE and it can be retried. Keep
+# it above the longest legitimate run, including EXTRACTION_POLL_TIMEOUT_SECONDS of polling.
+STALE_JOB_TIMEOUT_SECONDS = int(os.getenv("STALE_JOB_TIMEOUT_SECONDS", "3600"))
+STALE_JOB_REAP_INTERVAL_SECONDS = 300
+
 # Langfuse configuration for cost tracking
 LANGFUSE_PUBLIC_KEY = os.getenv("LANGFUSE_PUBLIC_KEY")
 LANGFUSE_SECRET_KEY = os.getenv("LANGFUSE_SECRET_KEY")
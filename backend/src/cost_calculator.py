@@ -82,6 +82,10 @@ class CostCalculator:
         # Load pricing configuration
         self.pricing_config = self._load_pricing_config()
 
+        # Configured image pricing is flat per image, so the cost for an (extractor, image_count)
+        # pair never changes; cached so per-image tasks skip the config resolution
+        self._image_cost_cache: Dict[tuple, float] = {}
+
     def _load_pricing_config(self) -> Dict[str, Dict[str, Any]]:
         """Load pricing configuration for all extractors"""
         return {
@@ -316,7 +320,12 @@ class CostCalculator:
                 )
 
         # 3. Fallback to configured pricing
-        calculated_cost = self._calculate_cost_from_config(extractor_name, usage_data)
+        if usage_data.keys() == {"image_count"}:
+            calculated_cost = self._image_cost_from_config(
+                extractor_name, usage_data["image_count"]
+            )
+        else:
+            calculated_cost = self._calculate_cost_from_config(extractor_name, usage_data)
 
         return CostMetrics(
             calculated_cost=calculated_cost,
@@ -371,6 +380,17 @@ class CostCalculator:
             print(f"Error getting cost from Langfuse: {e}")
             return None
 
+    def _image_cost_from_config(self, extractor_name: str, image_count: int) -> float:
+        """Configured cost for `image_count` images, memoized per extractor and count"""
+        key = (extractor_name, image_count)
+        cost = self._image_cost_cache.get(key)
+        if cost is None:
+            cost = self._calculate_cost_from_config(
+                extractor_name, {"image_count": image_count}
+            )
+            self._image_cost_cache[key] = cost
+        return cost
+
     def _calculate_cost_from_config(
         self, extractor_name: str, usage_data: Dict[str, Any]
     ) -> float:
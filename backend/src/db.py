@@ -1,8 +1,33 @@
+import asyncio
+
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
-from .constants import ASYNC_DATABASE_URL
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from .constants import ASYNC_DATABASE_URL, DB_STATEMENT_CACHE_SIZE, DB_PREPARED_STATEMENT_CACHE_SIZE
+
+POOL_SIZE = 10
+# Requests waiting longer than this for a pooled connection get a 503 instead of hanging
+POOL_TIMEOUT_SECONDS = 5
 
-engine_async = create_async_engine(ASYNC_DATABASE_URL, echo=False)
+engine_async = create_async_engine(
+    ASYNC_DATABASE_URL,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=POOL_SIZE,
+    max_overflow=20,
+    pool_timeout=POOL_TIMEOUT_SECONDS,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    query_cache_size=1200,
+    # Let asyncpg reuse server-side prepared statements for the repeated route queries
+    connect_args={
+        "statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": DB_PREPARED_STATEMENT_CACHE_SIZE,
+    },
+    echo=False,
+)
 
 AsyncSessionLocal = async_sessionmaker(
     bind=engine_async,
@@ -11,7 +36,29 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 Base = declarative_base()
-        
+
+
+async def warm_up_pool(connections: int = POOL_SIZE) -> None:
+    """
+    Open `connections` pooled connections concurrently (each running SELECT 1) so the
+    first requests after startup do not pay the connect/auth cost.
+    """
+    async def _ping() -> None:
+        async with engine_async.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_ping() for _ in range(connections)))
+
+
 async def get_db():
     async with AsyncSessionLocal() as session:
-        yield session
\ No newline at end of file
+        try:
+            # Check out the connection up front so pool exhaustion surfaces as a fast 503
+            await session.connection()
+        except PoolTimeoutError:
+            raise HTTPException(
+                status_code=503,
+                detail="Database is busy, please retry",
+                headers={"Retry-After": "1"},
+            )
+        yield session
@@ -0,0 +1,23 @@
+"""
+Shared HTTP session for API-backed extractors.
+Readers are created per task, so a session owned by a reader would open a new TCP/TLS
+connection for every job. This module-level session keeps connections to each API host
+alive across tasks in the same worker process.
+"""
+import requests
+from requests.adapters import HTTPAdapter
+
+# Connections kept per host (and number of hosts cached); matches the gevent worker's -c 100
+# so concurrent greenlets calling the same API never open throwaway connections
+POOL_SIZE = 100
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+http_session = _build_session()
@@ -5,6 +5,7 @@ from .interface import ImageExtractorInterface
 from src.constants import MATHPIX_APP_ID, MATHPIX_APP_KEY
 from src.cost_calculator import CostCalculator
 from ..logger_decorator import log_extractor_method
+from ..http_session import http_session
 
 
 class MathpixImageExtractor(ImageExtractorInterface):
@@ -42,7 +43,7 @@ class MathpixImageExtractor(ImageExtractorInterface):
             with open(file_path, 'rb') as f:
                 files = {'file': f}
                 
-                response = requests.post(
+                response = http_session.post(
                     self.image_endpoint,
                     headers=headers,
                     files=files
@@ -9,6 +9,9 @@ from ..logger_decorator import log_extractor_method
 
 
 class OpenAIVisionImageExtractor(ImageExtractorInterface):
+    # OpenAI clients shared by all instances, keyed by request timeout
+    _shared_clients = {}
+
     def __init__(self, model_name: str):
         """
         Initialize OpenAI Vision extractor with specified model.
@@ -28,10 +31,15 @@ class OpenAIVisionImageExtractor(ImageExtractorInterface):
         if self._client is None:
             # GPT-5 models may take longer, use 120 seconds for them, 60 for others
             timeout = 120.0 if self.model_name in ("gpt-5", "gpt-5-mini") else 60.0
-            self._client = openai.OpenAI(
-                api_key=self._api_key,
-                timeout=timeout
-            )
+            # Reuse one client (and its connection pool) per timeout across reader instances
+            client = self._shared_clients.get(timeout)
+            if client is None:
+                client = openai.OpenAI(
+                    api_key=self._api_key,
+                    timeout=timeout
+                )
+                self._shared_clients[timeout] = client
+            self._client = client
         return self._client
     
     def _get_display_name(self) -> str:
@@ -1,10 +1,12 @@
 import os
 from loguru import logger
 from typing import Dict, Any, Union, Optional
+from botocore.config import Config
 from botocore.session import get_session
 from .interface import ImageExtractorInterface
 from src.constants import AWS_BUCKET_NAME, AWS_REGION
 from ..logger_decorator import log_extractor_method
+from ..http_session import POOL_SIZE
 
 
 class TextractImageExtractor(ImageExtractorInterface):
@@ -18,7 +20,12 @@ class TextractImageExtractor(ImageExtractorInterface):
         if self._session is None:
             self._session = get_session()  # picks up env/instance creds
         if self._textract is None:
-            self._textract = self._session.create_client("textract", region_name=self.region)
+            # The reader is shared by every task in the worker; botocore's default pool holds only 10
+            self._textract = self._session.create_client(
+                "textract",
+                region_name=self.region,
+                config=Config(max_pool_connections=POOL_SIZE),
+            )
 
     @log_extractor_method()
     def get_information(self) -> dict:
@@ -69,18 +69,19 @@ def log_extractor_method(
                     "extractor_name": extractor_name,
                     "method": method_name
                 }
+                # Context goes in via bind(): keyword arguments to a logging call make loguru
+                # str.format() the message, which breaks on braces in logged args/results
+                log = logger.bind(**log_context)
                 
-                logger.info(
-                    f"[{extractor_type}] {extractor_name}.{method_name}() called",
-                    **log_context
+                log.info(
+                    f"[{extractor_type}] {extractor_name}.{method_name}() called"
                 )
                 
                 # Log arguments if enabled
                 if log_args:
                     args_str = _format_args(args, kwargs, max_args_length)
-                    logger.debug(
-                        f"[{extractor_type}] {extractor_name}.{method_name}() args: {args_str}",
-                        **log_context
+                    log.debug(
+                        f"[{extractor_type}] {extractor_name}.{method_name}() args: {args_str}"
                     )
                 
                 # Execute method and measure time
@@ -94,17 +95,15 @@ def log_extractor_method(
                     
                     # Log execution time if enabled
                     if log_execution_time:
-                        logger.info(
-                            f"[{extractor_type}] {extractor_name}.{method_name}() completed in {execution_time:.3f}s",
-                            **log_context
+                        log.info(
+                            f"[{extractor_type}] {extractor_name}.{method_name}() completed in {execution_time:.3f}s"
                         )
                     
                     # Log result if enabled
                     if log_result:
                         result_str = _format_result(result, max_result_length)
-                        logger.debug(
-                            f"[{extractor_type}] {extractor_name}.{method_name}() result: {result_str}",
-                            **log_context
+                        log.debug(
+                            f"[{extractor_type}] {extractor_name}.{method_name}() result: {result_str}"
                         )
                     
                     return result
@@ -116,10 +115,8 @@ def log_extractor_method(
                     
                     # Log error if enabled
                     if log_errors:
-                        logger.error(
-                            f"[{extractor_type}] {extractor_name}.{method_name}() failed after {execution_time:.3f}s: {error_message}",
-                            **log_context,
-                            exc_info=True
+                        log.opt(exception=True).error(
+                            f"[{extractor_type}] {extractor_name}.{method_name}() failed after {execution_time:.3f}s: {error_message}"
                         )
                     
                     # Re-raise the exception
@@ -148,18 +145,19 @@ def log_extractor_method(
                     "extractor_name": extractor_name,
                     "method": method_name
                 }
+                # Context goes in via bind(): keyword arguments to a logging call make loguru
+                # str.format() the message, which breaks on braces in logged args/results
+                log = logger.bind(**log_context)
                 
-                logger.info(
-                    f"[{extractor_type}] {extractor_name}.{method_name}() called",
-                    **log_context
+                log.info(
+                    f"[{extractor_type}] {extractor_name}.{method_name}() called"
                 )
                 
                 # Log arguments if enabled
                 if log_args:
                     args_str = _format_args(args, kwargs, max_args_length)
-                    logger.debug(
-                        f"[{extractor_type}] {extractor_name}.{method_name}() args: {args_str}",
-                        **log_context
+                    log.debug(
+                        f"[{extractor_type}] {extractor_name}.{method_name}() args: {args_str}"
                     )
                 
                 # Execute method and measure time
@@ -173,17 +171,15 @@ def log_extractor_method(
                     
                     # Log execution time if enabled
                     if log_execution_time:
-                        logger.info(
-                            f"[{extractor_type}] {extractor_name}.{method_name}() completed in {execution_time:.3f}s",
-                            **log_context
+                        log.info(
+                            f"[{extractor_type}] {extractor_name}.{method_name}() completed in {execution_time:.3f}s"
                         )
                     
                     # Log result if enabled
                     if log_result:
                         result_str = _format_result(result, max_result_length)
-                        logger.debug(
-                            f"[{extractor_type}] {extractor_name}.{method_name}() result: {result_str}",
-                            **log_context
+                        log.debug(
+                            f"[{extractor_type}] {extractor_name}.{method_name}() result: {result_str}"
                         )
                     
                     return result
@@ -195,10 +191,8 @@ def log_extractor_method(
                     
                     # Log error if enabled
                     if log_errors:
-                        logger.error(
-                            f"[{extractor_type}] {extractor_name}.{method_name}() failed after {execution_time:.3f}s: {error_message}",
-                            **log_context,
-                            exc_info=True
+                        log.opt(exception=True).error(
+                            f"[{extractor_type}] {extractor_name}.{method_name}() failed after {execution_time:.3f}s: {error_message}"
                         )
                     
                     # Re-raise the exception
@@ -1,10 +1,10 @@
-import requests
 from typing import Union, Optional
 from .interface import PDFExtractorInterface
 from loguru import logger
 from src.constants import LLAMAPARSE_API_KEY
 from src.cost_calculator import CostCalculator
 from ..logger_decorator import log_extractor_method
+from ..http_session import http_session
 
 
 class LlamaParseExtractor(PDFExtractorInterface):
@@ -52,7 +52,7 @@ class LlamaParseExtractor(PDFExtractorInterface):
             }
 
             # Start extraction job
-            response = requests.post(
+            response = http_session.post(
                 f"{self.base_url}/upload",
                 headers=headers,
                 files=files,
@@ -83,7 +83,7 @@ class LlamaParseExtractor(PDFExtractorInterface):
                 "Authorization": f"Bearer {self.api_key}",
             }
             
-            response = requests.get(
+            response = http_session.get(
                 f"{self.base_url}/job/{job_id}",
                 headers=headers
             )
@@ -120,7 +120,7 @@ class LlamaParseExtractor(PDFExtractorInterface):
                 "Authorization": f"Bearer {self.api_key}",
             }
             
-            response = requests.get(
+            response = http_session.get(
                 f"{self.base_url}/job/{job_id}/result/raw/markdown",
                 headers=headers
             )
@@ -5,6 +5,7 @@ from .interface import PDFExtractorInterface
 from src.constants import MATHPIX_APP_ID, MATHPIX_APP_KEY
 from src.cost_calculator import CostCalculator
 from ..logger_decorator import log_extractor_method
+from ..http_session import http_session
 
 class MathpixExtractor(PDFExtractorInterface):
     def __init__(self):
@@ -60,7 +61,7 @@ class MathpixExtractor(PDFExtractorInterface):
             with open(file_path, 'rb') as f:
                 files = {'file': f}
                 
-                response = requests.post(
+                response = http_session.post(
                     self.pdf_endpoint,
                     headers=headers,
                     files=files
@@ -99,7 +100,7 @@ class MathpixExtractor(PDFExtractorInterface):
         }
 
         try:
-            response = requests.get(
+            response = http_session.get(
                 f"{self.pdf_endpoint}/{job_id}",
                 headers=headers
             )
@@ -148,7 +149,7 @@ class MathpixExtractor(PDFExtractorInterface):
 
         try:
             # Get the structured lines data from Mathpix
-            lines_response = requests.get(
+            lines_response = http_session.get(
                 f"{self.pdf_endpoint}/{job_id}.lines.json",
                 headers=headers
             )
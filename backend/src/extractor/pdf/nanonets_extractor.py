@@ -4,6 +4,7 @@ from loguru import logger
 from typing import Dict, Any, Union
 from .interface import PDFExtractorInterface
 from src.constants import NANONETS_API_KEY
+from ..http_session import http_session
 
 
 
@@ -36,7 +37,7 @@ class NanonetsExtractor(PDFExtractorInterface):
             with open(file_path, 'rb') as f:
                 files = {'file': f}
                 
-                response = requests.post(
+                response = http_session.post(
                     self.upload_endpoint,
                     auth=requests.auth.HTTPBasicAuth(self.api_key, ''),
                     files=files
@@ -65,7 +66,7 @@ class NanonetsExtractor(PDFExtractorInterface):
         Returns: 'processing', 'succeeded', 'failed'
         """
         try:
-            response = requests.get(
+            response = http_session.get(
                 f"{self.result_endpoint}/{job_id}",
                 auth=requests.auth.HTTPBasicAuth(self.api_key, '')
             )
@@ -101,7 +102,7 @@ class NanonetsExtractor(PDFExtractorInterface):
             Dict with page contents in the standard format
         """
         try:
-            response = requests.get(
+            response = http_session.get(
                 f"{self.result_endpoint}/{job_id}",
                 auth=requests.auth.HTTPBasicAuth(self.api_key, '')
             )
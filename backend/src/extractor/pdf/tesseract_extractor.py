@@ -1,13 +1,17 @@
+import os
+import tempfile
 from loguru import logger
 from typing import Dict, Any, Union, Optional
 import pytesseract
-from PIL import Image
 import fitz  # PyMuPDF
-from io import BytesIO
 from .interface import PDFExtractorInterface
 from ..logger_decorator import log_extractor_method
 
 
+# Tesseract ends every page of a multi-page run with a form feed
+PAGE_SEPARATOR = "\f"
+
+
 class TesseractExtractor(PDFExtractorInterface):
     def __init__(self):
         self._last_result = None
@@ -25,7 +29,8 @@ class TesseractExtractor(PDFExtractorInterface):
     def read(self, file_path: str, **kwargs) -> Dict[int, Dict[str, Any]]:
         """
         Extracts text from each page of a scanned PDF using Tesseract OCR.
-        Converts PDF pages to images for OCR processing.
+        Converts PDF pages to images and OCRs them in a single tesseract run over an
+        image-list file, so the engine is initialised once per PDF instead of per page.
         """
         page_contents: Dict[int, Dict[str, Any]] = {}
         try:
@@ -33,17 +38,25 @@ class TesseractExtractor(PDFExtractorInterface):
             if not file_path.lower().endswith(".pdf"):
                 raise ValueError(f"Tesseract document extractor only supports PDF files, got: {file_path}")
             
-            # Convert each page to an image using PyMuPDF (no Poppler needed)
-            images = []
-            with fitz.open(file_path) as doc:
-                for page in doc:
-                    pix = page.get_pixmap(dpi=200)
-                    img_bytes = pix.tobytes("png")
-                    images.append(Image.open(BytesIO(img_bytes)))
+            with tempfile.TemporaryDirectory(prefix="tesseract_") as tmp_dir:
+                # Convert each page to an image using PyMuPDF (no Poppler needed)
+                image_paths = []
+                with fitz.open(file_path) as doc:
+                    for page in doc:
+                        image_path = os.path.join(tmp_dir, f"page_{page.number + 1}.png")
+                        page.get_pixmap(dpi=200).save(image_path)
+                        image_paths.append(image_path)
+                
+                if image_paths:
+                    list_path = os.path.join(tmp_dir, "pages.txt")
+                    with open(list_path, "w") as f:
+                        f.write("\n".join(image_paths) + "\n")
+                    page_texts = pytesseract.image_to_string(list_path).split(PAGE_SEPARATOR)
+                else:
+                    page_texts = []
             
-            for i, image in enumerate(images, start=1):
-                text = pytesseract.image_to_string(image)
-                text_stripped = text.strip()
+            for i in range(1, len(image_paths) + 1):
+                text_stripped = page_texts[i - 1].strip() if i <= len(page_texts) else ""
                 # Only TEXT is present, so COMBINED is not added (requires at least 2 content types)
                 page_contents[i] = {
                     "content": {
@@ -1,4 +1,5 @@
 import os
+import shutil
 import redis
 import boto3
 from loguru import logger
@@ -9,12 +10,26 @@ from .constants import (
     AWS_REGION, 
     SHARED_VOLUME_PATH,
     FILE_CLEANUP_TTL_SECONDS,
-    CLEANUP_ON_TASK_FAILURE
+    CLEANUP_ON_TASK_FAILURE,
+    S3_SINGLE_READ_MAX_BYTES,
 )
  
 # Redis client for coordination
 redis_client = redis.Redis.from_url(REDIS_BACKEND_URL)
 
+# Chunk size used when streaming large S3 objects to the shared volume
+_S3_STREAM_CHUNK_BYTES = 1024 * 1024
+
+_s3_client = None
+
+
+def _get_s3_client():
+    """Lazily create one S3 client per process instead of one per download"""
+    global _s3_client
+    if _s3_client is None:
+        _s3_client = boto3.client('s3', region_name=AWS_REGION)
+    return _s3_client
+
 def register_extraction_tasks(document_uuid: str, job_uuids: List[str], ttl: int = None) -> None:
     """
     Register all extraction tasks for a document in Redis.
@@ -34,6 +49,20 @@ def register_extraction_tasks(document_uuid: str, job_uuids: List[str], ttl: int
     
     logger.info(f"Registered {len(job_uuids)} tasks for document {document_uuid} with TTL {ttl}s")
 
+def _preallocate(f, size: int) -> None:
+    """
+    Reserve the file's blocks up front so a streamed download is written into one extent
+    instead of growing the file chunk by chunk. Best effort: not every platform or
+    filesystem (e.g. some network mounts) supports it.
+    """
+    if not hasattr(os, 'posix_fallocate'):
+        return
+    try:
+        os.posix_fallocate(f.fileno(), 0, size)
+    except OSError:
+        pass
+
+
 def download_to_shared_volume(document_uuid: str, s3_key: str, filename: str) -> str:
     """
     Download S3 file to shared volume with file locking to prevent duplicate downloads.
@@ -59,10 +88,21 @@ def download_to_shared_volume(document_uuid: str, s3_key: str, filename: str) ->
         # Ensure shared volume directory exists
         os.makedirs(os.path.dirname(shared_path), exist_ok=True)
         
-        # Download from S3
+        # Download from S3 with a single GET (no HEAD / transfer manager round trips); small
+        # objects are read in one call, larger ones streamed in chunks. Written to a .part
+        # file and renamed so other tasks never see a partial download.
+        partial_path = f"{shared_path}.part"
         try:
-            s3_client = boto3.client('s3', region_name=AWS_REGION)
-            s3_client.download_file(AWS_BUCKET_NAME, s3_key, shared_path)
+            response = _get_s3_client().get_object(Bucket=AWS_BUCKET_NAME, Key=s3_key)
+            body = response['Body']
+            content_length = response.get('ContentLength', 0)
+            with open(partial_path, 'wb') as f:
+                if content_length <= S3_SINGLE_READ_MAX_BYTES:
+                    f.write(body.read())
+                else:
+                    _preallocate(f, content_length)
+                    shutil.copyfileobj(body, f, _S3_STREAM_CHUNK_BYTES)
+            os.replace(partial_path, shared_path)
             
             # Store file path in Redis for cleanup tracking
             file_path_key = f"doc_file_path:{document_uuid}"
@@ -74,8 +114,9 @@ def download_to_shared_volume(document_uuid: str, s3_key: str, filename: str) ->
         except Exception as e:
             logger.error(f"Failed to download file from S3: {e}")
             # Clean up any partial file
-            if os.path.exists(shared_path):
-                os.unlink(shared_path)
+            for path in (partial_path, shared_path):
+                if os.path.exists(path):
+                    os.unlink(path)
             raise
 
 def get_shared_file_path(document_uuid: str, filename: str) -> str:
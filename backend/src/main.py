@@ -9,7 +9,7 @@ from loguru import logger
 from pathlib import Path
 from urllib.parse import urlparse
 import httpx
-from src.db import get_db, engine_async, Base
+from src.db import get_db, engine_async, Base, warm_up_pool
 from src.models import User
 from src.auth.routes import router as auth_router
 from src.auth.security import hash_password
@@ -172,6 +172,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         import traceback
         logger.debug(traceback.format_exc())
     
+    # ----- 1.1 Warm the async connection pool ----- #
+    try:
+        await warm_up_pool()
+        logger.info("Database connection pool warmed up")
+    except Exception as warm_exc:
+        # Not fatal - connections will be opened lazily on first use
+        logger.warning(f"Failed to warm up database connection pool: {warm_exc}")
+    
     # ----- 1.2 Ensure admin user exists (pure async ORM) ----- #
     if not ADMIN_EMAIL or not ADMIN_PASSWORD:
         logger.warning(
@@ -240,7 +248,8 @@ app.add_middleware(
     allow_origins=[frontend_origin],
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["*"]
+    allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
 # Include auth router in the API router (will be at /api/auth)
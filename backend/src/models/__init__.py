@@ -16,6 +16,7 @@ from .database import (
     PDFFilePageContent,
     PDFFilePageFeedback,
     PDFFileAnnotation,
+    PDFFileExtractionRetryOutbox,
     AudioProject,
     AudioFile,
     AudioFileExtractionJob,
@@ -73,6 +74,7 @@ from .schemas import (
     # Annotation schemas
     AnnotationCreateRequest,
     AnnotationResponse,
+    AnnotationPage,
     UserRatingBreakdown,
     AnnotationListItem,
     # Audio schemas
@@ -116,6 +118,7 @@ __all__ = [
     "DocumentPageContent",
     "DocumentPageFeedback",
     "Annotation",
+    "PDFFileExtractionRetryOutbox",
     "AudioProject",
     "Audio",
     "AudioExtractionJob",
@@ -154,6 +157,7 @@ __all__ = [
     # Annotation schemas
     "AnnotationCreateRequest",
     "AnnotationResponse",
+    "AnnotationPage",
     "UserRatingBreakdown",
     "AnnotationListItem",
     # Audio schemas
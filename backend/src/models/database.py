@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, Text, JSON, Float, Boolean, ForeignKey
+from sqlalchemy import Column, String, Integer, DateTime, Text, JSON, Float, Boolean, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 from ..db import Base
@@ -71,6 +71,15 @@ class PDFFileExtractionJob(Base):
     cost = Column(Float, nullable=True)  # total cost
     deleted_at = Column(DateTime(timezone=True), nullable=True, index=True)  # Soft delete timestamp
 
+    __table_args__ = (
+        # Partial index over live jobs for document -> job lookups (retry, listing)
+        Index(
+            "ix_pdf_file_extraction_jobs_file_active",
+            pdf_file_uuid, uuid,
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
+
 class PDFFilePageContent(Base):
     __tablename__ = "pdf_file_page_content"
     
@@ -83,6 +92,12 @@ class PDFFilePageContent(Base):
     deleted_at = Column(DateTime(timezone=True), nullable=True, index=True)  # Soft delete timestamp
     
     __table_args__ = (
+        # Partial index over live pages for the per-job soft delete on retry
+        Index(
+            "ix_pdf_file_page_content_job_active",
+            "extraction_job_uuid",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
         {'extend_existing': True},
     )
 
@@ -109,6 +124,24 @@ class PDFFilePageFeedback(Base):
         return self.user.name if self.user else None
     
     __table_args__ = (
+        # Partial indexes over live rows for page feedback / average rating and job breakdown queries
+        Index(
+            "ix_pdf_file_page_feedback_page_active",
+            "pdf_file_uuid", "page_number", "extraction_job_uuid", "rating",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_pdf_file_page_feedback_job_active",
+            "extraction_job_uuid",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # One live feedback row per user, page and extraction job; target of the submit upsert
+        Index(
+            "uq_pdf_file_page_feedback_user_page_job_active",
+            "pdf_file_uuid", "page_number", "extraction_job_uuid", "user_id",
+            unique=True,
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
         {'extend_existing': True},
     )
 
@@ -134,6 +167,46 @@ class PDFFileAnnotation(Base):
     @property
     def user_name(self):
         return self.user.name if self.user else None
+    
+    __table_args__ = (
+        # Partial index over live rows for the annotations list (page order, newest first)
+        Index(
+            "ix_pdf_file_annotations_page_active",
+            pdf_file_uuid, page_number, created_at.desc(),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Partial index over live rows for the per-job annotation listing (oldest first)
+        Index(
+            "ix_pdf_file_annotations_job_page_active",
+            pdf_file_uuid, extraction_job_uuid, page_number, created_at,
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Partial index over live rows for keyset pagination of the annotation listing
+        Index(
+            "ix_pdf_file_annotations_keyset_active",
+            pdf_file_uuid, created_at, uuid,
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
+
+
+class PDFFileExtractionRetryOutbox(Base):
+    """Outbox row written with a job retry; enqueued_at stays NULL until the Celery task is dispatched."""
+    __tablename__ = "pdf_file_extraction_retry_outbox"
+
+    uuid = Column(String, primary_key=True, index=True)
+    extraction_job_uuid = Column(String, ForeignKey("pdf_file_extraction_jobs.uuid"), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    enqueued_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # Partial index over rows still waiting for dispatch (re-dispatch poller)
+        Index(
+            "ix_pdf_file_extraction_retry_outbox_pending",
+            created_at,
+            postgresql_where=text("enqueued_at IS NULL"),
+        ),
+    )
 
 
 class AudioProject(Base):
@@ -148,6 +148,11 @@ class AnnotationResponse(BaseModel):
     user_name: Optional[str] = None
     created_at: str
 
+class AnnotationPage(BaseModel):
+    # Returned by GET /annotations only when the caller asks for a page (limit/after)
+    items: List[AnnotationResponse]
+    next_cursor: Optional[str] = None
+
 class UserRatingBreakdown(BaseModel):
     user_id: Optional[int] = None
     user_name: Optional[str] = None
@@ -42,8 +42,7 @@ from src.models import (
     User,
 )
 from src.file_coordinator import register_extraction_tasks
-from src.tasks import process_audio_with_extractor
-from src.factory.audio import get_audio_reader
+from src.tasks import process_audio_with_extractor, get_extraction_queue
 from src.auth.security import get_current_user
 from src.cost_calculator import cost_calculator
 from src.constants import (
@@ -57,6 +56,7 @@ from src.routes.utils import (
     to_utc_isoformat,
     get_audio_duration,
     get_extractor_display_name,
+    get_extractor_information,
     safe_content_disposition,
 )
 
@@ -75,8 +75,7 @@ async def get_audio_extractors():
 
     def info(extractor_type: str) -> ExtractorInfo:
         try:
-            inst = get_audio_reader(extractor_type)
-            meta = inst.get_information()
+            meta = get_extractor_information(extractor_type, "audio")
             display_name = meta.get("name", extractor_type)
 
             # Calculate cost per minute using CostCalculator
@@ -555,8 +554,9 @@ async def upload_multiple_audios(
                 logger.info(
                     f"Queuing extraction task: job_uuid={job.uuid}, audio_uuid={audio_uuid}, extractor={job.extractor}"
                 )
-                process_audio_with_extractor.delay(
-                    job.uuid, audio_uuid, a.filepath, job.extractor
+                process_audio_with_extractor.apply_async(
+                    args=[job.uuid, audio_uuid, a.filepath, job.extractor],
+                    queue=get_extraction_queue(job.extractor),
                 )
 
         logger.info(
@@ -1297,8 +1297,9 @@ async def retry_audio_extraction_job(
 
         # Queue the retry task
         try:
-            process_audio_with_extractor.delay(
-                job_uuid, audio_uuid, audio.filepath, job.extractor
+            process_audio_with_extractor.apply_async(
+                args=[job_uuid, audio_uuid, audio.filepath, job.extractor],
+                queue=get_extraction_queue(job.extractor),
             )
             logger.info(
                 f"Successfully queued retry task: job_uuid={job_uuid}, audio_uuid={audio_uuid}, extractor={job.extractor}"
@@ -44,8 +44,7 @@ from src.models import (
     User,
 )
 from src.file_coordinator import register_extraction_tasks
-from src.tasks import process_image_with_extractor
-from src.factory.image import get_image_reader
+from src.tasks import process_image_with_extractor, process_images_batch, get_extraction_queue
 from src.auth.security import get_current_user
 from src.cost_calculator import cost_calculator
 from src.constants import (
@@ -53,12 +52,15 @@ from src.constants import (
     AWS_REGION,
     UPLOADS_DIR,
     FILE_CLEANUP_TTL_SECONDS,
+    IMAGE_EXTRACTION_BATCH_SIZE,
+    IO_BOUND_EXTRACTORS,
     is_s3_available,
 )
 from src.routes.utils import (
     to_utc_isoformat,
     get_image_dimensions,
     get_extractor_display_name,
+    get_extractor_information,
     safe_content_disposition,
 )
 
@@ -79,8 +81,7 @@ async def get_image_extractors():
         
         def info(extractor_type: str) -> ExtractorInfo:
             try:
-                inst = get_image_reader(extractor_type)
-                meta = inst.get_information()
+                meta = get_extractor_information(extractor_type, "image")
                 display_name = meta.get("name", extractor_type)
                 
                 # Calculate cost per image using CostCalculator
@@ -491,7 +492,9 @@ async def upload_multiple_images(
         await db.commit()
         logger.info(f"Created {total_jobs} total extraction jobs")
 
-        # Kick off tasks
+        # Kick off tasks: API extractors get one task per image so the gevent worker runs them
+        # concurrently; local extractors are grouped into batches to amortize per-task overhead
+        local_batches = {}
         for image_uuid in image_uuids:
             # Fetch path
             result = await db.execute(select(ImageFile).where(ImageFile.uuid == image_uuid))
@@ -499,8 +502,22 @@ async def upload_multiple_images(
             # For each job
             jobs_result = await db.execute(select(ImageFileExtractionJob).where(ImageFileExtractionJob.image_file_uuid == image_uuid))
             for job in jobs_result.scalars().all():
+                if job.extractor not in IO_BOUND_EXTRACTORS:
+                    local_batches.setdefault(job.extractor, []).append([job.uuid, image_uuid, img.filepath])
+                    continue
                 logger.info(f"Queuing extraction task: job_uuid={job.uuid}, image_uuid={image_uuid}, extractor={job.extractor}")
-                process_image_with_extractor.delay(job.uuid, image_uuid, img.filepath, job.extractor)
+                process_image_with_extractor.apply_async(
+                    args=[job.uuid, image_uuid, img.filepath, job.extractor],
+                    queue=get_extraction_queue(job.extractor),
+                )
+        for extractor_name, items in local_batches.items():
+            for i in range(0, len(items), IMAGE_EXTRACTION_BATCH_SIZE):
+                batch = items[i:i + IMAGE_EXTRACTION_BATCH_SIZE]
+                logger.info(f"Queuing batch extraction task: extractor={extractor_name}, images={len(batch)}")
+                process_images_batch.apply_async(
+                    args=[extractor_name, batch],
+                    queue=get_extraction_queue(extractor_name),
+                )
 
         logger.info(f"Upload complete: project_uuid={project_uuid}, successful={len(image_uuids)}, failed={len(failed_uploads)}, jobs_queued={total_jobs}")
         return {"message": f"Successfully uploaded {len(image_uuids)} files.", "image_uuids": image_uuids, "failed_uploads": failed_uploads}
@@ -1389,8 +1406,9 @@ async def retry_image_extraction_job(
 
         # Queue the retry task
         try:
-            process_image_with_extractor.delay(
-                job_uuid, image_uuid, image.filepath, job.extractor
+            process_image_with_extractor.apply_async(
+                args=[job_uuid, image_uuid, image.filepath, job.extractor],
+                queue=get_extraction_queue(job.extractor),
             )
             logger.info(f"Successfully queued retry task: job_uuid={job_uuid}, image_uuid={image_uuid}, extractor={job.extractor}")
         except Exception as task_err:
@@ -2,6 +2,7 @@
 PDF routes for the PDF Extraction Tool API
 """
 import uuid
+import hashlib
 import aioboto3
 import json
 import PyPDF2
@@ -10,13 +11,15 @@ import os
 import tempfile
 from io import BytesIO
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 from datetime import datetime, timezone
+from email.utils import format_datetime
 
-from fastapi import Depends, File, UploadFile, HTTPException, Form, APIRouter, Query
-from fastapi.responses import Response
+from fastapi import Depends, File, UploadFile, HTTPException, Form, APIRouter, Query, Request
+from fastapi.responses import Response, RedirectResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, or_, func
+from sqlalchemy import select, insert, update, or_, and_, func, bindparam, exists, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import joinedload
 from loguru import logger
 
@@ -44,16 +47,16 @@ from src.models import (
     PaginationMeta,
     PaginatedDocumentsResponse,
     PDFFileAnnotation,
+    PDFFileExtractionRetryOutbox,
     AnnotationCreateRequest,
     AnnotationResponse,
+    AnnotationPage,
     UserRatingBreakdown,
     AnnotationListItem,
     ImageExtractorType,
 )
 from src.file_coordinator import register_extraction_tasks
-from src.tasks import process_document_with_extractor
-from src.factory.pdf import get_reader, READER_MAP
-from src.factory.image import get_image_reader
+from src.tasks import process_document_with_extractor, get_extraction_queue
 from src.auth.security import get_current_user
 from src.cost_calculator import cost_calculator
 from src.constants import (
@@ -61,16 +64,52 @@ from src.constants import (
     AWS_REGION,
     UPLOADS_DIR,
     FILE_CLEANUP_TTL_SECONDS,
+    S3_PRESIGNED_DOWNLOADS,
+    S3_PRESIGNED_URL_EXPIRY_SECONDS,
     is_s3_available,
 )
 from src.routes.utils import (
     to_utc_isoformat,
     get_extractor_display_name,
+    get_extractor_information,
     safe_content_disposition,
+    escape_like,
+    encode_keyset_cursor,
+    decode_keyset_cursor,
+    UTCORJSONResponse,
 )
 
 router = APIRouter()
 
+# Built once at import so every request reuses the same statement (and its compiled-cache entry);
+# values are supplied per call via bind parameters.
+_DOCUMENT_IN_PROJECT_STMT = select(PDFFile).where(
+    PDFFile.uuid == bindparam("document_uuid"),
+    PDFFile.project_uuid == bindparam("project_uuid"),
+    PDFFile.deleted_at.is_(None),
+)
+
+# Existence-only variant: transfers a single column instead of hydrating the full row
+_DOCUMENT_EXISTS_IN_PROJECT_STMT = (
+    select(PDFFile.uuid)
+    .where(
+        PDFFile.uuid == bindparam("document_uuid"),
+        PDFFile.project_uuid == bindparam("project_uuid"),
+        PDFFile.deleted_at.is_(None),
+    )
+    .limit(1)
+)
+
+# Page size for GET /annotations when a cursor is passed without an explicit limit
+DEFAULT_ANNOTATION_PAGE_SIZE = 200
+
+# Download only needs the storage path and the original filename
+_DOCUMENT_FILE_IN_PROJECT_STMT = select(PDFFile.filepath, PDFFile.filename).where(
+    PDFFile.uuid == bindparam("document_uuid"),
+    PDFFile.project_uuid == bindparam("project_uuid"),
+    PDFFile.deleted_at.is_(None),
+)
+
 
 async def start_background_tasks_for_documents(
     db: AsyncSession, document_data: List[Dict[str, str]], selected_extractor_list: List[str]
@@ -114,8 +153,9 @@ async def start_background_tasks_for_documents(
         
         # Queue each job
         for job in jobs:
-            process_document_with_extractor.delay(
-                job.uuid, document_uuid, file_path, job.extractor
+            process_document_with_extractor.apply_async(
+                args=[job.uuid, document_uuid, file_path, job.extractor],
+                queue=get_extraction_queue(job.extractor),
             )
 
 
@@ -135,8 +175,7 @@ async def get_extractors():
         
         def pdf_reader_info(extractor_type: str) -> ExtractorInfo:
             try:
-                reader_inst = get_reader(extractor_type)
-                reader_meta = reader_inst.get_information()
+                reader_meta = get_extractor_information(extractor_type, "document")
                 display_name = reader_meta.get("name", extractor_type)
                 
                 # Calculate cost per page using CostCalculator
@@ -187,8 +226,7 @@ async def get_extractors():
 
         def image_reader_info(extractor_type: str) -> ExtractorInfo:
             try:
-                reader_inst = get_image_reader(extractor_type)
-                reader_meta = reader_inst.get_information()
+                reader_meta = get_extractor_information(extractor_type, "image")
                 display_name = reader_meta.get("name", extractor_type)
                 
                 # Calculate cost per image using CostCalculator
@@ -271,13 +309,13 @@ async def get_extractors():
         if image_vision_extractors:
             image_extractors_list.append({"category": "Vision", "extractors": image_vision_extractors})
         
-        logger.info(f"Found {len(available_pdf_extractors)} PDF extractors and {len(available_image_extractors)} image extractors")
+        logger.info("Found {} PDF extractors and {} image extractors", len(available_pdf_extractors), len(available_image_extractors))
         return {
             "pdf_extractors": pdf_extractors_list,
             "image_extractors": image_extractors_list
         }
     except Exception as e:
-        logger.error(f"Error fetching extractors: {str(e)}")
+        logger.error("Error fetching extractors: {}", str(e))
         raise HTTPException(status_code=500, detail="Failed to fetch extractors")
 
 
@@ -441,7 +479,7 @@ async def upload_multiple_documents(
 
         except Exception as e:
             error_msg = f"Error processing file: {str(e)}"
-            logger.error(f"PDF upload failed: Exception while processing file '{file.filename}' in project {project_uuid}: {str(e)}", exc_info=True)
+            logger.opt(exception=True).error(f"PDF upload failed: Exception while processing file '{file.filename}' in project {project_uuid}: {str(e)}")
             failed_uploads.append(
                 {"filename": file.filename or "unknown", "error": error_msg}
             )
@@ -543,7 +581,7 @@ async def list_projects(
         List[ProjectResponse]: List of PDF projects with ownership information.
     """
     try:
-        logger.info(f"Listing PDF projects for user_id={user.id}")
+        logger.info("Listing PDF projects for user_id={}", user.id)
         # Show all projects regardless of owner, excluding deleted projects
         result = await db.execute(
             select(PDFProject)
@@ -552,7 +590,7 @@ async def list_projects(
             .order_by(PDFProject.created_at.desc())
         )
         projects = result.scalars().all()
-        logger.info(f"Found {len(projects)} PDF projects")
+        logger.info("Found {} PDF projects", len(projects))
         return [
             ProjectResponse(
                 uuid=p.uuid,
@@ -565,7 +603,7 @@ async def list_projects(
             for p in projects
         ]
     except Exception as e:
-        logger.error(f"Error listing PDF projects: {str(e)}")
+        logger.error("Error listing PDF projects: {}", str(e))
         raise HTTPException(status_code=500, detail="Failed to list PDF projects")
 
 
@@ -590,7 +628,7 @@ async def get_project(
         HTTPException: 404 if project not found or has been deleted.
     """
     try:
-        logger.info(f"Getting PDF project: project_uuid={project_uuid}, user_id={user.id}")
+        logger.info("Getting PDF project: project_uuid={}, user_id={}", project_uuid, user.id)
         # Allow any user to view any project, excluding deleted projects
         result = await db.execute(
             select(PDFProject).options(joinedload(PDFProject.owner)).where(
@@ -599,7 +637,7 @@ async def get_project(
         )
         p = result.scalar_one_or_none()
         if not p:
-            logger.warning(f"PDF project not found: project_uuid={project_uuid}, user_id={user.id}")
+            logger.warning("PDF project not found: project_uuid={}, user_id={}", project_uuid, user.id)
             raise HTTPException(status_code=404, detail="Project not found")
         return ProjectResponse(
             uuid=p.uuid,
@@ -612,7 +650,7 @@ async def get_project(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting PDF project: {str(e)}")
+        logger.error("Error getting PDF project: {}", str(e))
         raise HTTPException(status_code=500, detail="Failed to get PDF project")
 
 
@@ -707,10 +745,10 @@ async def list_project_documents(
             )
         )
         if not project_result.scalar_one_or_none():
-            logger.warning(f"Project not found: project_uuid={project_uuid}")
+            logger.warning("Project not found: project_uuid={}", project_uuid)
             raise HTTPException(status_code=404, detail="Project not found")
 
-        logger.info(f"Listing project documents: project_uuid={project_uuid}, page={page}, page_size={page_size}, sort_by={sort_by}, sort_direction={sort_direction}")
+        logger.info("Listing project documents: project_uuid={}, page={}, page_size={}, sort_by={}, sort_direction={}", project_uuid, page, page_size, sort_by, sort_direction)
         # Validate pagination parameters
         if page < 1:
             raise HTTPException(status_code=400, detail="Page must be greater than 0")
@@ -742,7 +780,7 @@ async def list_project_documents(
             )
         )
         total_count = count_result.scalar()
-        logger.info(f"Found {total_count} documents in project, returning page {page} of {math.ceil(total_count / page_size) if total_count > 0 else 1}")
+        logger.info("Found {} documents in project, returning page {} of {}", total_count, page, math.ceil(total_count / page_size) if total_count > 0 else 1)
 
         # Calculate pagination metadata
         total_pages = math.ceil(total_count / page_size) if total_count > 0 else 1
@@ -759,7 +797,7 @@ async def list_project_documents(
         else:
             order_clause = sort_column.asc()
     except Exception as e:
-        logger.error(f"Error listing project documents: {str(e)}")
+        logger.error("Error listing project documents: {}", str(e))
         raise HTTPException(status_code=500, detail="Failed to list project documents")
 
     # Get paginated documents
@@ -823,7 +861,7 @@ async def get_document(
     Raises:
         HTTPException: 404 if document or project not found.
     """
-    logger.info(f"Getting document: project_uuid={project_uuid}, document_uuid={document_uuid}, user_id={user.id}")
+    logger.info("Getting document: project_uuid={}, document_uuid={}, user_id={}", project_uuid, document_uuid, user.id)
     try:
         result = await db.execute(
             select(PDFFile).options(joinedload(PDFFile.owner)).where(
@@ -835,7 +873,7 @@ async def get_document(
         document = result.scalar_one_or_none()
     
         if not document:
-            logger.warning(f"Document not found: project_uuid={project_uuid}, document_uuid={document_uuid}, user_id={user.id}")
+            logger.warning("Document not found: project_uuid={}, document_uuid={}, user_id={}", project_uuid, document_uuid, user.id)
             raise HTTPException(status_code=404, detail="Document not found")
 
         return DocumentResponse(
@@ -850,7 +888,7 @@ async def get_document(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting document: {str(e)}")
+        logger.error("Error getting document: {}", str(e))
         raise HTTPException(status_code=500, detail="Failed to get document")
 
 
@@ -898,11 +936,8 @@ async def delete_document(
 
     # Fetch document within project, excluding already deleted documents
     doc_result = await db.execute(
-        select(PDFFile).where(
-            PDFFile.uuid == document_uuid,
-            PDFFile.project_uuid == project_uuid,
-            PDFFile.deleted_at.is_(None),
-        )
+        _DOCUMENT_IN_PROJECT_STMT,
+        {"document_uuid": document_uuid, "project_uuid": project_uuid},
     )
     document = doc_result.scalar_one_or_none()
     if not document:
@@ -921,8 +956,9 @@ async def delete_document(
     logger.info(f"Deleting document with {len(job_uuids)} related jobs: document_uuid={document_uuid}, filename={document.filename}")
 
     try:
-        # Soft delete related rows instead of hard delete
-        current_time = datetime.now(timezone.utc)
+        # Soft delete related rows instead of hard delete; server-side now() is the
+        # transaction start time, so every row in the cascade gets the same timestamp
+        current_time = func.now()
 
         if job_uuids:
             await db.execute(
@@ -1030,8 +1066,9 @@ async def delete_document_legacy(
     job_uuids = [row[0] for row in job_uuid_rows]
 
     try:
-        # Soft delete related rows instead of hard delete
-        current_time = datetime.now(timezone.utc)
+        # Soft delete related rows instead of hard delete; server-side now() is the
+        # transaction start time, so every row in the cascade gets the same timestamp
+        current_time = func.now()
 
         if job_uuids:
             await db.execute(
@@ -1107,17 +1144,14 @@ async def get_document_extraction_jobs(
         HTTPException: 404 if document not found.
     """
     try:
-        logger.info(f"Getting extraction jobs: project_uuid={project_uuid}, document_uuid={document_uuid}, filter_by_user={filter_by_user}, user_id={user.id}")
+        logger.info("Getting extraction jobs: project_uuid={}, document_uuid={}, filter_by_user={}, user_id={}", project_uuid, document_uuid, filter_by_user, user.id)
         # First verify that the document belongs to the project (visible to all users)
         doc_result = await db.execute(
-            select(PDFFile).where(
-                PDFFile.uuid == document_uuid,
-                PDFFile.project_uuid == project_uuid,
-                PDFFile.deleted_at.is_(None),
-            )
+            _DOCUMENT_EXISTS_IN_PROJECT_STMT,
+            {"document_uuid": document_uuid, "project_uuid": project_uuid},
         )
-        if not doc_result.scalar_one_or_none():
-            logger.warning(f"Document not found: project_uuid={project_uuid}, document_uuid={document_uuid}, user_id={user.id}")
+        if doc_result.scalar() is None:
+            logger.warning("Document not found: project_uuid={}, document_uuid={}, user_id={}", project_uuid, document_uuid, user.id)
             raise HTTPException(status_code=404, detail="Document not found")
 
         result = await db.execute(
@@ -1129,7 +1163,7 @@ async def get_document_extraction_jobs(
             .order_by(PDFFileExtractionJob.extractor)
         )
         jobs = result.scalars().all()
-        logger.info(f"Found {len(jobs)} extraction jobs for document: document_uuid={document_uuid}")
+        logger.info("Found {} extraction jobs for document: document_uuid={}", len(jobs), document_uuid)
 
         # Get feedback statistics for each job
         job_responses = []
@@ -1161,7 +1195,7 @@ async def get_document_extraction_jobs(
                 total_rating = round(sum(ratings) / len(ratings), 2) if ratings else None
             except Exception as e:
                 # If user_id column doesn't exist in database yet, use defaults
-                logger.warning(f"Could not fetch feedback stats (schema may need migration): {e}")
+                logger.warning("Could not fetch feedback stats (schema may need migration): {}", e)
                 total_feedback_count = 0
                 pages_annotated = 0
                 total_rating = None
@@ -1190,12 +1224,12 @@ async def get_document_extraction_jobs(
                     total_feedback_count=total_feedback_count,
                 )
             )
-        logger.info(f"Returning {len(job_responses)} extraction job responses: document_uuid={document_uuid}")
+        logger.info("Returning {} extraction job responses: document_uuid={}", len(job_responses), document_uuid)
         return job_responses
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting document extraction jobs: {str(e)}")
+        logger.error("Error getting document extraction jobs: {}", str(e))
         raise HTTPException(status_code=500, detail="Failed to get document extraction jobs")
 
 
@@ -1227,7 +1261,7 @@ async def get_extraction_job_pages(
         HTTPException: 404 if extraction job or document not found.
     """
     try:
-        logger.info(f"Getting extraction job pages: project_uuid={project_uuid}, document_uuid={document_uuid}, job_uuid={job_uuid}, user_id={user.id}")
+        logger.info("Getting extraction job pages: project_uuid={}, document_uuid={}, job_uuid={}, user_id={}", project_uuid, document_uuid, job_uuid, user.id)
         # First verify that the extraction job belongs to a document owned by the user and project
         job_result = await db.execute(
             select(PDFFileExtractionJob).where(
@@ -1237,18 +1271,15 @@ async def get_extraction_job_pages(
         )
         job = job_result.scalar_one_or_none()
         if not job:
-            logger.warning(f"Extraction job not found: job_uuid={job_uuid}, document_uuid={document_uuid}, user_id={user.id}")
+            logger.warning("Extraction job not found: job_uuid={}, document_uuid={}, user_id={}", job_uuid, document_uuid, user.id)
             raise HTTPException(status_code=404, detail="Extraction job not found")
 
         doc_result = await db.execute(
-            select(PDFFile).where(
-                PDFFile.uuid == document_uuid,
-                PDFFile.project_uuid == project_uuid,
-                PDFFile.deleted_at.is_(None),
-            )
+            _DOCUMENT_EXISTS_IN_PROJECT_STMT,
+            {"document_uuid": document_uuid, "project_uuid": project_uuid},
         )
-        if not doc_result.scalar_one_or_none():
-            logger.warning(f"Document not found: project_uuid={project_uuid}, document_uuid={document_uuid}, user_id={user.id}")
+        if doc_result.scalar() is None:
+            logger.warning("Document not found: project_uuid={}, document_uuid={}, user_id={}", project_uuid, document_uuid, user.id)
             raise HTTPException(status_code=404, detail="Document not found")
         result = await db.execute(
             select(PDFFilePageContent)
@@ -1259,7 +1290,7 @@ async def get_extraction_job_pages(
             .order_by(PDFFilePageContent.page_number)
         )
         pages = result.scalars().all()
-        logger.info(f"Found {len(pages)} pages for job: job_uuid={job_uuid}, extractor={job.extractor}")
+        logger.info("Found {} pages for job: job_uuid={}, extractor={}", len(pages), job_uuid, job.extractor)
         return [
             DocumentPageContentResponse(
                 uuid=str(page.uuid),
@@ -1272,7 +1303,7 @@ async def get_extraction_job_pages(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting extraction job pages: {str(e)}")
+        logger.error("Error getting extraction job pages: {}", str(e))
         raise HTTPException(status_code=500, detail="Failed to get extraction job pages")
 
 
@@ -1304,17 +1335,14 @@ async def get_page_extractions(
         HTTPException: 404 if document not found.
     """
     try:
-        logger.info(f"Getting page extractions: project_uuid={project_uuid}, document_uuid={document_uuid}, page_number={page_number}, user_id={user.id}")
+        logger.info("Getting page extractions: project_uuid={}, document_uuid={}, page_number={}, user_id={}", project_uuid, document_uuid, page_number, user.id)
         # First verify that the document belongs to the user and project
         doc_result = await db.execute(
-            select(PDFFile).where(
-            PDFFile.uuid == document_uuid,
-            PDFFile.project_uuid == project_uuid,
-            PDFFile.deleted_at.is_(None),
+            _DOCUMENT_EXISTS_IN_PROJECT_STMT,
+            {"document_uuid": document_uuid, "project_uuid": project_uuid},
         )
-    )
-        if not doc_result.scalar_one_or_none():
-            logger.warning(f"Document not found: project_uuid={project_uuid}, document_uuid={document_uuid}, user_id={user.id}")
+        if doc_result.scalar() is None:
+            logger.warning("Document not found: project_uuid={}, document_uuid={}, user_id={}", project_uuid, document_uuid, user.id)
             raise HTTPException(status_code=404, detail="Document not found")
         # Get all extraction jobs for this document
         jobs_result = await db.execute(
@@ -1324,7 +1352,7 @@ async def get_page_extractions(
             )
         )
         jobs = jobs_result.scalars().all()
-        logger.info(f"Found {len(jobs)} extraction jobs for page extractions: document_uuid={document_uuid}, page_number={page_number}")
+        logger.info("Found {} extraction jobs for page extractions: document_uuid={}, page_number={}", len(jobs), document_uuid, page_number)
         # Get page content for this specific page from all extraction jobs
         page_contents = []
         for job in jobs:
@@ -1349,7 +1377,7 @@ async def get_page_extractions(
         feedbacks = feedback_result.scalars().all()
         # Create a mapping of extraction_job_uuid to feedback
         feedback_map = {f.extraction_job_uuid: f for f in feedbacks}
-        logger.info(f"Found {len(page_contents)} page contents and {len(feedbacks)} feedback entries for page: document_uuid={document_uuid}, page_number={page_number}")
+        logger.info("Found {} page contents and {} feedback entries for page: document_uuid={}, page_number={}", len(page_contents), len(feedbacks), document_uuid, page_number)
         return [
             DocumentPageContentResponse(
                 uuid=str(page.uuid),
@@ -1377,7 +1405,7 @@ async def get_page_extractions(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting page extractions: {str(e)}")
+        logger.error("Error getting page extractions: {}", str(e))
         raise HTTPException(status_code=500, detail="Failed to get page extractions")
 
 
@@ -1409,90 +1437,72 @@ async def submit_feedback(
         HTTPException: 404 if document not found.
         HTTPException: 500 if feedback submission fails.
     """
-    logger.info(f"Submitting feedback: project_uuid={project_uuid}, document_uuid={document_uuid}, page_number={feedback.page_number}, job_uuid={feedback.extraction_job_uuid}, user_id={user.id}, rating={feedback.rating}")
+    logger.info("Submitting feedback: project_uuid={}, document_uuid={}, page_number={}, job_uuid={}, user_id={}, rating={}", project_uuid, document_uuid, feedback.page_number, feedback.extraction_job_uuid, user.id, feedback.rating)
     try:
         # First verify that the document exists in the given project (accessible to any user)
         doc_result = await db.execute(
-            select(PDFFile).where(
-                PDFFile.uuid == feedback.document_uuid,
-                PDFFile.project_uuid == project_uuid,
-                PDFFile.deleted_at.is_(None),
-            )
+            _DOCUMENT_EXISTS_IN_PROJECT_STMT,
+            {"document_uuid": feedback.document_uuid, "project_uuid": project_uuid},
         )
-        if not doc_result.scalar_one_or_none():
-            logger.warning(f"Document not found for feedback: document_uuid={feedback.document_uuid}, project_uuid={project_uuid}, user_id={user.id}")
+        if doc_result.scalar() is None:
+            logger.warning("Document not found for feedback: document_uuid={}, project_uuid={}, user_id={}", feedback.document_uuid, project_uuid, user.id)
             raise HTTPException(status_code=404, detail="Document not found")
-        # Check if feedback already exists for this page, extractor, and user
-        existing_feedback = await db.execute(
-            select(PDFFilePageFeedback).where(
-                PDFFilePageFeedback.pdf_file_uuid == feedback.document_uuid,
-                PDFFilePageFeedback.page_number == feedback.page_number,
-                PDFFilePageFeedback.extraction_job_uuid
-                == feedback.extraction_job_uuid,
-                PDFFilePageFeedback.user_id == user.id,
-                PDFFilePageFeedback.deleted_at.is_(None),
-            )
+        # Single race-free upsert keyed on the live (document, page, job, user) feedback row.
+        # Omitted rating/comment values keep whatever the existing row already holds.
+        insert_stmt = pg_insert(PDFFilePageFeedback).values(
+            uuid=str(uuid.uuid4()),
+            pdf_file_uuid=feedback.document_uuid,
+            page_number=feedback.page_number,
+            extraction_job_uuid=feedback.extraction_job_uuid,
+            feedback_type="single",
+            rating=feedback.rating,
+            comment=feedback.comment,
+            user_id=user.id,
+        )
+        upsert_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[
+                PDFFilePageFeedback.pdf_file_uuid,
+                PDFFilePageFeedback.page_number,
+                PDFFilePageFeedback.extraction_job_uuid,
+                PDFFilePageFeedback.user_id,
+            ],
+            index_where=PDFFilePageFeedback.deleted_at.is_(None),
+            set_={
+                "rating": func.coalesce(insert_stmt.excluded.rating, PDFFilePageFeedback.rating),
+                "comment": func.coalesce(insert_stmt.excluded.comment, PDFFilePageFeedback.comment),
+            },
+        ).returning(
+            PDFFilePageFeedback.uuid,
+            PDFFilePageFeedback.pdf_file_uuid,
+            PDFFilePageFeedback.page_number,
+            PDFFilePageFeedback.extraction_job_uuid,
+            PDFFilePageFeedback.feedback_type,
+            PDFFilePageFeedback.rating,
+            PDFFilePageFeedback.comment,
+            PDFFilePageFeedback.user_id,
+            PDFFilePageFeedback.created_at,
+        )
+        saved = (await db.execute(upsert_stmt)).one()
+        await db.commit()
+        logger.info("Saved feedback: feedback_uuid={}, page_number={}, rating={}", saved.uuid, feedback.page_number, saved.rating)
+
+        return DocumentPageFeedbackResponse(
+            uuid=saved.uuid,
+            document_uuid=saved.pdf_file_uuid,
+            page_number=saved.page_number,
+            extraction_job_uuid=saved.extraction_job_uuid,
+            feedback_type=saved.feedback_type,
+            rating=saved.rating,
+            comment=saved.comment,
+            user_id=saved.user_id,
+            user_name=user.name,
+            created_at=to_utc_isoformat(saved.created_at),
         )
-        existing = existing_feedback.scalar_one_or_none()
-        if existing:
-            # Update existing feedback
-            if feedback.rating is not None:
-                existing.rating = feedback.rating
-            if feedback.comment is not None:
-                existing.comment = feedback.comment
-            # Update user info (do not set user_name; column not stored)
-            existing.user_id = user.id
-            await db.commit()
-            logger.info(f"Updated existing feedback: feedback_uuid={existing.uuid}, page_number={feedback.page_number}, rating={feedback.rating}")
-        else:
-            # Create new feedback
-            feedback_uuid = str(uuid.uuid4())
-            new_feedback = PDFFilePageFeedback(
-                uuid=feedback_uuid,
-                pdf_file_uuid=feedback.document_uuid,
-                page_number=feedback.page_number,
-                extraction_job_uuid=feedback.extraction_job_uuid,
-                feedback_type="single",
-                rating=feedback.rating,
-                comment=feedback.comment,
-                user_id=user.id,
-            )
-            db.add(new_feedback)
-            await db.commit()
-            await db.refresh(new_feedback)
-            logger.info(f"Created new feedback: feedback_uuid={feedback_uuid}, page_number={feedback.page_number}, rating={feedback.rating}")
-        # Return the updated/created feedback
-        if existing:
-            return DocumentPageFeedbackResponse(
-                uuid=str(existing.uuid),
-                document_uuid=str(existing.pdf_file_uuid),
-                page_number=int(existing.page_number),
-                extraction_job_uuid=str(existing.extraction_job_uuid),
-                feedback_type=str(existing.feedback_type),
-                rating=existing.rating,
-                comment=existing.comment,
-                user_id=existing.user_id,
-                user_name=user.name,
-                created_at=to_utc_isoformat(existing.created_at),
-            )
-        else:
-            # Refresh to get the created object
-            await db.refresh(new_feedback)
-            return DocumentPageFeedbackResponse(
-                uuid=str(new_feedback.uuid),
-                document_uuid=str(new_feedback.pdf_file_uuid),
-                page_number=int(new_feedback.page_number),
-                extraction_job_uuid=str(new_feedback.extraction_job_uuid),
-                feedback_type=str(new_feedback.feedback_type),
-                rating=new_feedback.rating,
-                comment=new_feedback.comment,
-                user_id=new_feedback.user_id,
-                user_name=user.name,
-                created_at=to_utc_isoformat(new_feedback.created_at),
-            )
 
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error submitting feedback: {str(e)}")
+        logger.error("Error submitting feedback: {}", str(e))
         raise HTTPException(status_code=500, detail="Failed to submit feedback")
 
 
@@ -1525,53 +1535,47 @@ async def get_page_feedback(
         HTTPException: 500 if error occurs.
     """
     try:
-        logger.info(f"Getting page feedback: project_uuid={project_uuid}, document_uuid={document_uuid}, page_number={page_number}, user_id={user.id}")
-        try:
-            # Verify that the document belongs to the project (visible to all users)
-            doc_result = await db.execute(
-                select(PDFFile).where(
-                    PDFFile.uuid == document_uuid,
-                    PDFFile.project_uuid == project_uuid,
-                    PDFFile.deleted_at.is_(None),
-                )
-            )
-            if not doc_result.scalar_one_or_none():
-                logger.warning(f"Document not found for feedback retrieval: document_uuid={document_uuid}, project_uuid={project_uuid}, user_id={user.id}")
-                raise HTTPException(status_code=404, detail="Document not found")
-            result = await db.execute(
-                select(PDFFilePageFeedback).where(
-                    PDFFilePageFeedback.pdf_file_uuid == document_uuid,
-                    PDFFilePageFeedback.page_number == page_number,
-                    PDFFilePageFeedback.deleted_at.is_(None),
-                )
+        logger.info("Getting page feedback: project_uuid={}, document_uuid={}, page_number={}, user_id={}", project_uuid, document_uuid, page_number, user.id)
+        # Verify that the document belongs to the project (visible to all users)
+        doc_result = await db.execute(
+            _DOCUMENT_EXISTS_IN_PROJECT_STMT,
+            {"document_uuid": document_uuid, "project_uuid": project_uuid},
+        )
+        if doc_result.scalar() is None:
+            logger.warning("Document not found for feedback retrieval: document_uuid={}, project_uuid={}, user_id={}", document_uuid, project_uuid, user.id)
+            raise HTTPException(status_code=404, detail="Document not found")
+        result = await db.execute(
+            select(PDFFilePageFeedback).where(
+                PDFFilePageFeedback.pdf_file_uuid == document_uuid,
+                PDFFilePageFeedback.page_number == page_number,
+                PDFFilePageFeedback.deleted_at.is_(None),
             )
-            feedbacks = result.scalars().all()
-            logger.info(f"Found {len(feedbacks)} feedback entries for page: document_uuid={document_uuid}, page_number={page_number}")
-            return [
-                DocumentPageFeedbackResponse(
-                    uuid=str(feedback.uuid),
-                    document_uuid=str(feedback.pdf_file_uuid),
-                    page_number=int(feedback.page_number),
-                    extraction_job_uuid=str(feedback.extraction_job_uuid),
-                    feedback_type=str(feedback.feedback_type),
-                    rating=feedback.rating,
-                    comment=feedback.comment,
-                    user_id=feedback.user_id,
+        )
+        feedbacks = result.scalars().all()
+        logger.info("Found {} feedback entries for page: document_uuid={}, page_number={}", len(feedbacks), document_uuid, page_number)
+        # Column types already match DocumentPageFeedbackResponse; datetimes are serialized by orjson
+        return UTCORJSONResponse(
+            content=[
+                {
+                    "uuid": feedback.uuid,
+                    "document_uuid": feedback.pdf_file_uuid,
+                    "page_number": feedback.page_number,
+                    "extraction_job_uuid": feedback.extraction_job_uuid,
+                    "feedback_type": feedback.feedback_type,
+                    "rating": feedback.rating,
+                    "comment": feedback.comment,
+                    "user_id": feedback.user_id,
                     # DocumentPageFeedback does not persist user_name; return None to avoid attribute errors
-                    user_name=None,
-                    created_at=to_utc_isoformat(feedback.created_at),
-                )
+                    "user_name": None,
+                    "created_at": feedback.created_at,
+                }
                 for feedback in feedbacks
             ]
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error(f"Error getting page feedback: {str(e)}")
-            raise HTTPException(status_code=500, detail="Failed to get page feedback")
+        )
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting page feedback: {str(e)}")
+        logger.error("Error getting page feedback: {}", str(e))
         raise HTTPException(status_code=500, detail="Failed to get page feedback")
 
 
@@ -1604,18 +1608,15 @@ async def get_rating_breakdown(
         HTTPException: 404 if document or extraction job not found.
         HTTPException: 500 if error occurs.
     """
-    logger.info(f"Getting rating breakdown: project_uuid={project_uuid}, document_uuid={document_uuid}, job_uuid={job_uuid}, user_id={user.id}")
+    logger.info("Getting rating breakdown: project_uuid={}, document_uuid={}, job_uuid={}, user_id={}", project_uuid, document_uuid, job_uuid, user.id)
     try:
         # Verify document exists in project
         doc_result = await db.execute(
-            select(PDFFile).where(
-                PDFFile.uuid == document_uuid,
-                PDFFile.project_uuid == project_uuid,
-                PDFFile.deleted_at.is_(None),
-            )
+            _DOCUMENT_EXISTS_IN_PROJECT_STMT,
+            {"document_uuid": document_uuid, "project_uuid": project_uuid},
         )
-        if not doc_result.scalar_one_or_none():
-            logger.warning(f"Document not found for rating breakdown: document_uuid={document_uuid}, project_uuid={project_uuid}, user_id={user.id}")
+        if doc_result.scalar() is None:
+            logger.warning("Document not found for rating breakdown: document_uuid={}, project_uuid={}, user_id={}", document_uuid, project_uuid, user.id)
             raise HTTPException(status_code=404, detail="Document not found")
 
         # Verify extraction job exists
@@ -1627,66 +1628,83 @@ async def get_rating_breakdown(
             )
         )
         if not job_result.scalar_one_or_none():
-            logger.warning(f"Extraction job not found for rating breakdown: job_uuid={job_uuid}, document_uuid={document_uuid}, user_id={user.id}")
+            logger.warning("Extraction job not found for rating breakdown: job_uuid={}, document_uuid={}, user_id={}", job_uuid, document_uuid, user.id)
             raise HTTPException(status_code=404, detail="Extraction job not found")
 
-        # Get all feedback for this extraction job, grouped by user
-        feedback_result = await db.execute(
-            select(PDFFilePageFeedback)
-            .where(
-                PDFFilePageFeedback.extraction_job_uuid == job_uuid,
-                PDFFilePageFeedback.deleted_at.is_(None),
-            )
-            .order_by(PDFFilePageFeedback.created_at.desc())
+        # Aggregate ratings per user and pick each user's latest feedback in SQL,
+        # so only one row per user is transferred instead of every feedback row
+        live_feedback = (
+            PDFFilePageFeedback.extraction_job_uuid == job_uuid,
+            PDFFilePageFeedback.deleted_at.is_(None),
         )
-        feedbacks = feedback_result.scalars().all()
-
-        # Group by user
-        user_feedback_map: Dict[Optional[int], List] = {}
-        for feedback in feedbacks:
-            user_id = feedback.user_id
-            if user_id not in user_feedback_map:
-                user_feedback_map[user_id] = []
-            user_feedback_map[user_id].append(feedback)
-
-        # Fetch user names in batch
-        user_ids = [uid for uid in user_feedback_map.keys() if uid is not None]
-        user_id_to_name: Dict[int, str] = {}
-        if user_ids:
-            users_result = await db.execute(select(User.id, User.name).where(User.id.in_(user_ids)))
-            for uid, name in users_result.all():
-                user_id_to_name[int(uid)] = name
-
-        # Build breakdown
-        breakdown = []
-        for user_id, user_feedbacks in user_feedback_map.items():
-            ratings = [f.rating for f in user_feedbacks if f.rating is not None]
-            if not ratings:
-                continue
-
-            avg_rating = sum(ratings) / len(ratings)
-            pages_rated = len(set(f.page_number for f in user_feedbacks))
-            latest = user_feedbacks[0]  # Already sorted by created_at desc
-
-            breakdown.append(
-                UserRatingBreakdown(
-                    user_id=user_id,
-                    user_name=user_id_to_name.get(int(user_id)) if user_id is not None else "Unknown User",
-                    average_rating=round(avg_rating, 2),
-                    pages_rated=pages_rated,
-                    total_ratings=len(ratings),
-                    latest_comment=latest.comment,
-                    latest_rated_at=to_utc_isoformat(latest.created_at),
+        latest_cte = (
+            select(
+                PDFFilePageFeedback.user_id,
+                PDFFilePageFeedback.comment,
+                PDFFilePageFeedback.created_at,
+                func.row_number()
+                .over(
+                    partition_by=PDFFilePageFeedback.user_id,
+                    order_by=PDFFilePageFeedback.created_at.desc(),
                 )
+                .label("rn"),
             )
+            .where(*live_feedback)
+            .subquery()
+        )
+        aggregate_cte = (
+            select(
+                PDFFilePageFeedback.user_id,
+                func.avg(PDFFilePageFeedback.rating).label("average_rating"),
+                func.count(func.distinct(PDFFilePageFeedback.page_number)).label("pages_rated"),
+                func.count(PDFFilePageFeedback.rating).label("total_ratings"),
+            )
+            .where(*live_feedback)
+            .group_by(PDFFilePageFeedback.user_id)
+            .having(func.count(PDFFilePageFeedback.rating) > 0)
+            .subquery()
+        )
+        breakdown_result = await db.execute(
+            select(
+                aggregate_cte.c.user_id,
+                aggregate_cte.c.average_rating,
+                aggregate_cte.c.pages_rated,
+                aggregate_cte.c.total_ratings,
+                latest_cte.c.comment,
+                latest_cte.c.created_at,
+                User.name,
+            )
+            .join(
+                latest_cte,
+                and_(
+                    latest_cte.c.user_id.is_not_distinct_from(aggregate_cte.c.user_id),
+                    latest_cte.c.rn == 1,
+                ),
+            )
+            .outerjoin(User, User.id == aggregate_cte.c.user_id)
+        )
 
-        logger.info(f"Returning rating breakdown: job_uuid={job_uuid}, users={len(breakdown)}, total_feedbacks={len(feedbacks)}")
-        return breakdown
+        # Rows map straight onto UserRatingBreakdown fields; serialized by orjson in one pass
+        breakdown = [
+            {
+                "user_id": row.user_id,
+                "user_name": row.name if row.user_id is not None else "Unknown User",
+                "average_rating": round(float(row.average_rating), 2),
+                "pages_rated": row.pages_rated,
+                "total_ratings": row.total_ratings,
+                "latest_comment": row.comment,
+                "latest_rated_at": row.created_at,
+            }
+            for row in breakdown_result
+        ]
+
+        logger.info("Returning rating breakdown: job_uuid={}, users={}", job_uuid, len(breakdown))
+        return UTCORJSONResponse(content=breakdown)
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting rating breakdown: {str(e)}")
+        logger.error("Error getting rating breakdown: {}", str(e))
         raise HTTPException(status_code=500, detail="Failed to get rating breakdown")
 
 
@@ -1722,60 +1740,51 @@ async def get_page_average_rating(
         HTTPException: 500 if error occurs.
     """
     try:
-        logger.info(f"Getting page average rating: project_uuid={project_uuid}, document_uuid={document_uuid}, page_number={page_number}, job_uuid={extraction_job_uuid}, user_id={user.id}")
-        try:
-            # Verify document exists in project
-            doc_result = await db.execute(
-                select(PDFFile).where(
-                    PDFFile.uuid == document_uuid,
-                    PDFFile.project_uuid == project_uuid,
-                    PDFFile.deleted_at.is_(None),
-                )
-            )
-            if not doc_result.scalar_one_or_none():
-                logger.warning(f"Document not found for average rating: document_uuid={document_uuid}, project_uuid={project_uuid}, user_id={user.id}")
-                raise HTTPException(status_code=404, detail="Document not found")
-
-            # Get all ratings for this page and specific extractor
-            feedback_result = await db.execute(
-                select(PDFFilePageFeedback).where(
-                    PDFFilePageFeedback.pdf_file_uuid == document_uuid,
-                    PDFFilePageFeedback.page_number == page_number,
-                    PDFFilePageFeedback.extraction_job_uuid == extraction_job_uuid,
-                    PDFFilePageFeedback.rating.isnot(None),
-                    PDFFilePageFeedback.deleted_at.is_(None),
-                )
+        logger.info("Getting page average rating: project_uuid={}, document_uuid={}, page_number={}, job_uuid={}, user_id={}", project_uuid, document_uuid, page_number, extraction_job_uuid, user.id)
+        # Verify document exists in project
+        doc_result = await db.execute(
+            _DOCUMENT_EXISTS_IN_PROJECT_STMT,
+            {"document_uuid": document_uuid, "project_uuid": project_uuid},
+        )
+        if doc_result.scalar() is None:
+            logger.warning("Document not found for average rating: document_uuid={}, project_uuid={}, user_id={}", document_uuid, project_uuid, user.id)
+            raise HTTPException(status_code=404, detail="Document not found")
+
+        # Get all ratings for this page and specific extractor
+        feedback_result = await db.execute(
+            select(PDFFilePageFeedback).where(
+                PDFFilePageFeedback.pdf_file_uuid == document_uuid,
+                PDFFilePageFeedback.page_number == page_number,
+                PDFFilePageFeedback.extraction_job_uuid == extraction_job_uuid,
+                PDFFilePageFeedback.rating.isnot(None),
+                PDFFilePageFeedback.deleted_at.is_(None),
             )
-            feedbacks = feedback_result.scalars().all()
-
-            if not feedbacks:
-                logger.info(f"No ratings found for page: document_uuid={document_uuid}, page_number={page_number}, job_uuid={extraction_job_uuid}")
-                return {"average_rating": None, "total_ratings": 0, "user_rating": None}
-
-            ratings = [f.rating for f in feedbacks]
-            average_rating = round(sum(ratings) / len(ratings), 2)
-
-            # Get current user's rating for this page and extractor
-            user_rating = None
-            for feedback in feedbacks:
-                if feedback.user_id == user.id:
-                    user_rating = feedback.rating
-                    break
-
-            return {
-                "average_rating": average_rating,
-                "total_ratings": len(ratings),
-                "user_rating": user_rating,
-            }
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error(f"Error getting page average rating: {str(e)}")
-            raise HTTPException(status_code=500, detail="Failed to get page average rating")
+        )
+        feedbacks = feedback_result.scalars().all()
+
+        if not feedbacks:
+            logger.info("No ratings found for page: document_uuid={}, page_number={}, job_uuid={}", document_uuid, page_number, extraction_job_uuid)
+            return {"average_rating": None, "total_ratings": 0, "user_rating": None}
+
+        ratings = [f.rating for f in feedbacks]
+        average_rating = round(sum(ratings) / len(ratings), 2)
+
+        # Get current user's rating for this page and extractor
+        user_rating = None
+        for feedback in feedbacks:
+            if feedback.user_id == user.id:
+                user_rating = feedback.rating
+                break
+
+        return {
+            "average_rating": average_rating,
+            "total_ratings": len(ratings),
+            "user_rating": user_rating,
+        }
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting page average rating: {str(e)}")
+        logger.error("Error getting page average rating: {}", str(e))
         raise HTTPException(status_code=500, detail="Failed to get page average rating")
 
 
@@ -1814,82 +1823,74 @@ async def get_annotations_list(
         HTTPException: 500 if error occurs.
     """
     try:
-        logger.info(f"Getting annotations list: project_uuid={project_uuid}, document_uuid={document_uuid}, extractor_uuid={extractor_uuid}, user_id={user_id}, page_number={page_number}, search={search}, user_id={current_user.id}")
-        try:
-            # Verify document exists in project
-            doc_result = await db.execute(
-                select(PDFFile).where(
-                    PDFFile.uuid == document_uuid,
-                    PDFFile.project_uuid == project_uuid,
-                    PDFFile.deleted_at.is_(None),
-                )
+        logger.info("Getting annotations list: project_uuid={}, document_uuid={}, extractor_uuid={}, user_id={}, page_number={}, search={}, user_id={}", project_uuid, document_uuid, extractor_uuid, user_id, page_number, search, current_user.id)
+        # Verify document exists in project
+        doc_result = await db.execute(
+            _DOCUMENT_EXISTS_IN_PROJECT_STMT,
+            {"document_uuid": document_uuid, "project_uuid": project_uuid},
+        )
+        if doc_result.scalar() is None:
+            logger.warning("Document not found for annotations list: document_uuid={}, project_uuid={}, user_id={}", document_uuid, project_uuid, current_user.id)
+            raise HTTPException(status_code=404, detail="Document not found")
+
+        # Build query with filters
+        # Select only the listed columns so rows skip ORM hydration and the identity map
+        query = (
+            select(
+                PDFFileAnnotation.uuid,
+                PDFFileAnnotation.page_number,
+                PDFFileExtractionJob.extractor,
+                PDFFileAnnotation.extraction_job_uuid,
+                PDFFileAnnotation.user_id,
+                func.coalesce(User.name, "Unknown User").label("user_name"),
+                func.coalesce(PDFFileAnnotation.text, "").label("text"),
+                func.coalesce(PDFFileAnnotation.comment, "").label("comment"),
+                PDFFileAnnotation.selection_start,
+                PDFFileAnnotation.selection_end,
+                PDFFileAnnotation.created_at,
             )
-            if not doc_result.scalar_one_or_none():
-                logger.warning(f"Document not found for annotations list: document_uuid={document_uuid}, project_uuid={project_uuid}, user_id={current_user.id}")
-                raise HTTPException(status_code=404, detail="Document not found")
-
-            # Build query with filters
-            query = (
-                select(PDFFileAnnotation, PDFFileExtractionJob)
-                .join(
-                    PDFFileExtractionJob,
-                    PDFFileAnnotation.extraction_job_uuid == PDFFileExtractionJob.uuid,
-                )
-                .where(
-                    PDFFileAnnotation.pdf_file_uuid == document_uuid,
-                    PDFFileAnnotation.deleted_at.is_(None),
-                    PDFFileExtractionJob.deleted_at.is_(None),
-                )
+            .join(
+                PDFFileExtractionJob,
+                PDFFileAnnotation.extraction_job_uuid == PDFFileExtractionJob.uuid,
             )
+            .outerjoin(User, User.id == PDFFileAnnotation.user_id)
+            .where(
+                PDFFileAnnotation.pdf_file_uuid == document_uuid,
+                PDFFileAnnotation.deleted_at.is_(None),
+                PDFFileExtractionJob.deleted_at.is_(None),
+            )
+        )
 
-            if extractor_uuid:
-                query = query.where(PDFFileAnnotation.extraction_job_uuid == extractor_uuid)
-            if user_id is not None:
-                query = query.where(PDFFileAnnotation.user_id == user_id)
-            if page_number is not None:
-                query = query.where(PDFFileAnnotation.page_number == page_number)
-            if search:
-                search_pattern = f"%{search}%"
-                query = query.where(
-                    or_(
-                        PDFFileAnnotation.text.ilike(search_pattern),
-                        PDFFileAnnotation.comment.ilike(search_pattern),
-                    )
+        if extractor_uuid:
+            query = query.where(PDFFileAnnotation.extraction_job_uuid == extractor_uuid)
+        if user_id is not None:
+            query = query.where(PDFFileAnnotation.user_id == user_id)
+        if page_number is not None:
+            query = query.where(PDFFileAnnotation.page_number == page_number)
+        if search:
+            # Served by the pg_trgm GIN indexes on text/comment; wildcards in input match literally
+            search_pattern = f"%{escape_like(search)}%"
+            query = query.where(
+                or_(
+                    PDFFileAnnotation.text.ilike(search_pattern, escape="\\"),
+                    PDFFileAnnotation.comment.ilike(search_pattern, escape="\\"),
                 )
-
-            query = query.order_by(
-                PDFFileAnnotation.page_number.asc(), PDFFileAnnotation.created_at.desc()
             )
 
-            result = await db.execute(query)
-            rows = result.all()
-            logger.info(f"Found {len(rows)} annotations: document_uuid={document_uuid}, filters=extractor_uuid={extractor_uuid}, user_id={user_id}, page_number={page_number}, search={search}")
-
-            return [
-                AnnotationListItem(
-                    uuid=str(annotation.uuid),
-                    page_number=int(annotation.page_number),
-                    extractor=job.extractor,
-                    extraction_job_uuid=str(annotation.extraction_job_uuid),
-                    user_id=annotation.user_id,
-                    user_name=annotation.user_name or "Unknown User",
-                    text=str(annotation.text or ""),
-                    comment=annotation.comment or "",
-                    selection_start=int(annotation.selection_start),
-                    selection_end=int(annotation.selection_end),
-                    created_at=to_utc_isoformat(annotation.created_at),
-                )
-                for annotation, job in rows
-            ]
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error(f"Error getting annotations list: {str(e)}")
-            raise HTTPException(status_code=500, detail="Failed to get annotations list")
+        query = query.order_by(
+            PDFFileAnnotation.page_number.asc(), PDFFileAnnotation.created_at.desc()
+        )
+
+        result = await db.execute(query)
+        rows = result.all()
+        logger.info("Found {} annotations: document_uuid={}, filters=extractor_uuid={}, user_id={}, page_number={}, search={}", len(rows), document_uuid, extractor_uuid, user_id, page_number, search)
+
+        # Row labels already match AnnotationListItem; datetimes are serialized by orjson
+        return UTCORJSONResponse(content=[dict(row._mapping) for row in rows])
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting annotations list: {str(e)}")
+        logger.error("Error getting annotations list: {}", str(e))
         raise HTTPException(status_code=500, detail="Failed to get annotations list")
 
 
@@ -1912,35 +1913,49 @@ async def download_document_file(
         user: Current authenticated user.
     
     Returns:
-        Response: PDF file content with appropriate Content-Type and Content-Disposition headers.
+        Response: PDF file content with appropriate Content-Type and Content-Disposition headers,
+                  or a 307 redirect to a pre-signed S3 URL for S3-backed files.
     
     Raises:
         HTTPException: 404 if document not found or file does not exist on server.
     """
     try:
-        logger.info(f"Downloading document file: project_uuid={project_uuid}, document_uuid={document_uuid}, user_id={user.id}")
+        logger.info("Downloading document file: project_uuid={}, document_uuid={}, user_id={}", project_uuid, document_uuid, user.id)
         # Allow any authenticated user to download within the same project context
         result = await db.execute(
-            select(PDFFile).where(
-                PDFFile.uuid == document_uuid,
-                PDFFile.project_uuid == project_uuid,
-                PDFFile.deleted_at.is_(None),
-            )
+            _DOCUMENT_FILE_IN_PROJECT_STMT,
+            {"document_uuid": document_uuid, "project_uuid": project_uuid},
         )
-        document = result.scalar_one_or_none()
-        if not document:
-            logger.warning(f"Document not found for download: document_uuid={document_uuid}, project_uuid={project_uuid}, user_id={user.id}")
+        document = result.one_or_none()
+        if document is None:
+            logger.warning("Document not found for download: document_uuid={}, project_uuid={}, user_id={}", document_uuid, project_uuid, user.id)
             raise HTTPException(status_code=404, detail="Document not found")
-        logger.info(f"Loading file for document {document_uuid}: filepath={document.filepath}, filename={document.filename}")
+        logger.info("Loading file for document {}: filepath={}, filename={}", document_uuid, document.filepath, document.filename)
         # Documents are PDF-only
         media_type = "application/pdf"
         # Conditional file serving based on storage type
         if document.filepath.startswith("projects/"):
             # File is stored in S3
             try:
-                logger.info(f"Attempting to load from S3: {document.filepath}")
-                # Download file from S3
                 session = aioboto3.Session()
+                if S3_PRESIGNED_DOWNLOADS:
+                    # Redirect the client straight to S3 so the API worker does not proxy the bytes
+                    async with session.client("s3", region_name=AWS_REGION) as s3:
+                        url = await s3.generate_presigned_url(
+                            "get_object",
+                            Params={
+                                "Bucket": AWS_BUCKET_NAME,
+                                "Key": document.filepath,
+                                "ResponseContentDisposition": safe_content_disposition(document.filename),
+                                "ResponseContentType": media_type,
+                            },
+                            ExpiresIn=S3_PRESIGNED_URL_EXPIRY_SECONDS,
+                        )
+                    logger.info("Redirecting to pre-signed S3 URL: filepath={}, expires_in={}", document.filepath, S3_PRESIGNED_URL_EXPIRY_SECONDS)
+                    return RedirectResponse(url, status_code=307)
+
+                logger.info("Attempting to load from S3: {}", document.filepath)
+                # Download file from S3
                 async with session.client("s3", region_name=AWS_REGION) as s3:
                     response = await s3.get_object(
                         Bucket=AWS_BUCKET_NAME,
@@ -1948,7 +1963,7 @@ async def download_document_file(
                     )
                     # Read the file content
                     file_content = await response["Body"].read()
-                    logger.info(f"Successfully loaded file from S3: {len(file_content)} bytes")
+                    logger.info("Successfully loaded file from S3: {} bytes", len(file_content))
                     return Response(
                         content=file_content,
                         media_type=media_type,
@@ -1958,7 +1973,7 @@ async def download_document_file(
                         },
                     )
             except Exception as e:
-                logger.error(f"Error downloading file from S3: {e}, filepath={document.filepath}")
+                logger.error("Error downloading file from S3: {}, filepath={}", e, document.filepath)
                 raise HTTPException(status_code=404, detail=f"File not found on server: {str(e)}")
         else:
             # File is stored locally
@@ -1969,13 +1984,13 @@ async def download_document_file(
                 else:
                     # If filepath is just the filename or doesn't have "uploads/" prefix
                     local_file_path = UPLOADS_DIR / document.filepath
-                logger.info(f"Attempting to load local file: {local_file_path}, exists={os.path.exists(local_file_path)}")
+                logger.info("Attempting to load local file: {}, exists={}", local_file_path, os.path.exists(local_file_path))
                 if not os.path.exists(local_file_path):
-                    logger.error(f"Local file not found: {local_file_path}, filepath from DB: {document.filepath}")
+                    logger.error("Local file not found: {}, filepath from DB: {}", local_file_path, document.filepath)
                     raise HTTPException(status_code=404, detail=f"File not found at {local_file_path}")
                 with open(local_file_path, "rb") as f:
                     content = f.read()
-                logger.info(f"Successfully loaded local file: {len(content)} bytes")
+                logger.info("Successfully loaded local file: {} bytes", len(content))
                 return Response(
                     content=content,
                     media_type=media_type,
@@ -1988,12 +2003,12 @@ async def download_document_file(
                 # Re-raise HTTP exceptions (404s) as-is
                 raise
             except Exception as e:
-                logger.error(f"Error reading local file: {e}, filepath={document.filepath}, local_path={local_file_path}")
+                logger.error("Error reading local file: {}, filepath={}, local_path={}", e, document.filepath, local_file_path)
                 raise HTTPException(status_code=404, detail=f"File not found on server: {str(e)}")
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error downloading document file: {str(e)}")
+        logger.error("Error downloading document file: {}", str(e))
         raise HTTPException(status_code=500, detail="Failed to download document file")
 
 
@@ -2064,17 +2079,19 @@ async def create_annotation(
         await db.commit()
         await db.refresh(anno)
         logger.info(f"Created annotation: annotation_uuid={anno_uuid}, document_id={payload.documentId}, page_number={payload.pageNumber}, user_id={user.id}")
-        return AnnotationResponse(
-            uuid=str(anno.uuid),
-            document_uuid=str(anno.pdf_file_uuid),
-            extraction_job_uuid=str(anno.extraction_job_uuid),
-            page_number=int(anno.page_number),
-            text=str(anno.text),
-            comment=str(anno.comment),
-            selection_start=int(anno.selection_start),
-            selection_end=int(anno.selection_end),
+        # Values come straight from the row just written, so skip re-validation
+        return AnnotationResponse.model_construct(
+            uuid=anno.uuid,
+            document_uuid=anno.pdf_file_uuid,
+            extraction_job_uuid=anno.extraction_job_uuid,
+            page_number=anno.page_number,
+            text=anno.text,
+            comment=anno.comment,
+            selection_start=anno.selection_start,
+            selection_end=anno.selection_end,
             user_id=anno.user_id,
-            user_name=anno.user_name,
+            # The annotator is the current user; avoids lazy-loading the relationship
+            user_name=user.name,
             created_at=to_utc_isoformat(anno.created_at),
         )
     except HTTPException:
@@ -2085,21 +2102,33 @@ async def create_annotation(
         raise HTTPException(status_code=500, detail="Failed to create annotation")
 
 
-@router.get("/annotations", response_model=List[AnnotationResponse])
+@router.get(
+    "/annotations",
+    response_model=Union[List[AnnotationResponse], AnnotationPage],
+    response_class=UTCORJSONResponse,
+)
 async def list_annotations(
     documentId: str,
+    request: Request,
     extractionJobUuid: str | None = None,
     pageNumber: int | None = None,
+    limit: int | None = Query(None, ge=1, le=1000),
+    after: str | None = None,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
     """
     List annotations for a document, optionally filtered by extraction job and/or page number.
+    Pagination is opt-in: without `limit`/`after` every annotation is returned as a plain list;
+    with either, results are keyset-paginated on (created_at, uuid) and wrapped in an AnnotationPage.
     
     Args:
         documentId: UUID of the document.
+        request: Incoming request (read for If-None-Match).
         extractionJobUuid: Optional UUID of extraction job to filter by.
         pageNumber: Optional page number to filter by.
+        limit: Optional page size (max 1000); defaults to 200 when only `after` is given.
+        after: Optional cursor from a previous page's next_cursor.
         db: Database session.
         user: Current authenticated user.
     
@@ -2107,55 +2136,102 @@ async def list_annotations(
         List[AnnotationResponse]: List of annotations ordered by creation date (oldest first), each containing
                                   UUID, document UUID, extraction job UUID, page number, text, comment,
                                   selection positions (if available), user information, and creation timestamp.
+        AnnotationPage: When paginating, {items, next_cursor}; next_cursor is null on the last page.
+        Responses carry an ETag and Last-Modified derived from the annotation count and latest
+        created/deleted timestamps; a matching If-None-Match returns 304 Not Modified before
+        any annotation rows are loaded.
     
     Raises:
+        HTTPException: 400 if the cursor is invalid.
         HTTPException: 404 if document not found.
         HTTPException: 500 if error occurs.
     """
     try:
-        logger.info(f"Listing annotations: documentId={documentId}, extractionJobUuid={extractionJobUuid}, pageNumber={pageNumber}, user_id={user.id}")
-        # Ensure document exists
-        doc_result = await db.execute(
-            select(PDFFile).where(
-                PDFFile.uuid == documentId, PDFFile.deleted_at.is_(None)
-            )
+        logger.info("Listing annotations: documentId={}, extractionJobUuid={}, pageNumber={}, limit={}, after={}, user_id={}", documentId, extractionJobUuid, pageNumber, limit, after, user.id)
+        # Cheap validator: one aggregate over the document's annotations (live and soft-deleted,
+        # so inserts and deletes both move it) plus the document liveness check
+        filters = [PDFFileAnnotation.pdf_file_uuid == documentId]
+        if extractionJobUuid:
+            filters.append(PDFFileAnnotation.extraction_job_uuid == extractionJobUuid)
+        if pageNumber is not None:
+            filters.append(PDFFileAnnotation.page_number == pageNumber)
+        state_result = await db.execute(
+            select(
+                exists().where(PDFFile.uuid == documentId, PDFFile.deleted_at.is_(None)).label("document_live"),
+                func.count(PDFFileAnnotation.uuid).filter(PDFFileAnnotation.deleted_at.is_(None)).label("live_count"),
+                func.max(PDFFileAnnotation.created_at).label("last_created"),
+                func.max(PDFFileAnnotation.deleted_at).label("last_deleted"),
+            ).where(*filters)
         )
-        if not doc_result.scalar_one_or_none():
-            logger.warning(f"Document not found for annotation listing: documentId={documentId}, user_id={user.id}")
+        state = state_result.one()
+        if not state.document_live:
+            logger.warning("Document not found for annotation listing: documentId={}, user_id={}", documentId, user.id)
             raise HTTPException(status_code=404, detail="Document not found")
-
-        query = select(PDFFileAnnotation).where(
-            PDFFileAnnotation.pdf_file_uuid == documentId, PDFFileAnnotation.deleted_at.is_(None)
+        # Weak validator: user names are joined in but not tracked by the aggregate
+        validator = f"{documentId}:{extractionJobUuid}:{pageNumber}:{limit}:{after}:{state.live_count}:{state.last_created}:{state.last_deleted}"
+        etag = 'W/"{}"'.format(hashlib.sha1(validator.encode()).hexdigest())
+        headers = {"ETag": etag}
+        last_modified = max((ts for ts in (state.last_created, state.last_deleted) if ts is not None), default=None)
+        if last_modified is not None:
+            if last_modified.tzinfo is None:
+                last_modified = last_modified.replace(tzinfo=timezone.utc)
+            headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and (
+            if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))
+        ):
+            logger.info("Annotations not modified: documentId={}, etag={}", documentId, etag)
+            return Response(status_code=304, headers=headers)
+
+        # Core select of the response columns only; skips ORM hydration and per-row lazy user loads
+        query = (
+            select(
+                PDFFileAnnotation.uuid,
+                PDFFileAnnotation.pdf_file_uuid.label("document_uuid"),
+                PDFFileAnnotation.extraction_job_uuid,
+                PDFFileAnnotation.page_number,
+                PDFFileAnnotation.text,
+                PDFFileAnnotation.comment,
+                PDFFileAnnotation.selection_start,
+                PDFFileAnnotation.selection_end,
+                PDFFileAnnotation.user_id,
+                User.name.label("user_name"),
+                PDFFileAnnotation.created_at,
+            )
+            .outerjoin(User, User.id == PDFFileAnnotation.user_id)
+            .where(*filters, PDFFileAnnotation.deleted_at.is_(None))
         )
-        if extractionJobUuid:
-            query = query.where(PDFFileAnnotation.extraction_job_uuid == extractionJobUuid)
-        if pageNumber is not None:
-            query = query.where(PDFFileAnnotation.page_number == pageNumber)
-        query = query.order_by(PDFFileAnnotation.created_at.asc())
+        if after:
+            try:
+                after_created_at, after_uuid = decode_keyset_cursor(after)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            query = query.where(
+                tuple_(PDFFileAnnotation.created_at, PDFFileAnnotation.uuid)
+                > tuple_(after_created_at, after_uuid)
+            )
+        query = query.order_by(PDFFileAnnotation.created_at.asc(), PDFFileAnnotation.uuid.asc())
+        paginate = limit is not None or after is not None
+        if paginate:
+            limit = limit or DEFAULT_ANNOTATION_PAGE_SIZE
+            # Fetch one extra row to learn whether another page exists
+            query = query.limit(limit + 1)
 
         result = await db.execute(query)
-        annos = result.scalars().all()
-        logger.info(f"Found {len(annos)} annotations: documentId={documentId}, extractionJobUuid={extractionJobUuid}, pageNumber={pageNumber}")
-        return [
-            AnnotationResponse(
-                uuid=str(a.uuid),
-                document_uuid=str(a.pdf_file_uuid),
-                extraction_job_uuid=str(a.extraction_job_uuid),
-                page_number=int(a.page_number),
-                text=str(a.text),
-                comment=str(a.comment),
-                selection_start=int(a.selection_start),
-                selection_end=int(a.selection_end),
-                user_id=a.user_id,
-                user_name=a.user_name,
-                created_at=to_utc_isoformat(a.created_at),
-            )
-            for a in annos
-        ]
+        annos = result.all()
+        next_cursor = None
+        if paginate and len(annos) > limit:
+            annos = annos[:limit]
+            next_cursor = encode_keyset_cursor(annos[-1].created_at, annos[-1].uuid)
+        logger.info("Found {} annotations: documentId={}, extractionJobUuid={}, pageNumber={}", len(annos), documentId, extractionJobUuid, pageNumber)
+        # Row labels already match AnnotationResponse; orjson serializes the rows (and datetimes) directly
+        items = [dict(a._mapping) for a in annos]
+        content = {"items": items, "next_cursor": next_cursor} if paginate else items
+        return UTCORJSONResponse(content=content, headers=headers)
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error listing annotations: {e}")
+        logger.error("Error listing annotations: {}", e)
         raise HTTPException(status_code=500, detail="Failed to list annotations")
 
 
@@ -2182,23 +2258,19 @@ async def delete_annotation(
     """
     logger.info(f"Deleting annotation: annotation_uuid={annotation_uuid}, user_id={user.id}")
     try:
-        # Find annotation excluding already deleted ones
+        # Soft delete in one atomic statement; no row returned means missing or already deleted
         result = await db.execute(
-            select(PDFFileAnnotation).where(
+            update(PDFFileAnnotation)
+            .where(
                 PDFFileAnnotation.uuid == annotation_uuid, PDFFileAnnotation.deleted_at.is_(None)
             )
+            .values(deleted_at=func.now())
+            .returning(PDFFileAnnotation.pdf_file_uuid, PDFFileAnnotation.page_number)
         )
-        anno = result.scalar_one_or_none()
-        if not anno:
+        anno = result.first()
+        if anno is None:
             logger.warning(f"Annotation not found for deletion: annotation_uuid={annotation_uuid}, user_id={user.id}")
             raise HTTPException(status_code=404, detail="Annotation not found")
-
-        # Soft delete the annotation
-        await db.execute(
-            update(PDFFileAnnotation)
-            .where(PDFFileAnnotation.uuid == annotation_uuid)
-            .values(deleted_at=datetime.now(timezone.utc))
-        )
         await db.commit()
         logger.info(f"Successfully deleted annotation: annotation_uuid={annotation_uuid}, document_uuid={anno.pdf_file_uuid}, page_number={anno.page_number}, user_id={user.id}")
         return {"message": "Annotation deleted successfully"}
@@ -2235,50 +2307,32 @@ async def retry_extraction_job(
         dict: Success message with job UUID and status.
     
     Raises:
-        HTTPException: 404 if project, document, or extraction job not found.
+        HTTPException: 404 if the project (owned by the user), document, or extraction job is not found.
         HTTPException: 400 if job status is not failed.
         HTTPException: 500 if retry fails.
     """
     logger.info(f"Retrying extraction job: project_uuid={project_uuid}, document_uuid={document_uuid}, job_uuid={job_uuid}, user_id={current_user.id}")
     try:
-        # Verify project ownership, excluding deleted projects
-        project_result = await db.execute(
-            select(PDFProject).where(
+        # Resolve project ownership, document and job in a single round-trip
+        retry_result = await db.execute(
+            select(PDFFile.filepath, PDFFileExtractionJob)
+            .join(PDFProject, PDFProject.uuid == PDFFile.project_uuid)
+            .join(PDFFileExtractionJob, PDFFileExtractionJob.pdf_file_uuid == PDFFile.uuid)
+            .where(
                 PDFProject.uuid == project_uuid,
                 PDFProject.user_id == current_user.id,
                 PDFProject.deleted_at.is_(None),
-            )
-        )
-        project = project_result.scalar_one_or_none()
-        if not project:
-            logger.warning(f"Project not found for retry: project_uuid={project_uuid}, user_id={current_user.id}")
-            raise HTTPException(status_code=404, detail="Project not found")
-
-        # Verify document ownership
-        doc_result = await db.execute(
-            select(PDFFile).where(
                 PDFFile.uuid == document_uuid,
-                PDFFile.project_uuid == project_uuid,
                 PDFFile.deleted_at.is_(None),
-            )
-        )
-        document = doc_result.scalar_one_or_none()
-        if not document:
-            logger.warning(f"Document not found for retry: document_uuid={document_uuid}, project_uuid={project_uuid}, user_id={current_user.id}")
-            raise HTTPException(status_code=404, detail="Document not found")
-
-        # Get the extraction job
-        job_result = await db.execute(
-            select(PDFFileExtractionJob).where(
                 PDFFileExtractionJob.uuid == job_uuid,
-                PDFFileExtractionJob.pdf_file_uuid == document_uuid,
                 PDFFileExtractionJob.deleted_at.is_(None),
             )
         )
-        job = job_result.scalar_one_or_none()
-        if not job:
-            logger.warning(f"Extraction job not found for retry: job_uuid={job_uuid}, document_uuid={document_uuid}, user_id={current_user.id}")
+        row = retry_result.one_or_none()
+        if row is None:
+            logger.warning(f"Extraction job not found for retry: project_uuid={project_uuid}, document_uuid={document_uuid}, job_uuid={job_uuid}, user_id={current_user.id}")
             raise HTTPException(status_code=404, detail="Extraction job not found")
+        document_filepath, job = row
 
         # Only allow retry for failed jobs
         if job.status not in [ExtractionStatus.FAILURE, "Failed"]:
@@ -2287,33 +2341,59 @@ async def retry_extraction_job(
                 status_code=400, detail=f"Cannot retry job with status: {job.status}"
             )
 
-        # Reset job status and clear previous results
-        job.status = ExtractionStatus.NOT_STARTED
-        job.start_time = None
-        job.end_time = None
-        job.latency_ms = None
-        job.cost = None
+        # Reset job status and clear previous results; sent together with the page-content
+        # soft delete below and committed once
+        await db.execute(
+            update(PDFFileExtractionJob)
+            .where(PDFFileExtractionJob.uuid == job_uuid)
+            .values(
+                status=ExtractionStatus.NOT_STARTED,
+                start_time=None,
+                end_time=None,
+                latency_ms=None,
+                cost=None,
+            )
+        )
 
         # Soft delete existing page content for this job
         await db.execute(
             update(PDFFilePageContent)
-            .where(PDFFilePageContent.extraction_job_uuid == job_uuid)
-            .values(deleted_at=datetime.now(timezone.utc))
+            .where(
+                PDFFilePageContent.extraction_job_uuid == job_uuid,
+                PDFFilePageContent.deleted_at.is_(None),
+            )
+            .values(deleted_at=func.now())
+        )
+
+        # Outbox row in the same transaction; the beat task re-dispatches it if enqueueing below fails
+        outbox_uuid = str(uuid.uuid4())
+        await db.execute(
+            insert(PDFFileExtractionRetryOutbox).values(
+                uuid=outbox_uuid,
+                extraction_job_uuid=job_uuid,
+            )
         )
 
         await db.commit()
         logger.info(f"Reset job status for retry: job_uuid={job_uuid}, extractor={job.extractor}")
 
-        # Queue the retry task
+        # Queue the retry task (task_id pinned to the job so re-dispatches share one id)
         try:
-            process_document_with_extractor.delay(
-                job_uuid, document_uuid, document.filepath, job.extractor
+            process_document_with_extractor.apply_async(
+                args=[job_uuid, document_uuid, document_filepath, job.extractor],
+                task_id=job_uuid,
+                queue=get_extraction_queue(job.extractor),
             )
+            await db.execute(
+                update(PDFFileExtractionRetryOutbox)
+                .where(PDFFileExtractionRetryOutbox.uuid == outbox_uuid)
+                .values(enqueued_at=func.now())
+            )
+            await db.commit()
             logger.info(f"Successfully queued retry task: job_uuid={job_uuid}, document_uuid={document_uuid}, extractor={job.extractor}")
         except Exception as task_err:
-            logger.error(f"Failed to queue retry task: job_uuid={job_uuid}, error={str(task_err)}")
-            # Still return success since the job status was reset
-            # The job can be manually retried later
+            logger.error(f"Failed to queue retry task, leaving it to the outbox poller: job_uuid={job_uuid}, error={str(task_err)}")
+            # Still return success since the job status was reset and the outbox row is pending
 
         return {
             "message": "Extraction job retry initiated",
@@ -2,8 +2,11 @@
 Shared utility functions for routes
 """
 from datetime import datetime, timezone
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 from io import BytesIO
+import base64
 import os
 import tempfile
 from urllib.parse import quote
@@ -20,6 +23,8 @@ try:
 except ImportError:
     HAS_PIL = False
 
+import orjson
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 from src.factory.audio import get_audio_reader
 from src.factory.image import get_image_reader
@@ -27,6 +32,9 @@ from src.factory.pdf import get_reader, READER_MAP
 from src.models import PDFExtractorType, AudioExtractorType, ImageExtractorType, ExtractorInfo
 
 
+_UTC = timezone.utc
+
+
 def to_utc_isoformat(dt: datetime) -> str:
     """
     Convert a datetime to ISO format string with UTC timezone.
@@ -35,13 +43,29 @@ def to_utc_isoformat(dt: datetime) -> str:
     """
     if dt is None:
         return None
+    tz = dt.tzinfo
+    # Fast path: already UTC-aware (the common case for TIMESTAMPTZ columns)
+    if tz is _UTC:
+        return dt.isoformat()
     # If datetime is naive (no timezone info), assume it's UTC
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
+    if tz is None:
+        return dt.replace(tzinfo=_UTC).isoformat()
     # Convert to UTC if it's in a different timezone
-    elif dt.tzinfo != timezone.utc:
-        dt = dt.astimezone(timezone.utc)
-    return dt.isoformat()
+    return dt.astimezone(_UTC).isoformat()
+
+
+class UTCORJSONResponse(ORJSONResponse):
+    """
+    ORJSONResponse that serializes datetimes natively as UTC ISO strings.
+    Naive datetimes are assumed to be UTC and the offset is written as "+00:00", so the
+    output matches to_utc_isoformat() used by the other endpoints.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS,
+        )
 
 
 def get_image_dimensions(content: bytes) -> tuple[Optional[int], Optional[int]]:
@@ -53,16 +77,43 @@ def get_image_dimensions(content: bytes) -> tuple[Optional[int], Optional[int]]:
         return (None, None)
     
     try:
-        image = PILImage.open(BytesIO(content))
-        return (image.width, image.height)
+        # Image.open only parses the header; the context manager releases the file/decoder right away
+        with PILImage.open(BytesIO(content)) as image:
+            return (image.width, image.height)
     except Exception as e:
         logger.warning(f"Failed to extract image dimensions: {e}")
         return (None, None)
 
 
+@lru_cache(maxsize=256)
+def get_extractor_information(extractor_type: str, extractor_category: str = "document") -> Mapping[str, Any]:
+    """
+    Get an extractor's get_information() metadata (name, description, supports, ...).
+    Cached per (extractor_type, extractor_category) since the metadata is static, so readers
+    (and their API clients) are only instantiated on the first lookup. The cached mapping is
+    shared by every caller, so it is returned read-only.
+
+    Args:
+        extractor_type: The extractor ID (e.g., "gpt-5", "gpt-5-mini", "assemblyai")
+        extractor_category: One of "document", "image", "audio"
+
+    Raises:
+        ValueError: If the extractor type is unknown for the category.
+    """
+    if extractor_category == "image":
+        extractor_instance = get_image_reader(extractor_type)
+    elif extractor_category == "audio":
+        extractor_instance = get_audio_reader(extractor_type)
+    else:  # document
+        extractor_instance = get_reader(extractor_type)
+    return MappingProxyType(dict(extractor_instance.get_information()))
+
+
 def get_extractor_display_name(extractor_type: str, extractor_category: str = "document") -> str:
     """
-    Get the display name for an extractor by looking up its get_information() method.
+    Get the display name for an extractor from its get_information() metadata.
+    The metadata lookup is cached by get_extractor_information(); the fallback below is not,
+    so a failed lookup is retried on the next call.
     
     Args:
         extractor_type: The extractor ID (e.g., "gpt-5", "gpt-5-mini", "assemblyai")
@@ -72,27 +123,24 @@ def get_extractor_display_name(extractor_type: str, extractor_category: str = "d
         The formatted display name from the extractor's get_information() method,
         or the extractor_type if lookup fails.
     """
+    if extractor_category not in ("image", "audio") and extractor_type not in READER_MAP:
+        return extractor_type
     try:
-        if extractor_category == "image":
-            # get_image_reader already returns an instance
-            extractor_instance = get_image_reader(extractor_type)
-        elif extractor_category == "audio":
-            # get_audio_reader already returns an instance
-            extractor_instance = get_audio_reader(extractor_type)
-        else:  # document
-            if extractor_type not in READER_MAP:
-                return extractor_type
-            reader_factory = READER_MAP[extractor_type]
-            # Handle both class instances and callable factories (lambdas)
-            extractor_instance = reader_factory() if callable(reader_factory) else reader_factory
-        
-        info = extractor_instance.get_information()
-        return info.get("name", extractor_type)
+        return get_extractor_information(extractor_type, extractor_category).get("name", extractor_type)
     except Exception as e:
         logger.warning(f"Failed to get display name for extractor {extractor_type} ({extractor_category}): {e}")
         return extractor_type
 
 
+def _mutagen_duration(audio) -> Optional[float]:
+    """Return the positive duration reported by a mutagen file object, or None."""
+    if audio and hasattr(audio, 'info') and audio.info:
+        duration = getattr(audio.info, 'length', None)
+        if duration and duration > 0:
+            return float(duration)
+    return None
+
+
 def get_audio_duration(content: bytes, filename: str) -> Optional[float]:
     """
     Extract audio duration in seconds from file content.
@@ -101,22 +149,25 @@ def get_audio_duration(content: bytes, filename: str) -> Optional[float]:
     if not HAS_MUTAGEN:
         return None
     
+    # Fast path: parse in memory (name lets mutagen sniff by extension)
+    try:
+        buffer = BytesIO(content)
+        buffer.name = filename
+        duration = _mutagen_duration(MutagenFile(buffer))
+        if duration is not None:
+            return duration
+    except Exception as e:
+        logger.debug(f"In-memory duration parse failed for {filename}, falling back to temp file: {e}")
+    
+    # Fallback for formats mutagen can only read from a real file path
     temp_path = None
     try:
-        # Write content to temp file (mutagen needs a file path)
         suffix = os.path.splitext(filename)[1] or '.mp3'
         with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as f:
             f.write(content)
             temp_path = f.name
         
-        # Extract duration using mutagen
-        audio = MutagenFile(temp_path)
-        if audio and hasattr(audio, 'info') and audio.info:
-            duration = getattr(audio.info, 'length', None)
-            if duration and duration > 0:
-                return float(duration)
-        
-        return None
+        return _mutagen_duration(MutagenFile(temp_path))
     except Exception as e:
         logger.debug(f"Could not extract duration from {filename}: {e}")
         return None
@@ -129,22 +180,49 @@ def get_audio_duration(content: bytes, filename: str) -> Optional[float]:
                 pass
 
 
+def encode_keyset_cursor(created_at: datetime, row_uuid: str) -> str:
+    """
+    Encode a (created_at, uuid) keyset position as an opaque, URL-safe cursor string.
+    """
+    raw = f"{to_utc_isoformat(created_at)}|{row_uuid}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_keyset_cursor(cursor: str) -> tuple[datetime, str]:
+    """
+    Decode a cursor produced by encode_keyset_cursor().
+    Raises ValueError if the cursor is malformed.
+    """
+    try:
+        created_at, row_uuid = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").split("|", 1)
+        return datetime.fromisoformat(created_at), row_uuid
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def escape_like(value: str, escape_char: str = "\\") -> str:
+    """
+    Escape LIKE/ILIKE wildcards in user input so '%' and '_' match literally.
+    Use together with `.ilike(pattern, escape=escape_char)`.
+    """
+    return (
+        value.replace(escape_char, escape_char * 2)
+        .replace("%", f"{escape_char}%")
+        .replace("_", f"{escape_char}_")
+    )
+
+
+@lru_cache(maxsize=1024)
 def safe_content_disposition(filename: str) -> str:
     """
     Create a safe Content-Disposition header value that handles Unicode filenames.
-    Uses RFC 5987 encoding for Unicode characters.
+    Uses RFC 5987 encoding for Unicode characters. Cached, since filenames repeat across downloads.
     """
-    try:
-        # Try to encode as ASCII for simple filenames
-        filename.encode('ascii')
-        # If successful, use simple format
+    if filename.isascii():
+        # Simple filenames can use the plain format
         return f'inline; filename="{filename}"'
-    except UnicodeEncodeError:
-        # Filename contains non-ASCII characters, use RFC 5987 encoding
-        # Format: filename="fallback"; filename*=UTF-8''encoded
-        ascii_fallback = filename.encode('ascii', errors='ignore').decode('ascii')
-        if not ascii_fallback:
-            ascii_fallback = "file"
-        utf8_filename = quote(filename, safe='')
-        return f'inline; filename="{ascii_fallback}"; filename*=UTF-8\'\'{utf8_filename}'
-
+    # Filename contains non-ASCII characters, use RFC 5987 encoding
+    # Format: filename="fallback"; filename*=UTF-8''encoded
+    ascii_fallback = filename.encode('ascii', errors='ignore').decode('ascii') or "file"
+    utf8_filename = quote(filename, safe='')
+    return f'inline; filename="{ascii_fallback}"; filename*=UTF-8\'\'{utf8_filename}'
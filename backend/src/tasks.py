@@ -1,24 +1,49 @@
 import os
+import threading
 import time
 import uuid
+import orjson
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from celery import Celery
-from sqlalchemy import create_engine, update
-from sqlalchemy.orm import sessionmaker
+from celery.exceptions import Retry
+from celery.signals import worker_process_shutdown
+from celery.utils.time import get_exponential_backoff_interval
+from sqlalchemy import create_engine, insert, update, select, func, bindparam, values, column
+from sqlalchemy import String, Integer, Float, DateTime
+from sqlalchemy.orm import scoped_session, sessionmaker
 from loguru import logger
 from contextlib import contextmanager
-from datetime import datetime, timezone
+from dataclasses import asdict
+from datetime import datetime, timezone, timedelta
 from src.constants import (
     EXTRACTOR_RETRY_CONFIG,
     DEFAULT_RETRY_CONFIG,
     REDIS_BROKER_URL,
     REDIS_BACKEND_URL,
-    DATABASE_URL,
+    TASKS_DATABASE_URL,
+    TASKS_DB_POOL_SIZE,
+    TASKS_DB_MAX_OVERFLOW,
+    DB_STATEMENT_CACHE_SIZE,
     CIRCUIT_BREAKER_THRESHOLD,
+    CIRCUIT_BREAKER_TIMEOUT,
+    RETRY_BACKOFF_MAX_SECONDS,
     LANGFUSE_PUBLIC_KEY,
     LANGFUSE_SECRET_KEY,
     LANGFUSE_HOST,
+    RETRY_OUTBOX_VISIBILITY_TIMEOUT_SECONDS,
+    RETRY_OUTBOX_POLL_INTERVAL_SECONDS,
+    EXTRACTION_POLL_INITIAL_INTERVAL_SECONDS,
+    EXTRACTION_POLL_MAX_INTERVAL_SECONDS,
+    EXTRACTION_POLL_TIMEOUT_SECONDS,
+    STALE_JOB_TIMEOUT_SECONDS,
+    STALE_JOB_REAP_INTERVAL_SECONDS,
+    FAST_EXTRACTION_QUEUE,
+    SLOW_EXTRACTION_QUEUE,
+    VENDOR_EXTRACTION_QUEUES,
+    IO_BOUND_EXTRACTORS,
 )
-from src.cost_calculator import cost_calculator
+from src.cost_calculator import cost_calculator, CostMetrics
 from src.file_coordinator import (
     download_to_shared_volume,
     mark_task_complete,
@@ -26,11 +51,13 @@ from src.file_coordinator import (
     redis_client,
 )
 from sqlalchemy.exc import DatabaseError, OperationalError, PendingRollbackError
-from psycopg2 import DatabaseError as Psycopg2DatabaseError
+from psycopg import DatabaseError as PsycopgDatabaseError
+from psycopg.types.json import Json
 from src.factory.pdf import get_reader
 from src.factory.audio import get_audio_reader
+from src.extractor.audio.utils import round_confidence
 from src.factory.image import get_image_reader
-from src.models.database import PDFFile, PDFFileExtractionJob, PDFFilePageContent, AudioFile, AudioFileExtractionJob, AudioFileContent, ImageFile, ImageFileExtractionJob, ImageContent
+from src.models.database import PDFFile, PDFFileExtractionJob, PDFFilePageContent, PDFFileExtractionRetryOutbox, AudioFile, AudioFileExtractionJob, AudioFileContent, ImageFile, ImageFileExtractionJob, ImageContent
 from src.models import AudioExtractionJob, AudioSegmentContent, Audio, ImageExtractionJob, Image  # Use aliases for backward compatibility
 from src.models.enums import ExtractionStatus
 
@@ -40,25 +67,59 @@ celery_app.config_from_object(
     {
         "broker_url": REDIS_BROKER_URL,
         "result_backend": REDIS_BACKEND_URL,
-        "task_serializer": "json",
-        "accept_content": ["json"],
-        "result_serializer": "json",
+        # msgpack is smaller and faster to (de)serialize; json stays accepted so messages
+        # queued by an older deployment still run
+        "task_serializer": "msgpack",
+        "accept_content": ["msgpack", "json"],
+        "result_serializer": "msgpack",
         "timezone": "UTC",
         "enable_utc": True,
+        # Acknowledge only after the task finishes so a crashed/killed worker's task is redelivered
+        "task_acks_late": True,
+        "task_reject_on_worker_lost": True,
+        # Extraction tasks can run for minutes; reserve one at a time so idle workers can pick up queued work
+        "worker_prefetch_multiplier": 1,
+        "beat_schedule": {
+            "redispatch-pending-extraction-retries": {
+                "task": "src.tasks.redispatch_pending_extraction_retries",
+                "schedule": RETRY_OUTBOX_POLL_INTERVAL_SECONDS,
+            },
+            "fail-stale-processing-jobs": {
+                "task": "src.tasks.fail_stale_processing_jobs",
+                "schedule": STALE_JOB_REAP_INTERVAL_SECONDS,
+            },
+        },
     }
 )
 
-# Create synchronous database engine for Celery tasks
+def _json_dumps(obj) -> str:
+    """
+    Serializer for JSON column values written by the tasks. Extraction results can be
+    large OCR/markdown payloads, and orjson encodes them several times faster than json.
+    """
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Create synchronous database engine for Celery tasks (psycopg 3: cooperates with gevent's
+# monkey-patching and prepares statements server side once they repeat)
 engine = create_engine(
-    DATABASE_URL,
-    pool_size=10,
-    max_overflow=20,
+    TASKS_DATABASE_URL,
+    pool_size=TASKS_DB_POOL_SIZE,
+    max_overflow=TASKS_DB_MAX_OVERFLOW,
     pool_pre_ping=True,
-    pool_recycle=3600,
+    # Recycle before typical load balancer / managed Postgres idle cutoffs drop the socket
+    pool_recycle=1800,
     pool_timeout=30,
+    query_cache_size=1200,
+    # Prepare a statement on its second execution on a connection (psycopg default waits for
+    # the sixth); disabled along with asyncpg's cache when running behind pgbouncer
+    connect_args={"prepare_threshold": 1 if DB_STATEMENT_CACHE_SIZE else None},
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
     echo=False,
 )
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# One session per worker thread (or greenlet, under the gevent pool); removed after each task
+SessionLocal = scoped_session(sessionmaker(autocommit=False, autoflush=False, bind=engine))
 
 
 def get_db_session():
@@ -86,38 +147,162 @@ def get_db_session_context():
             logger.debug("Database session closed successfully")
         except Exception as e:
             logger.warning(f"Error closing database session: {e}")
+        # Drop the thread-local session so the next task starts from a clean identity map
+        SessionLocal.remove()
         # DO NOT dispose engine here - it's shared across all tasks
 
 
+def uuid7_str() -> str:
+    """
+    Time-ordered UUIDv7 (RFC 9562) as a string. Content rows are inserted in bulk, and
+    monotonic keys append to the right edge of the primary key B-tree instead of landing
+    on random pages like uuid4.
+    """
+    unix_ts_ms = time.time_ns() // 1_000_000
+    value = (unix_ts_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return str(uuid.UUID(int=value))
+
+
+def _job_start_stmt(job_model):
+    """
+    PROCESSING update for a job that is neither running nor finished; a redelivered or
+    re-dispatched task that finds the job already claimed (or done) skips it. Claims whose
+    worker died are released by fail_stale_processing_jobs.
+    """
+    return (
+        update(job_model)
+        .where(
+            job_model.uuid == bindparam("job_uuid"),
+            job_model.status.notin_([ExtractionStatus.PROCESSING, ExtractionStatus.SUCCESS]),
+        )
+        .values(status=ExtractionStatus.PROCESSING, start_time=bindparam("job_start_time"))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _job_finish_stmt(job_model):
+    """Terminal SUCCESS / FAILURE update for a job"""
+    return (
+        update(job_model)
+        .where(job_model.uuid == bindparam("job_uuid"))
+        .values(
+            status=bindparam("job_status"),
+            end_time=bindparam("job_end_time"),
+            latency_ms=bindparam("job_latency_ms"),
+            cost=bindparam("job_cost"),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+# Job status statements are built once and executed with per-call parameters
+_PDF_JOB_START_STMT = _job_start_stmt(PDFFileExtractionJob)
+_PDF_JOB_FINISH_STMT = _job_finish_stmt(PDFFileExtractionJob)
+_AUDIO_JOB_START_STMT = _job_start_stmt(AudioExtractionJob)
+_AUDIO_JOB_FINISH_STMT = _job_finish_stmt(AudioExtractionJob)
+_IMAGE_JOB_START_STMT = _job_start_stmt(ImageExtractionJob)
+_IMAGE_JOB_FINISH_STMT = _job_finish_stmt(ImageExtractionJob)
+
+
+def _image_success_stmt():
+    """
+    Insert the image's content row and mark its job finished in one statement:
+    WITH inserted AS (INSERT INTO image_content ... RETURNING extraction_job_uuid)
+    UPDATE image_file_extraction_jobs ... WHERE uuid = (SELECT ... FROM inserted)
+    """
+    inserted = (
+        insert(ImageContent)
+        .values(
+            uuid=bindparam("content_uuid"),
+            image_file_uuid=bindparam("image_uuid"),
+            extraction_job_uuid=bindparam("job_uuid"),
+            content=bindparam("content", type_=ImageContent.content.type),
+            metadata_=bindparam("metadata", type_=ImageContent.metadata_.type),
+        )
+        .returning(ImageContent.extraction_job_uuid)
+        .cte("inserted_content")
+    )
+    return (
+        update(ImageExtractionJob)
+        .where(ImageExtractionJob.uuid == select(inserted.c.extraction_job_uuid).scalar_subquery())
+        .values(
+            status=bindparam("job_status"),
+            end_time=bindparam("job_end_time"),
+            latency_ms=bindparam("job_latency_ms"),
+            cost=bindparam("job_cost"),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+_IMAGE_SUCCESS_STMT = _image_success_stmt()
+
+
+def _image_jobs_finish_stmt(finish_rows: list):
+    """
+    Finish every job of an image batch in one statement:
+    UPDATE image_file_extraction_jobs SET ... FROM (VALUES ...) AS finished WHERE uuid = finished.uuid
+    """
+    finished = values(
+        column("uuid", String),
+        column("status", String),
+        column("end_time", DateTime(timezone=True)),
+        column("latency_ms", Integer),
+        column("cost", Float),
+        name="finished",
+    ).data([
+        (row["job_uuid"], row["job_status"], row["job_end_time"], row["job_latency_ms"], row["job_cost"])
+        for row in finish_rows
+    ])
+    return (
+        update(ImageExtractionJob)
+        .where(ImageExtractionJob.uuid == finished.c.uuid)
+        .values(
+            status=finished.c.status,
+            end_time=finished.c.end_time,
+            latency_ms=finished.c.latency_ms,
+            cost=finished.c.cost,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+# Documents with at least this many pages are written with COPY instead of INSERT
+COPY_MIN_PAGE_ROWS = 50
+
+
+# Cost per page for different extractors (example rates); module level so it is built once
+_COST_PER_PAGE = {
+    # PDF extractors - Free Python-based extractors
+    "PyPDF2": 0.0,  # Free Python PDF library
+    "PyMuPDF": 0.0,  # Free Python PDF library
+    "PDFPlumber": 0.0,  # Free Python PDF library
+    # "Camelot": 0.0,  # Disabled - causing failures
+    "MarkItDown": 0.0,  # Free Python markdown conversion library
+    
+    # Third-party API extractors
+    "LlamaParse": 0.003,  # LlamaParse API pricing (estimated)
+    "Mathpix": 0.004,  # Mathpix API pricing (estimated)
+    
+    # AWS services
+    "Textract": 0.0015,  # AWS Textract pricing
+    
+    # OCR extractors
+    "Tesseract": 0.0,  # Free OCR
+    
+    # OpenAI Vision models
+    "gpt-4o-mini": 0.005,  # OpenAI GPT-4o-mini pricing
+    "gpt-4o": 0.010,  # OpenAI GPT-4o pricing
+    "gpt-5": 0.020,  # OpenAI GPT-5 pricing
+    "gpt-5-mini": 0.008,  # OpenAI GPT-5-mini pricing
+}
+
+
 def calculate_extraction_cost(extractor_type: str, page_count: int) -> float:
     """Calculate cost based on extractor type and page count"""
-    # Cost per page for different extractors (example rates)
-    cost_per_page = {
-        # PDF extractors - Free Python-based extractors
-        "PyPDF2": 0.0,  # Free Python PDF library
-        "PyMuPDF": 0.0,  # Free Python PDF library
-        "PDFPlumber": 0.0,  # Free Python PDF library
-        # "Camelot": 0.0,  # Disabled - causing failures
-        "MarkItDown": 0.0,  # Free Python markdown conversion library
-        
-        # Third-party API extractors
-        "LlamaParse": 0.003,  # LlamaParse API pricing (estimated)
-        "Mathpix": 0.004,  # Mathpix API pricing (estimated)
-        
-        # AWS services
-        "Textract": 0.0015,  # AWS Textract pricing
-        
-        # OCR extractors
-        "Tesseract": 0.0,  # Free OCR
-        
-        # OpenAI Vision models
-        "gpt-4o-mini": 0.005,  # OpenAI GPT-4o-mini pricing
-        "gpt-4o": 0.010,  # OpenAI GPT-4o pricing
-        "gpt-5": 0.020,  # OpenAI GPT-5 pricing
-        "gpt-5-mini": 0.008,  # OpenAI GPT-5-mini pricing
-    }
-    base_cost = cost_per_page.get(extractor_type, 0.001)
-    return round(base_cost * page_count, 4)
+    return round(_COST_PER_PAGE.get(extractor_type, 0.001) * page_count, 4)
 
 
 def get_retry_config(extractor_type: str) -> dict:
@@ -125,13 +310,32 @@ def get_retry_config(extractor_type: str) -> dict:
     return EXTRACTOR_RETRY_CONFIG.get(extractor_type, DEFAULT_RETRY_CONFIG)
 
 
+def get_retry_backoff(retry_config: dict, retries: int) -> int:
+    """
+    Exponential backoff with full jitter, starting from the extractor's countdown: retries of
+    many jobs failing together against a flaky vendor API spread out instead of all hitting it
+    again at the same moment.
+    """
+    return get_exponential_backoff_interval(
+        factor=retry_config["countdown"],
+        retries=retries,
+        maximum=RETRY_BACKOFF_MAX_SECONDS,
+        full_jitter=True,
+    )
+
+
+def get_extraction_queue(extractor_type: str) -> str:
+    """Get the Celery queue for an extractor (API-backed extractors go to their vendor's queue on the gevent worker)"""
+    return VENDOR_EXTRACTION_QUEUES.get(extractor_type, FAST_EXTRACTION_QUEUE)
+
+
 def is_infrastructure_error(exception: Exception) -> bool:
     """Determine if error is infrastructure-related (don't retry)"""
     infrastructure_errors = (
         DatabaseError,
         OperationalError,
         PendingRollbackError,  # Add this
-        Psycopg2DatabaseError,
+        PsycopgDatabaseError,
         ConnectionError,
         FileNotFoundError,
         OSError,
@@ -151,28 +355,302 @@ def check_circuit_breaker(extractor_type: str) -> bool:
 
 def record_extractor_failure(extractor_type: str):
     """Record failure for circuit breaker tracking"""
-    from .file_coordinator import redis_client
-    from .constants import CIRCUIT_BREAKER_TIMEOUT
     circuit_key = f"circuit_breaker:{extractor_type}"
-    redis_client.incr(circuit_key)
-    redis_client.expire(circuit_key, CIRCUIT_BREAKER_TIMEOUT)
+    # INCR + EXPIRE in one round trip (MULTI/EXEC keeps them atomic)
+    with redis_client.pipeline() as pipe:
+        pipe.incr(circuit_key)
+        pipe.expire(circuit_key, CIRCUIT_BREAKER_TIMEOUT)
+        pipe.execute()
 
 
 def reset_circuit_breaker(extractor_type: str):
     """Reset circuit breaker on success"""
-    from .file_coordinator import redis_client
     circuit_key = f"circuit_breaker:{extractor_type}"
     redis_client.delete(circuit_key)
 
 
-@celery_app.task(bind=True)
+@celery_app.task(ignore_result=True)
+def track_usage_async(extractor_name: str, usage_data: dict, cost_metrics: dict, trace_id: str = None):
+    """Send extractor usage to Langfuse outside of the extraction task"""
+    try:
+        cost_calculator.track_usage(
+            extractor_name=extractor_name,
+            usage_data=usage_data,
+            cost_metrics=CostMetrics(**cost_metrics),
+            trace_id=trace_id,
+        )
+    except Exception as e:
+        logger.warning(f"📊 [LANGFUSE] Usage tracking failed: {e}")
+
+
+def track_usage_in_background(extractor_type: str, usage_data: dict, cost_metrics: CostMetrics, job_uuid: str):
+    """Queue Langfuse usage tracking so the extraction never waits on it (no-op without Langfuse)"""
+    if not cost_calculator.langfuse_client:
+        return
+    try:
+        track_usage_async.apply_async(
+            args=[extractor_type, usage_data, asdict(cost_metrics), job_uuid],
+            ignore_result=True,
+        )
+    except Exception as e:
+        logger.warning(f"📊 [LANGFUSE] Could not queue usage tracking: {e}")
+
+
+@worker_process_shutdown.connect
+def flush_usage_tracking(**kwargs):
+    """
+    The Langfuse client sends events from a background batch queue. Prefork children exit
+    without running atexit hooks, so flush whatever is still queued before the process goes.
+    """
+    if not cost_calculator.langfuse_client:
+        return
+    try:
+        cost_calculator.langfuse_client.flush()
+    except Exception as e:
+        logger.warning(f"📊 [LANGFUSE] Flush on worker shutdown failed: {e}")
+
+
+def _page_text(body) -> str:
+    """Get the first non-empty text-like field of an extracted page"""
+    data = (body or {}).get("content", {})
+    # Check for various content types that extractors might return
+    return (
+        data.get("COMBINED")
+        or data.get("TEXT")
+        or data.get("LATEX")
+        or data.get("MARKDOWN")  # For MarkItDown
+        or data.get("TABLE")  # For PDFPlumber tables
+        or ""
+    ).strip()
+
+
+def _has_meaningful_content(pages) -> bool:
+    """Return True if at least one extracted page carries non-empty text"""
+    try:
+        # any() stops at the first page with text
+        return bool(pages) and any(_page_text(body) for body in pages.values())
+    except Exception:
+        return False
+
+
+def _finish_times(start_time: datetime, start_ns: int = None):
+    """
+    (end_time, latency_ms) for a job started at wall-clock `start_time` and perf counter
+    `start_ns`. The end time is derived from the measured latency, so the task reads the
+    wall clock only once and end_time - start_time always equals the stored latency.
+    Without `start_ns` (work that continues in another task, such as polling) both come
+    from the wall clock.
+    """
+    if start_ns is None:
+        end_time = datetime.now(timezone.utc)
+        return end_time, int((end_time - start_time).total_seconds() * 1000)
+    latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+    return start_time + timedelta(milliseconds=latency_ms), latency_ms
+
+
+def _copy_page_contents(db, page_rows: list):
+    """
+    Write page rows with COPY ... FROM STDIN on the session's own connection (and transaction).
+    Used for large documents, where COPY is much cheaper than multi-row INSERTs.
+    """
+    driver_connection = db.connection().connection.driver_connection
+    with driver_connection.cursor() as cursor:
+        with cursor.copy(
+            f"COPY {PDFFilePageContent.__tablename__} "
+            "(uuid, pdf_file_uuid, extraction_job_uuid, page_number, content, metadata_) FROM STDIN"
+        ) as copy:
+            for row in page_rows:
+                copy.write_row((
+                    row["uuid"],
+                    row["pdf_file_uuid"],
+                    row["extraction_job_uuid"],
+                    row["page_number"],
+                    Json(row["content"], dumps=_json_dumps),
+                    Json({}),  # column default, which COPY does not apply
+                ))
+
+
+def _save_document_extraction_results(
+    db,
+    job_uuid: str,
+    document_uuid: str,
+    extractor_type: str,
+    page_contents,
+    result_or_job_id,
+    start_time: datetime,
+    start_ns: int = None,
+):
+    """
+    Persist extracted pages, cost and SUCCESS status for a document extraction job.
+    """
+    # --- 4. Validate and save page contents to DB ---
+    if not _has_meaningful_content(page_contents):
+        raise RuntimeError(
+            f"No meaningful content extracted by {extractor_type}"
+        )
+    page_rows = [
+        {
+            "pdf_file_uuid": document_uuid,
+            "uuid": uuid7_str(),
+            "extraction_job_uuid": job_uuid,
+            "page_number": page_num,
+            "content": content["content"],
+        }
+        for page_num, content in page_contents.items()
+    ]
+    if len(page_rows) >= COPY_MIN_PAGE_ROWS:
+        _copy_page_contents(db, page_rows)
+    else:
+        # One multi-row INSERT for all pages instead of one per page
+        db.execute(insert(PDFFilePageContent), page_rows)
+    # --- 5. Calculate cost using new cost calculator ---
+    page_count = len(page_contents) if page_contents else 0
+    
+    logger.debug("🧮 [COST CALCULATION] Starting cost calculation for {}", extractor_type)
+    logger.debug("🧮 [COST CALCULATION] Page count: {}", page_count)
+    # lazy=True: the key list is only built when DEBUG is actually emitted
+    logger.opt(lazy=True).debug(
+        "🧮 [COST CALCULATION] Page contents keys: {}",
+        lambda: list(page_contents.keys()) if page_contents else [],
+    )
+    
+    # Extract API response for cost calculation if available
+    api_response = None
+    if isinstance(result_or_job_id, dict) and "_api_response" in result_or_job_id:
+        api_response = result_or_job_id["_api_response"]
+        logger.debug("🧮 [COST CALCULATION] API response found: {}", type(api_response))
+    else:
+        logger.debug("🧮 [COST CALCULATION] No API response found, result type: {}", type(result_or_job_id))
+    
+    usage_data = {"page_count": page_count}
+    logger.debug("🧮 [COST CALCULATION] Usage data: {}", usage_data)
+    
+    cost_metrics = cost_calculator.calculate_cost(
+        extractor_name=extractor_type,
+        usage_data=usage_data,
+        api_response=api_response
+    )
+    
+    logger.debug("🧮 [COST CALCULATION] Cost metrics result: {}", cost_metrics)
+    logger.debug("🧮 [COST CALCULATION] Calculated cost: ${:.6f}", cost_metrics.calculated_cost)
+    logger.debug("🧮 [COST CALCULATION] Actual cost: ${}", cost_metrics.actual_cost or "N/A")
+    
+    # Track usage in Langfuse if available
+    logger.debug("📊 [LANGFUSE] Tracking usage for {}", extractor_type)
+    track_usage_in_background(extractor_type, usage_data, cost_metrics, job_uuid)
+
+    # --- 6. Latency & cost ---
+    end_time, latency_ms = _finish_times(start_time, start_ns)
+    
+    logger.debug("💾 [DATABASE] Updating job {} with cost: ${:.6f}", job_uuid, cost_metrics.calculated_cost)
+    
+    db.execute(
+        _PDF_JOB_FINISH_STMT,
+        {
+            "job_uuid": job_uuid,
+            "job_status": ExtractionStatus.SUCCESS,
+            "job_end_time": end_time,
+            "job_latency_ms": latency_ms,
+            "job_cost": cost_metrics.calculated_cost,
+        },
+    )
+    
+    logger.debug("💾 [DATABASE] Job update executed successfully")
+    db.commit()
+    logger.info(
+        f"Successfully processed document {document_uuid} with {extractor_type}"
+    )
+    # Reset circuit breaker on success
+    reset_circuit_breaker(extractor_type)
+    # Mark task complete and cleanup if needed
+    mark_task_complete(document_uuid, job_uuid)
+
+
+def _mark_document_extraction_failed(db, job_uuid: str, start_time: datetime, start_ns: int = None):
+    """
+    Roll back the session and record FAILURE for a document extraction job.
+    """
+    end_time, latency_ms = _finish_times(start_time, start_ns)
+    # CRITICAL: Rollback any pending transaction before attempting failure update
+    try:
+        db.rollback()
+        logger.debug("Transaction rolled back in exception handler")
+    except Exception as rb_err:
+        logger.warning(f"Error rolling back transaction: {rb_err}")
+    # Attempt to update job status to FAILURE
+    try:
+        db.execute(
+            _PDF_JOB_FINISH_STMT,
+            {
+                "job_uuid": job_uuid,
+                "job_status": ExtractionStatus.FAILURE,
+                "job_end_time": end_time,
+                "job_latency_ms": latency_ms,
+                "job_cost": 0.0,
+            },
+        )
+        db.commit()
+    except Exception as db_err:
+        logger.error(f"Failed to update job status to FAILURE: {db_err}")
+        # Continue with failure handling even if DB update fails
+
+
+def _handle_document_extraction_failure(
+    retry_task, e: Exception, job_uuid: str, document_uuid: str, file_path: str, extractor_type: str, retries: int
+):
+    """
+    Shared failure handling: circuit breaker bookkeeping, logging and retrying the extraction
+    while the extractor's retry budget allows it. `retry_task` is the bound extraction task to
+    retry in place; without it (polling failures) a fresh extraction task is dispatched.
+    """
+    # Record failure for circuit breaker
+    record_extractor_failure(extractor_type)
+    # Check if infrastructure error - fail immediately
+    if is_infrastructure_error(e):
+        logger.error(
+            f"Infrastructure failure for {extractor_type} - NOT RETRYING: {str(e)}"
+        )
+        mark_task_failed(document_uuid, job_uuid)
+        raise e  # Don't retry infrastructure errors
+    logger.error(
+        f"Failed to process document {document_uuid} with {extractor_type}: {str(e)}"
+    )
+    logger.error(f"Error type: {type(e).__name__}")
+    if hasattr(e, "__cause__"):
+        logger.error(
+            f"Caused by: {type(e.__cause__).__name__}: {str(e.__cause__)}"
+        )
+    mark_task_failed(document_uuid, job_uuid)
+    # Get extractor-specific retry config
+    retry_config = get_retry_config(extractor_type)
+    if retry_task is not None:
+        raise retry_task.retry(
+            exc=e,
+            countdown=retry_config["countdown"],
+            max_retries=retry_config["max_retries"],
+        )
+    # Failures while polling restart the whole extraction, carrying the retry count over
+    if retries >= retry_config["max_retries"]:
+        raise e
+    process_document_with_extractor.apply_async(
+        args=[job_uuid, document_uuid, file_path, extractor_type],
+        countdown=retry_config["countdown"],
+        retries=retries + 1,
+        queue=get_extraction_queue(extractor_type),
+    )
+
+
+@celery_app.task(bind=True, acks_late=True)
 def process_document_with_extractor(
     self, job_uuid: str, document_uuid: str, file_path: str, extractor_type: str
 ):
     """
     Process a document with the specified extractor (sync or async).
+    Async extractors only submit the job here; poll_document_extraction picks it up
+    so the worker slot is not held while the external service is working.
     """
     start_time = datetime.now(timezone.utc)
+    start_ns = time.perf_counter_ns()
     temp_file_path = None
     with get_db_session_context() as db:
         try:
@@ -182,26 +660,31 @@ def process_document_with_extractor(
                     f"Circuit breaker is OPEN for {extractor_type}. "
                     f"Too many recent failures. Try again later."
                 )
-            # Update job status to Processing
-            db.execute(
-                update(PDFFileExtractionJob)
-                .where(PDFFileExtractionJob.uuid == job_uuid)
-                .values(status=ExtractionStatus.PROCESSING, start_time=start_time)
+            # Update job status to Processing (a redelivered task must not redo a finished job)
+            started = db.execute(
+                _PDF_JOB_START_STMT, {"job_uuid": job_uuid, "job_start_time": start_time}
             )
-            db.commit()
+            if started.rowcount == 0:
+                logger.info(f"Job {job_uuid} is already running, already succeeded or no longer exists, skipping")
+                return
+            # Local extractors finish in moments, so PROCESSING is committed together with the
+            # results; slow API-backed jobs commit it now so it is visible while they run
+            if extractor_type in IO_BOUND_EXTRACTORS:
+                db.commit()
             # --- 1. Conditional file retrieval based on storage type ---
             local_file_path = None
             temp_file_path = None
-            # Get document info from database to determine storage type
-            # Use query() method for better session management
-            document = db.query(PDFFile).filter(PDFFile.uuid == document_uuid).first()
-            if not document:
+            # Only the filename is needed, so skip loading the whole PDFFile row
+            filename = db.execute(
+                select(PDFFile.filename).where(PDFFile.uuid == document_uuid)
+            ).scalar_one_or_none()
+            if filename is None:
                 raise RuntimeError(f"Document {document_uuid} not found")
             # Check if file is stored in S3 (starts with "projects/") or locally
             if file_path.startswith("projects/"):
                 # Use shared volume coordination for S3 files
                 shared_path = download_to_shared_volume(
-                    document_uuid, file_path, document.filename
+                    document_uuid, file_path, filename
                 )
                 local_file_path = shared_path
                 temp_file_path = None  # Don't track as temp (managed by coordinator)
@@ -222,192 +705,37 @@ def process_document_with_extractor(
                 # You would normally not poll here; webhook handler will call back later
                 # For Celery job, you might just exit early and let webhook handler finish DB update
                 page_contents = None
+            elif isinstance(result_or_job_id, dict):  # sync reader returned results
+                page_contents = result_or_job_id
             else:
-                if isinstance(result_or_job_id, dict):  # sync reader returned results
-                    page_contents = result_or_job_id
-                else:
-                    job_id = result_or_job_id
-                    # Poll until job finishes with timeout
-                    max_polling_time = 1800  # 30 minutes max polling time
-                    poll_interval = 5  # Poll every 5 seconds
-                    start_poll_time = time.time()
-                    status = reader.get_status(job_id)
-                    
-                    while status not in ["succeeded", "failed"]:
-                        elapsed_time = time.time() - start_poll_time
-                        if elapsed_time >= max_polling_time:
-                            raise RuntimeError(
-                                f"Extraction job {job_id} timed out after {max_polling_time} seconds. "
-                                f"Last status: {status}"
-                            )
-                        logger.info(
-                            f"Job {job_id} status: {status}, retrying... "
-                            f"(elapsed: {int(elapsed_time)}s / {max_polling_time}s)"
-                        )
-                        time.sleep(poll_interval)
-                        status = reader.get_status(job_id)
-                    
-                    if status == "failed":
-                        raise RuntimeError(f"Extraction failed for job {job_id}")
-                    page_contents = reader.get_result(job_id)
-            # --- 4. Validate and save page contents to DB ---
-            def _has_meaningful_content(pages):
-                try:
-                    if not pages:
-                        return False
-                    for _p, body in pages.items():
-                        data = (body or {}).get("content", {})
-                        # Check for various content types that extractors might return
-                        text = (
-                            data.get("COMBINED")
-                            or data.get("TEXT")
-                            or data.get("LATEX")
-                            or data.get("MARKDOWN")  # For MarkItDown
-                            or data.get("TABLE")  # For PDFPlumber tables
-                            or ""
-                        ).strip()
-                        if text:
-                            return True
-                    return False
-                except Exception:
-                    return False
-            if not _has_meaningful_content(page_contents):
-                raise RuntimeError(
-                    f"No meaningful content extracted by {extractor_type}"
-                )
-            if page_contents:
-                try:
-                    print(
-                        f"Extractor {extractor_type} produced {len(page_contents)} pages; sample keys: {list(next(iter(page_contents.values())).get('content', {}).keys()) if page_contents else []}"
-                    )
-                except Exception:
-                    pass
-                for page_num, content in page_contents.items():
-                    page_content = PDFFilePageContent(
-                        pdf_file_uuid=document_uuid,
-                        uuid=str(uuid.uuid4()),
-                        extraction_job_uuid=job_uuid,
-                        page_number=page_num,
-                        content=content["content"],
-                    )
-                    db.add(page_content)
-            # --- 5. Calculate cost using new cost calculator ---
-            page_count = len(page_contents) if page_contents else 0
-            
-            logger.info(f"🧮 [COST CALCULATION] Starting cost calculation for {extractor_type}")
-            logger.info(f"🧮 [COST CALCULATION] Page count: {page_count}")
-            logger.info(f"🧮 [COST CALCULATION] Page contents keys: {list(page_contents.keys()) if page_contents else []}")
-            
-            # Extract API response for cost calculation if available
-            api_response = None
-            if isinstance(result_or_job_id, dict) and "_api_response" in result_or_job_id:
-                api_response = result_or_job_id["_api_response"]
-                logger.info(f"🧮 [COST CALCULATION] API response found: {type(api_response)}")
-            else:
-                logger.info(f"🧮 [COST CALCULATION] No API response found, result type: {type(result_or_job_id)}")
-            
-            usage_data = {"page_count": page_count}
-            logger.info(f"🧮 [COST CALCULATION] Usage data: {usage_data}")
-            
-            cost_metrics = cost_calculator.calculate_cost(
-                extractor_name=extractor_type,
-                usage_data=usage_data,
-                api_response=api_response
-            )
-            
-            logger.info(f"🧮 [COST CALCULATION] Cost metrics result: {cost_metrics}")
-            logger.info(f"🧮 [COST CALCULATION] Calculated cost: ${cost_metrics.calculated_cost:.6f}")
-            logger.info(f"🧮 [COST CALCULATION] Actual cost: ${cost_metrics.actual_cost if cost_metrics.actual_cost else 'N/A'}")
-            
-            # Track usage in Langfuse if available
-            logger.info(f"📊 [LANGFUSE] Tracking usage for {extractor_type}")
-            try:
-                cost_calculator.track_usage(
-                    extractor_name=extractor_type,
-                    usage_data=usage_data,
-                    cost_metrics=cost_metrics,
-                    trace_id=job_uuid
+                # Hand the external job over to the polling task and free this worker
+                poll_document_extraction.apply_async(
+                    args=[
+                        job_uuid,
+                        document_uuid,
+                        file_path,
+                        extractor_type,
+                        result_or_job_id,
+                        start_time.isoformat(),
+                        time.time(),
+                        self.request.retries,
+                    ],
+                    countdown=EXTRACTION_POLL_INITIAL_INTERVAL_SECONDS,
+                    queue=SLOW_EXTRACTION_QUEUE,
                 )
-                logger.info(f"📊 [LANGFUSE] Usage tracking completed successfully")
-            except Exception as e:
-                logger.warning(f"📊 [LANGFUSE] Usage tracking failed: {e}")
-
-            # --- 6. Latency & cost ---
-            end_time = datetime.now(timezone.utc)
-            latency_ms = int((end_time - start_time).total_seconds() * 1000)
-            
-            logger.info(f"💾 [DATABASE] Updating job {job_uuid} with cost: ${cost_metrics.calculated_cost:.6f}")
-            
-            db.execute(
-                update(PDFFileExtractionJob)
-                .where(PDFFileExtractionJob.uuid == job_uuid)
-                .values(
-                    status=ExtractionStatus.SUCCESS,
-                    end_time=end_time,
-                    latency_ms=latency_ms,
-                    cost=cost_metrics.calculated_cost,
+                logger.info(
+                    f"Submitted {extractor_type} job {result_or_job_id} for document {document_uuid}; polling scheduled"
                 )
+                return
+            _save_document_extraction_results(
+                db, job_uuid, document_uuid, extractor_type, page_contents, result_or_job_id, start_time,
+                start_ns,
             )
-            
-            logger.info(f"💾 [DATABASE] Job update executed successfully")
-            db.commit()
-            logger.info(
-                f"Successfully processed document {document_uuid} with {extractor_type}"
-            )
-            # Reset circuit breaker on success
-            reset_circuit_breaker(extractor_type)
-            # Mark task complete and cleanup if needed
-            mark_task_complete(document_uuid, job_uuid)
         except Exception as e:
             # Failure path
-            end_time = datetime.now(timezone.utc)
-            latency_ms = int((end_time - start_time).total_seconds() * 1000)
-            # CRITICAL: Rollback any pending transaction before attempting failure update
-            try:
-                db.rollback()
-                logger.debug("Transaction rolled back in exception handler")
-            except Exception as rb_err:
-                logger.warning(f"Error rolling back transaction: {rb_err}")
-            # Attempt to update job status to FAILURE
-            try:
-                db.execute(
-                    update(PDFFileExtractionJob)
-                    .where(PDFFileExtractionJob.uuid == job_uuid)
-                    .values(
-                        status=ExtractionStatus.FAILURE,
-                        end_time=end_time,
-                        latency_ms=latency_ms,
-                        cost=0.0,
-                    )
-                )
-                db.commit()
-            except Exception as db_err:
-                logger.error(f"Failed to update job status to FAILURE: {db_err}")
-                # Continue with failure handling even if DB update fails
-            # Record failure for circuit breaker
-            record_extractor_failure(extractor_type)
-            # Check if infrastructure error - fail immediately
-            if is_infrastructure_error(e):
-                logger.error(
-                    f"Infrastructure failure for {extractor_type} - NOT RETRYING: {str(e)}"
-                )
-                mark_task_failed(document_uuid, job_uuid)
-                raise  # Don't retry infrastructure errors
-            logger.error(
-                f"Failed to process document {document_uuid} with {extractor_type}: {str(e)}"
-            )
-            logger.error(f"Error type: {type(e).__name__}")
-            if hasattr(e, "__cause__"):
-                logger.error(
-                    f"Caused by: {type(e.__cause__).__name__}: {str(e.__cause__)}"
-                )
-            mark_task_failed(document_uuid, job_uuid)
-            # Get extractor-specific retry config
-            retry_config = get_retry_config(extractor_type)
-            raise self.retry(
-                exc=e,
-                countdown=retry_config["countdown"],
-                max_retries=retry_config["max_retries"],
+            _mark_document_extraction_failed(db, job_uuid, start_time, start_ns)
+            _handle_document_extraction_failure(
+                self, e, job_uuid, document_uuid, file_path, extractor_type, self.request.retries
             )
         finally:
             # Note: Shared volume files are managed by file_coordinator
@@ -422,7 +750,278 @@ def process_document_with_extractor(
                     )
 
 
-@celery_app.task(bind=True)
+@celery_app.task(bind=True, acks_late=True, max_retries=None)
+def poll_document_extraction(
+    self,
+    job_uuid: str,
+    document_uuid: str,
+    file_path: str,
+    extractor_type: str,
+    external_job_id: str,
+    start_time: str,
+    poll_started_at: float,
+    extraction_retries: int = 0,
+):
+    """
+    Check an async extractor job once and re-schedule itself with exponential backoff
+    until it finishes, so no worker sleeps while the external service is working.
+    The database session is only opened once there is something to write.
+    """
+    start_time = datetime.fromisoformat(start_time)
+    try:
+        reader = get_reader(extractor_type)
+        status = reader.get_status(external_job_id)
+        if status not in ["succeeded", "failed"]:
+            elapsed_time = time.time() - poll_started_at
+            if elapsed_time >= EXTRACTION_POLL_TIMEOUT_SECONDS:
+                raise RuntimeError(
+                    f"Extraction job {external_job_id} timed out after {EXTRACTION_POLL_TIMEOUT_SECONDS} seconds. "
+                    f"Last status: {status}"
+                )
+            countdown = min(
+                EXTRACTION_POLL_INITIAL_INTERVAL_SECONDS * 2 ** self.request.retries,
+                EXTRACTION_POLL_MAX_INTERVAL_SECONDS,
+            )
+            logger.info(
+                f"Job {external_job_id} status: {status}, checking again in {countdown}s "
+                f"(elapsed: {int(elapsed_time)}s / {EXTRACTION_POLL_TIMEOUT_SECONDS}s)"
+            )
+            raise self.retry(countdown=countdown)
+        if status == "failed":
+            raise RuntimeError(f"Extraction failed for job {external_job_id}")
+        page_contents = reader.get_result(external_job_id)
+    except Retry:
+        raise
+    except Exception as e:
+        with get_db_session_context() as db:
+            _mark_document_extraction_failed(db, job_uuid, start_time)
+        _handle_document_extraction_failure(
+            None, e, job_uuid, document_uuid, file_path, extractor_type, extraction_retries
+        )
+        return
+
+    with get_db_session_context() as db:
+        try:
+            _save_document_extraction_results(
+                db, job_uuid, document_uuid, extractor_type, page_contents, external_job_id, start_time
+            )
+        except Exception as e:
+            _mark_document_extraction_failed(db, job_uuid, start_time)
+            _handle_document_extraction_failure(
+                None, e, job_uuid, document_uuid, file_path, extractor_type, extraction_retries
+            )
+
+
+@celery_app.task
+def redispatch_pending_extraction_retries():
+    """
+    Re-enqueue retried PDF extraction jobs whose dispatch was never confirmed.
+    Outbox rows only become visible to this task once they are older than
+    RETRY_OUTBOX_VISIBILITY_TIMEOUT_SECONDS, long enough that a dispatch which did reach the
+    broker (but whose enqueued_at update was lost) has been picked up and moved the job out
+    of NOT_STARTED. Visible rows are re-sent if the job is still waiting to run, otherwise
+    they are simply marked as handled.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=RETRY_OUTBOX_VISIBILITY_TIMEOUT_SECONDS)
+    with get_db_session_context() as db:
+        pending = db.execute(
+            select(
+                PDFFileExtractionRetryOutbox.uuid.label("outbox_uuid"),
+                PDFFileExtractionJob.uuid.label("job_uuid"),
+                PDFFileExtractionJob.pdf_file_uuid,
+                PDFFileExtractionJob.extractor,
+                PDFFileExtractionJob.status,
+                PDFFileExtractionJob.deleted_at,
+                PDFFile.filepath,
+            )
+            .join(
+                PDFFileExtractionJob,
+                PDFFileExtractionJob.uuid == PDFFileExtractionRetryOutbox.extraction_job_uuid,
+            )
+            .join(PDFFile, PDFFile.uuid == PDFFileExtractionJob.pdf_file_uuid)
+            .where(
+                PDFFileExtractionRetryOutbox.enqueued_at.is_(None),
+                PDFFileExtractionRetryOutbox.created_at < cutoff,
+            )
+        ).all()
+
+        for row in pending:
+            if row.deleted_at is None and row.status == ExtractionStatus.NOT_STARTED:
+                try:
+                    process_document_with_extractor.apply_async(
+                        args=[row.job_uuid, row.pdf_file_uuid, row.filepath, row.extractor],
+                        task_id=row.job_uuid,
+                        queue=get_extraction_queue(row.extractor),
+                    )
+                    logger.info(f"Re-dispatched pending retry: job_uuid={row.job_uuid}, extractor={row.extractor}")
+                except Exception as e:
+                    logger.error(f"Failed to re-dispatch pending retry: job_uuid={row.job_uuid}, error={e}")
+                    continue
+            db.execute(
+                update(PDFFileExtractionRetryOutbox)
+                .where(PDFFileExtractionRetryOutbox.uuid == row.outbox_uuid)
+                .values(enqueued_at=func.now())
+            )
+            db.commit()
+
+
+@celery_app.task
+def fail_stale_processing_jobs():
+    """
+    Mark jobs stuck in PROCESSING for longer than STALE_JOB_TIMEOUT_SECONDS as FAILURE.
+    Their worker died mid-job and the redelivered task skipped the claimed job, so nothing
+    else would ever finish them; as FAILURE they show up as failed and can be retried.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=STALE_JOB_TIMEOUT_SECONDS)
+    with get_db_session_context() as db:
+        for job_model in (PDFFileExtractionJob, AudioExtractionJob, ImageExtractionJob):
+            reaped = db.execute(
+                update(job_model)
+                .where(
+                    job_model.status == ExtractionStatus.PROCESSING,
+                    job_model.start_time < cutoff,
+                )
+                .values(status=ExtractionStatus.FAILURE, end_time=func.now())
+                .returning(job_model.uuid)
+                .execution_options(synchronize_session=False)
+            ).scalars().all()
+            db.commit()
+            if reaped:
+                logger.warning(
+                    f"Marked {len(reaped)} stale {job_model.__tablename__} as FAILURE: {reaped}"
+                )
+
+
+# Image readers keep no per-call state that the task depends on, so each worker process keeps
+# one per extractor type and reuses its SDK clients and connection pools across tasks
+_IMAGE_READER_CACHE = {}
+_IMAGE_READER_CACHE_LOCK = threading.Lock()
+
+
+def get_cached_image_reader(extractor_type: str):
+    """Get this worker's image reader for the extractor, creating it on first use"""
+    reader = _IMAGE_READER_CACHE.get(extractor_type)
+    if reader is None:
+        # Lock so concurrent greenlets/threads do not build the same reader twice
+        with _IMAGE_READER_CACHE_LOCK:
+            reader = _IMAGE_READER_CACHE.get(extractor_type)
+            if reader is None:
+                reader = get_image_reader(extractor_type)
+                _IMAGE_READER_CACHE[extractor_type] = reader
+    return reader
+
+
+def _segment_end_ms(content: dict):
+    """End of a transcript segment in milliseconds, or 0 when it has no timestamps"""
+    # Whisper format (flat structure with start/end already in milliseconds)
+    if "end" in content and "start" in content:
+        return max(content.get("end", 0), content.get("start", 0))
+    # AssemblyAI/AWS Transcribe format (nested structure with metadata)
+    metadata = content.get("metadata") or {}
+    if metadata.get("end_ms") is not None:
+        return metadata["end_ms"]
+    return metadata.get("start_ms") or 0
+
+
+# Downloads images from S3 while the task carries on with its DB writes and reader setup.
+# Threads start lazily and only when none is idle, so a prefork child (one task at a time)
+# ends up with a single thread; the cap matches the gevent worker's concurrency.
+_IMAGE_DOWNLOAD_POOL = ThreadPoolExecutor(max_workers=100, thread_name_prefix="image-download")
+
+
+# image_uuid -> filename. An upload fans out to one job per extractor and a filename never
+# changes after upload, so entries need no invalidation; least recently used are evicted.
+_IMAGE_FILENAME_CACHE = OrderedDict()
+_IMAGE_FILENAME_CACHE_MAX = 4096
+_IMAGE_FILENAME_CACHE_LOCK = threading.Lock()
+
+
+def _image_filename(db, image_uuid: str) -> str:
+    with _IMAGE_FILENAME_CACHE_LOCK:
+        filename = _IMAGE_FILENAME_CACHE.get(image_uuid)
+        if filename is not None:
+            _IMAGE_FILENAME_CACHE.move_to_end(image_uuid)
+            return filename
+    filename = db.execute(
+        select(Image.filename).where(Image.uuid == image_uuid)
+    ).scalar_one_or_none()
+    if filename is None:
+        raise RuntimeError(f"Image {image_uuid} not found")
+    with _IMAGE_FILENAME_CACHE_LOCK:
+        _IMAGE_FILENAME_CACHE[image_uuid] = filename
+        if len(_IMAGE_FILENAME_CACHE) > _IMAGE_FILENAME_CACHE_MAX:
+            _IMAGE_FILENAME_CACHE.popitem(last=False)
+    return filename
+
+
+def _local_image_path(image_uuid: str, file_path: str, filename: str) -> str:
+    """Local path to read the image from; S3 objects are downloaded to the shared volume first"""
+    if file_path.startswith("projects/"):
+        return download_to_shared_volume(image_uuid, file_path, filename)
+    if os.path.exists(file_path):
+        return file_path
+    raise RuntimeError(f"File not found: {file_path}")
+
+
+def _resolve_image_path(db, image_uuid: str, file_path: str) -> str:
+    return _local_image_path(image_uuid, file_path, _image_filename(db, image_uuid))
+
+
+# Text-like content fields of an image result, in order of preference
+_IMAGE_TEXT_KEYS = ("TEXT", "COMBINED", "MARKDOWN")
+
+
+def _validate_image_result(extractor_type: str, result):
+    """
+    Check an image reader's result and return its (content, metadata) dicts, with the
+    extractor name recorded in the metadata.
+    """
+    # Validate result format
+    if not isinstance(result, dict):
+        raise RuntimeError(
+            f"Extractor {extractor_type} returned invalid result type: {type(result)}. "
+            f"Expected dict with 'content' and 'metadata' keys."
+        )
+
+    # Extract content and metadata from result
+    content_dict = result.get("content", {})
+    metadata_dict = result.get("metadata", {})
+
+    # Validate that content exists (even if empty - images with no text are valid)
+    if content_dict is None:
+        raise RuntimeError(
+            f"Extractor {extractor_type} returned None for content. "
+            f"Expected dict (can be empty for images with no text)."
+        )
+
+    # Ensure content_dict is a dict
+    if not isinstance(content_dict, dict):
+        raise RuntimeError(
+            f"Extractor {extractor_type} returned invalid content type: {type(content_dict)}. "
+            f"Expected dict."
+        )
+
+    # Log warning if content is empty (but don't fail - images with no text are valid)
+    text_content = next(
+        (value for key in _IMAGE_TEXT_KEYS if (value := content_dict.get(key))), ""
+    )
+    if not text_content.strip():
+        logger.opt(lazy=True).info(
+            "Extractor {} returned empty text content. "
+            "This is normal for images with no readable text. "
+            "Content keys: {}",
+            lambda: extractor_type,
+            lambda: list(content_dict.keys()),
+        )
+
+    # Ensure metadata includes extractor info
+    if not metadata_dict:
+        metadata_dict = {}
+    metadata_dict["extractor"] = extractor_type
+    return content_dict, metadata_dict
+
+
+@celery_app.task(bind=True, acks_late=True)
 def process_audio_with_extractor(
     self, job_uuid: str, audio_uuid: str, file_path: str, extractor_type: str
 ):
@@ -430,27 +1029,34 @@ def process_audio_with_extractor(
     Process an audio file with the specified extractor.
     """
     start_time = datetime.now(timezone.utc)
+    start_ns = time.perf_counter_ns()
     # Initialize duration_seconds before try block to avoid UnboundLocalError
     duration_seconds = 0
     api_response = None
     
     with get_db_session_context() as db:
         try:
-            # Update job status to Processing
-            db.execute(
-                update(AudioExtractionJob)
-                .where(AudioExtractionJob.uuid == job_uuid)
-                .values(status=ExtractionStatus.PROCESSING, start_time=start_time)
+            # Update job status to Processing (a redelivered task must not redo a finished job)
+            started = db.execute(
+                _AUDIO_JOB_START_STMT, {"job_uuid": job_uuid, "job_start_time": start_time}
             )
-            db.commit()
+            if started.rowcount == 0:
+                logger.info(f"Job {job_uuid} is already running, already succeeded or no longer exists, skipping")
+                return
+            # Local extractors finish in moments, so PROCESSING is committed together with the
+            # results; slow API-backed jobs commit it now so it is visible while they run
+            if extractor_type in IO_BOUND_EXTRACTORS:
+                db.commit()
 
             # Resolve file path (S3 vs local)
             local_file_path = None
-            audio = db.query(Audio).filter(Audio.uuid == audio_uuid).first()
-            if not audio:
+            filename = db.execute(
+                select(Audio.filename).where(Audio.uuid == audio_uuid)
+            ).scalar_one_or_none()
+            if filename is None:
                 raise RuntimeError(f"Audio {audio_uuid} not found")
             if file_path.startswith("projects/"):
-                shared_path = download_to_shared_volume(audio_uuid, file_path, audio.filename)
+                shared_path = download_to_shared_volume(audio_uuid, file_path, filename)
                 local_file_path = shared_path
             elif os.path.exists(file_path):
                 local_file_path = file_path
@@ -465,7 +1071,7 @@ def process_audio_with_extractor(
                 usage_metrics = reader.get_usage_metrics(local_file_path)
                 if usage_metrics and "duration_seconds" in usage_metrics:
                     duration_seconds = usage_metrics["duration_seconds"]
-                    logger.info(f"📊 [DURATION] Got duration from get_usage_metrics: {duration_seconds}s")
+                    logger.debug("📊 [DURATION] Got duration from get_usage_metrics: {}s", duration_seconds)
             except Exception as e:
                 logger.warning(f"📊 [DURATION] Could not get duration from get_usage_metrics: {e}")
             
@@ -477,31 +1083,28 @@ def process_audio_with_extractor(
             # If duration is still 0, try to calculate from segments
             if duration_seconds == 0:
                 if isinstance(result, dict):
-                    # Check if any segment has duration info
-                    max_end_ms = 0
-                    for seg_num, content in result.items():
-                        if isinstance(content, dict):
-                            # Look for duration in various formats
-                            if "duration" in content:
-                                duration_seconds = max(duration_seconds, content["duration"])
-                            # Check for Whisper format (flat structure with start/end in milliseconds)
-                            elif "end" in content and "start" in content:
-                                # start and end are already in milliseconds for Whisper
-                                segment_end_ms = max(content.get("end", 0), content.get("start", 0))
-                                max_end_ms = max(max_end_ms, segment_end_ms)
-                            # Check for AssemblyAI/AWS Transcribe format (nested structure with metadata)
-                            elif "metadata" in content:
-                                metadata = content.get("metadata", {})
-                                # Check for start_ms and end_ms in metadata
-                                if "end_ms" in metadata and metadata["end_ms"] is not None:
-                                    max_end_ms = max(max_end_ms, metadata["end_ms"])
-                                elif "start_ms" in metadata and metadata["start_ms"] is not None:
-                                    max_end_ms = max(max_end_ms, metadata["start_ms"])
-                    
-                    # Convert max_end_ms to seconds if we found timestamps
+                    # Segment timestamps win over per-segment "duration" values, so the
+                    # duration scan only runs when no segment carries timestamps
+                    max_end_ms = max(
+                        (
+                            _segment_end_ms(content)
+                            for content in result.values()
+                            if isinstance(content, dict) and "duration" not in content
+                        ),
+                        default=0,
+                    )
                     if max_end_ms > 0:
                         duration_seconds = max_end_ms / 1000.0
-                        logger.info(f"📊 [DURATION] Calculated duration from segments: {duration_seconds}s (max_end_ms: {max_end_ms})")
+                        logger.debug("📊 [DURATION] Calculated duration from segments: {}s (max_end_ms: {})", duration_seconds, max_end_ms)
+                    else:
+                        duration_seconds = max(
+                            (
+                                content["duration"]
+                                for content in result.values()
+                                if isinstance(content, dict) and "duration" in content
+                            ),
+                            default=duration_seconds,
+                        )
                     
                     # Check if result contains API response with cost info
                     if isinstance(result, dict) and "_api_response" in result:
@@ -513,60 +1116,56 @@ def process_audio_with_extractor(
                         duration_seconds = 60  # Default 1 minute if we can't determine
                         logger.warning(f"📊 [DURATION] Using default duration: {duration_seconds}s")
             
-            logger.info(f"📊 [DURATION] Final duration for cost calculation: {duration_seconds}s")
+            logger.debug("📊 [DURATION] Final duration for cost calculation: {}s", duration_seconds)
 
-            # Save segments
+            # Save segments (one multi-row INSERT instead of one per segment)
             if isinstance(segments, dict):
+                segment_rows = []
                 for seg_num, content in segments.items():
                     # Handle new whisper format (flat structure) vs old format (nested structure)
                     if "text" in content and "start" in content:
                         # New whisper format: flat structure with text, start, end
                         # Store in format compatible with AWS/Assembly (COMBINED and TEXT)
                         whisper_text = content.get("text", "")
-                        seg = AudioSegmentContent(
-                            uuid=str(uuid.uuid4()),
-                            audio_file_uuid=audio_uuid,
-                            extraction_job_uuid=job_uuid,
-                            segment_number=int(seg_num),
-                            start_ms=content.get("start"),
-                            end_ms=content.get("end"),
-                            content={
-                                "text": whisper_text,
-                                "TEXT": whisper_text,
-                                "COMBINED": whisper_text,
-                            },
-                        )
                         # Store other fields as metadata
                         metadata = {k: v for k, v in content.items() if k not in ["text", "start", "end"]}
                         # Round confidence if present in metadata
                         if metadata and "confidence" in metadata:
-                            from src.extractor.audio.utils import round_confidence
                             metadata["confidence"] = round_confidence(metadata["confidence"])
-                        if metadata:
-                            seg.metadata_ = metadata
-                        seg.metadata_ = seg.metadata_ or {}
-                        seg.metadata_["extractor"] = extractor_type
-                        db.add(seg)
+                        metadata["extractor"] = extractor_type
+                        segment_rows.append({
+                            "uuid": uuid7_str(),
+                            "audio_file_uuid": audio_uuid,
+                            "extraction_job_uuid": job_uuid,
+                            "segment_number": int(seg_num),
+                            "start_ms": content.get("start"),
+                            "end_ms": content.get("end"),
+                            "content": {
+                                "text": whisper_text,
+                                "TEXT": whisper_text,
+                                "COMBINED": whisper_text,
+                            },
+                            "metadata_": metadata,
+                        })
                     else:
                         # Old format: nested structure with content and metadata
                         metadata = content.get("metadata", {})
                         # Round confidence if present in metadata
                         if metadata and "confidence" in metadata:
-                            from src.extractor.audio.utils import round_confidence
                             metadata["confidence"] = round_confidence(metadata["confidence"])
-                        seg = AudioSegmentContent(
-                            uuid=str(uuid.uuid4()),
-                            audio_file_uuid=audio_uuid,
-                            extraction_job_uuid=job_uuid,
-                            segment_number=int(seg_num),
-                            start_ms=metadata.get("start_ms"),
-                            end_ms=metadata.get("end_ms"),
-                            content=content.get("content", {}),
-                        )
-                        # Store metadata if present (e.g., raw_transcript_data for AWS Transcribe)
-                        if metadata:
-                            seg.metadata_ = metadata
-                        db.add(seg) 
+                        segment_rows.append({
+                            "uuid": uuid7_str(),
+                            "audio_file_uuid": audio_uuid,
+                            "extraction_job_uuid": job_uuid,
+                            "segment_number": int(seg_num),
+                            "start_ms": metadata.get("start_ms"),
+                            "end_ms": metadata.get("end_ms"),
+                            "content": content.get("content", {}),
+                            # Store metadata if present (e.g., raw_transcript_data for AWS Transcribe)
+                            "metadata_": metadata or {},
+                        })
+                if segment_rows:
+                    db.execute(insert(AudioSegmentContent), segment_rows)
  
             # Calculate cost using the new cost calculator
             usage_data = {"duration_seconds": duration_seconds}
@@ -577,30 +1176,23 @@ def process_audio_with_extractor(
             )
             
             # Track usage in Langfuse if available
-            cost_calculator.track_usage(
-                extractor_name=extractor_type,
-                usage_data=usage_data,
-                cost_metrics=cost_metrics,
-                trace_id=job_uuid
-            )
+            track_usage_in_background(extractor_type, usage_data, cost_metrics, job_uuid)
  
-            end_time = datetime.now(timezone.utc)
-            latency_ms = int((end_time - start_time).total_seconds() * 1000)
+            end_time, latency_ms = _finish_times(start_time, start_ns)
             db.execute(
-                update(AudioExtractionJob)
-                .where(AudioExtractionJob.uuid == job_uuid)
-                .values(
-                    status=ExtractionStatus.SUCCESS,
-                    end_time=end_time,
-                    latency_ms=latency_ms,
-                    cost=cost_metrics.calculated_cost,
-                )
+                _AUDIO_JOB_FINISH_STMT,
+                {
+                    "job_uuid": job_uuid,
+                    "job_status": ExtractionStatus.SUCCESS,
+                    "job_end_time": end_time,
+                    "job_latency_ms": latency_ms,
+                    "job_cost": cost_metrics.calculated_cost,
+                },
             )
             db.commit()
             mark_task_complete(audio_uuid, job_uuid)
         except Exception as e:
-            end_time = datetime.now(timezone.utc)
-            latency_ms = int((end_time - start_time).total_seconds() * 1000)
+            end_time, latency_ms = _finish_times(start_time, start_ns)
             try:
                 db.rollback()
             except Exception:
@@ -615,14 +1207,14 @@ def process_audio_with_extractor(
             
             try:
                 db.execute(
-                    update(AudioExtractionJob)
-                    .where(AudioExtractionJob.uuid == job_uuid)
-                    .values(
-                        status=ExtractionStatus.FAILURE,
-                        end_time=end_time,
-                        latency_ms=latency_ms,
-                        cost=cost_metrics.calculated_cost,
-                    )
+                    _AUDIO_JOB_FINISH_STMT,
+                    {
+                        "job_uuid": job_uuid,
+                        "job_status": ExtractionStatus.FAILURE,
+                        "job_end_time": end_time,
+                        "job_latency_ms": latency_ms,
+                        "job_cost": cost_metrics.calculated_cost,
+                    },
                 )
                 db.commit()
             except Exception:
@@ -636,172 +1228,264 @@ def process_audio_with_extractor(
             )
 
 
-@celery_app.task(bind=True)
+# Attempts at writing a finished image's results before giving up (the extraction is not re-run)
+IMAGE_PERSIST_ATTEMPTS = 3
+
+# SQLSTATEs worth retrying a write for: serialization_failure, deadlock_detected and
+# lock_not_available (lock_timeout). All surface as OperationalError.
+_RETRYABLE_SQLSTATES = frozenset({"40001", "40P01", "55P03"})
+
+
+def _persist_image_result(db, params: dict) -> None:
+    """
+    Write the content row and SUCCESS status. Serialization failures, deadlocks and lock
+    timeouts retry just this write inside a SAVEPOINT, so a failed attempt neither discards
+    the job's uncommitted PROCESSING update nor re-runs the extractor. Any other database
+    error (constraint violations, bad data, dropped connections) is raised immediately.
+    """
+    for attempt in range(1, IMAGE_PERSIST_ATTEMPTS + 1):
+        try:
+            with db.begin_nested():
+                db.execute(_IMAGE_SUCCESS_STMT, params)
+            return
+        except OperationalError as e:
+            # A dropped connection cannot be rolled back to a savepoint; let the caller handle it
+            if (
+                attempt == IMAGE_PERSIST_ATTEMPTS
+                or e.connection_invalidated
+                or getattr(e.orig, "sqlstate", None) not in _RETRYABLE_SQLSTATES
+            ):
+                raise
+            logger.warning(
+                "Saving image job {} failed (attempt {}/{}): {}",
+                params["job_uuid"], attempt, IMAGE_PERSIST_ATTEMPTS, e,
+            )
+            time.sleep(0.1 * attempt)
+
+
+def _mark_image_extraction_failed(db, job_uuid: str, start_time: datetime, start_ns: int, cost: float):
+    """Best-effort FAILURE update for an image job (the session is rolled back first)"""
+    end_time, latency_ms = _finish_times(start_time, start_ns)
+    try:
+        db.rollback()
+    except Exception:
+        pass
+    try:
+        db.execute(
+            _IMAGE_JOB_FINISH_STMT,
+            {
+                "job_uuid": job_uuid,
+                "job_status": ExtractionStatus.FAILURE,
+                "job_end_time": end_time,
+                "job_latency_ms": latency_ms,
+                "job_cost": cost,
+            },
+        )
+        db.commit()
+    except Exception:
+        pass
+
+
+@celery_app.task(bind=True, acks_late=True)
 def process_image_with_extractor(
     self, job_uuid: str, image_uuid: str, file_path: str, extractor_type: str
 ):
     """
     Process an image file with the specified extractor.
+    Failures to get or extract the image are retried with the extractor's retry config;
+    failures to save a finished extraction are not, since retrying would pay for it again.
     """
     start_time = datetime.now(timezone.utc)
+    start_ns = time.perf_counter_ns()
     # Initialize api_response before try block to avoid UnboundLocalError
     api_response = None
-    
+    usage_data = {"image_count": 1}
+
     with get_db_session_context() as db:
         try:
-            # Update job status to Processing
-            db.execute(
-                update(ImageExtractionJob)
-                .where(ImageExtractionJob.uuid == job_uuid)
-                .values(status=ExtractionStatus.PROCESSING, start_time=start_time)
+            # Update job status to Processing (a redelivered task must not redo a finished job)
+            started = db.execute(
+                _IMAGE_JOB_START_STMT, {"job_uuid": job_uuid, "job_start_time": start_time}
             )
-            db.commit()
+            if started.rowcount == 0:
+                logger.info(f"Job {job_uuid} is already running, already succeeded or no longer exists, skipping")
+                return
 
-            # Resolve file path (S3 vs local)
-            local_file_path = None
-            image = db.query(Image).filter(Image.uuid == image_uuid).first()
-            if not image:
-                raise RuntimeError(f"Image {image_uuid} not found")
-            if file_path.startswith("projects/"):
-                shared_path = download_to_shared_volume(image_uuid, file_path, image.filename)
-                local_file_path = shared_path
-            elif os.path.exists(file_path):
-                local_file_path = file_path
-            else:
-                raise RuntimeError(f"File not found: {file_path}")
+            # Resolve file path (S3 vs local); the download runs in the background while the
+            # PROCESSING commit and reader lookup (client setup on first use) happen here
+            filename = _image_filename(db, image_uuid)
+            local_path_future = _IMAGE_DOWNLOAD_POOL.submit(
+                _local_image_path, image_uuid, file_path, filename
+            )
+
+            # Local extractors finish in moments, so PROCESSING is committed together with the
+            # results; slow API-backed jobs commit it now so it is visible while they run
+            if extractor_type in IO_BOUND_EXTRACTORS:
+                db.commit()
 
-            # Get image reader and read
-            reader = get_image_reader(extractor_type)
+            # Get image reader (reused across tasks in this worker) and read
+            reader = get_cached_image_reader(extractor_type)
+            local_file_path = local_path_future.result()
             result = reader.read(local_file_path)
-            
-            # Validate result format
-            if not isinstance(result, dict):
-                raise RuntimeError(
-                    f"Extractor {extractor_type} returned invalid result type: {type(result)}. "
-                    f"Expected dict with 'content' and 'metadata' keys."
-                )
-            
+
             # Extract API response for cost calculation (already initialized above)
-            if "_api_response" in result:
+            if isinstance(result, dict) and "_api_response" in result:
                 api_response = result["_api_response"]
-
-            # Extract content and metadata from result
-            content_dict = result.get("content", {})
-            metadata_dict = result.get("metadata", {})
-            
-            # Validate that content exists (even if empty - images with no text are valid)
-            if content_dict is None:
-                raise RuntimeError(
-                    f"Extractor {extractor_type} returned None for content. "
-                    f"Expected dict (can be empty for images with no text)."
-                )
-            
-            # Ensure content_dict is a dict
-            if not isinstance(content_dict, dict):
-                raise RuntimeError(
-                    f"Extractor {extractor_type} returned invalid content type: {type(content_dict)}. "
-                    f"Expected dict."
-                )
-            
-            # Log warning if content is empty (but don't fail - images with no text are valid)
-            text_content = (
-                content_dict.get("TEXT", "")
-                or content_dict.get("COMBINED", "")
-                or content_dict.get("MARKDOWN", "")
-                or ""
-            )
-            if not text_content or not text_content.strip():
-                logger.info(
-                    f"Extractor {extractor_type} returned empty text content. "
-                    f"This is normal for images with no readable text. "
-                    f"Content keys: {list(content_dict.keys())}"
-                )
-            
-            # Ensure metadata includes extractor info
-            if not metadata_dict:
-                metadata_dict = {}
-            metadata_dict["extractor"] = extractor_type
-            
-            image_content = ImageContent(
-                uuid=str(uuid.uuid4()),
-                image_file_uuid=image_uuid,
-                extraction_job_uuid=job_uuid,
-                content=content_dict,
-                metadata_=metadata_dict,
-            )
-            db.add(image_content)
-
-            # Calculate cost using the new cost calculator (image_count is always 1 for single image)
-            usage_data = {"image_count": 1}
+            content_dict, metadata_dict = _validate_image_result(extractor_type, result)
+        except Exception as e:
+            # Calculate cost even for failures (costs are still incurred)
             cost_metrics = cost_calculator.calculate_cost(
                 extractor_name=extractor_type,
                 usage_data=usage_data,
                 api_response=api_response
             )
-            
-            # Track usage in Langfuse if available
-            cost_calculator.track_usage(
-                extractor_name=extractor_type,
-                usage_data=usage_data,
-                cost_metrics=cost_metrics,
-                trace_id=job_uuid
+            _mark_image_extraction_failed(db, job_uuid, start_time, start_ns, cost_metrics.calculated_cost)
+            mark_task_failed(image_uuid, job_uuid)
+            # The attached traceback carries the error type and its cause chain
+            logger.opt(exception=e).error(
+                "Failed to process image {} with {}: {}", image_uuid, extractor_type, e
+            )
+            retry_config = get_retry_config(extractor_type)
+            raise self.retry(
+                exc=e,
+                countdown=get_retry_backoff(retry_config, self.request.retries),
+                max_retries=retry_config["max_retries"],
             )
 
-            end_time = datetime.now(timezone.utc)
-            latency_ms = int((end_time - start_time).total_seconds() * 1000)
-            db.execute(
-                update(ImageExtractionJob)
-                .where(ImageExtractionJob.uuid == job_uuid)
-                .values(
-                    status=ExtractionStatus.SUCCESS,
-                    end_time=end_time,
-                    latency_ms=latency_ms,
-                    cost=cost_metrics.calculated_cost,
-                )
+        # Calculate cost using the new cost calculator (image_count is always 1 for single image)
+        cost_metrics = cost_calculator.calculate_cost(
+            extractor_name=extractor_type,
+            usage_data=usage_data,
+            api_response=api_response
+        )
+
+        # Track usage in Langfuse if available
+        track_usage_in_background(extractor_type, usage_data, cost_metrics, job_uuid)
+
+        end_time, latency_ms = _finish_times(start_time, start_ns)
+        try:
+            # Content row and SUCCESS status go to Postgres in a single round trip
+            _persist_image_result(
+                db,
+                {
+                    "content_uuid": uuid7_str(),
+                    "image_uuid": image_uuid,
+                    "job_uuid": job_uuid,
+                    "content": content_dict,
+                    "metadata": metadata_dict,
+                    "job_status": ExtractionStatus.SUCCESS,
+                    "job_end_time": end_time,
+                    "job_latency_ms": latency_ms,
+                    "job_cost": cost_metrics.calculated_cost,
+                },
             )
             db.commit()
-            mark_task_complete(image_uuid, job_uuid)
         except Exception as e:
-            end_time = datetime.now(timezone.utc)
-            latency_ms = int((end_time - start_time).total_seconds() * 1000)
+            _mark_image_extraction_failed(db, job_uuid, start_time, start_ns, cost_metrics.calculated_cost)
+            mark_task_failed(image_uuid, job_uuid)
+            logger.opt(exception=e).error(
+                "Failed to save extracted image {} for {}: {}", image_uuid, extractor_type, e
+            )
+            raise
+        mark_task_complete(image_uuid, job_uuid)
+
+
+@celery_app.task(acks_late=True)
+def process_images_batch(extractor_type: str, items: list):
+    """
+    Process several images with one local extractor in a single task: one session and
+    reader for the batch, one multi-row INSERT for the content and one UPDATE ... FROM VALUES
+    for the job updates. `items` are [job_uuid, image_uuid, file_path] triples. An image that fails
+    is marked failed and handed to process_image_with_extractor, which owns the retries.
+    """
+    reader = get_cached_image_reader(extractor_type)
+    retry_config = get_retry_config(extractor_type)
+    content_rows = []
+    finish_rows = []
+    completed = []
+    failed = []
+    # Items whose job this task claimed; jobs skipped by the claim belong to another worker
+    claimed = []
+
+    with get_db_session_context() as db:
+        for job_uuid, image_uuid, file_path in items:
+            start_time = datetime.now(timezone.utc)
+            start_ns = time.perf_counter_ns()
+            started = db.execute(
+                _IMAGE_JOB_START_STMT, {"job_uuid": job_uuid, "job_start_time": start_time}
+            )
+            if started.rowcount == 0:
+                logger.info(f"Job {job_uuid} is already running, already succeeded or no longer exists, skipping")
+                continue
+            claimed.append((job_uuid, image_uuid, file_path))
+
+            api_response = None
+            status = ExtractionStatus.SUCCESS
             try:
-                db.rollback()
-            except Exception:
-                pass
-            # Calculate cost even for failures (costs are still incurred)
+                local_file_path = _resolve_image_path(db, image_uuid, file_path)
+                result = reader.read(local_file_path)
+                if isinstance(result, dict) and "_api_response" in result:
+                    api_response = result["_api_response"]
+                content_dict, metadata_dict = _validate_image_result(extractor_type, result)
+            except Exception as e:
+                logger.opt(exception=e).error(
+                    "Failed to process image {} with {} in batch: {}", image_uuid, extractor_type, e
+                )
+                status = ExtractionStatus.FAILURE
+                failed.append((job_uuid, image_uuid, file_path))
+            else:
+                content_rows.append({
+                    "uuid": uuid7_str(),
+                    "image_file_uuid": image_uuid,
+                    "extraction_job_uuid": job_uuid,
+                    "content": content_dict,
+                    "metadata_": metadata_dict,
+                })
+                completed.append((job_uuid, image_uuid))
+
             usage_data = {"image_count": 1}
             cost_metrics = cost_calculator.calculate_cost(
                 extractor_name=extractor_type,
                 usage_data=usage_data,
                 api_response=api_response
             )
-            
-            try:
-                db.execute(
-                    update(ImageExtractionJob)
-                    .where(ImageExtractionJob.uuid == job_uuid)
-                    .values(
-                        status=ExtractionStatus.FAILURE,
-                        end_time=end_time,
-                        latency_ms=latency_ms,
-                        cost=cost_metrics.calculated_cost,
-                    )
-                )
-                db.commit()
-            except Exception:
-                pass
-            mark_task_failed(image_uuid, job_uuid)
-            logger.error(
-                f"Failed to process image {image_uuid} with {extractor_type}: {str(e)}"
+            if status == ExtractionStatus.SUCCESS:
+                track_usage_in_background(extractor_type, usage_data, cost_metrics, job_uuid)
+            end_time, latency_ms = _finish_times(start_time, start_ns)
+            finish_rows.append({
+                "job_uuid": job_uuid,
+                "job_status": status,
+                "job_end_time": end_time,
+                "job_latency_ms": latency_ms,
+                "job_cost": cost_metrics.calculated_cost,
+            })
+
+        try:
+            if content_rows:
+                db.execute(insert(ImageContent), content_rows)
+            if finish_rows:
+                db.execute(_image_jobs_finish_stmt(finish_rows))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.opt(exception=e).error(
+                "Failed to save image batch for {} ({} jobs): {}", extractor_type, len(finish_rows), e
             )
-            logger.error(f"Error type: {type(e).__name__}")
-            if hasattr(e, "__cause__") and e.__cause__:
-                logger.error(
-                    f"Caused by: {type(e.__cause__).__name__}: {str(e.__cause__)}"
-                )
-            retry_config = get_retry_config(extractor_type)
-            raise self.retry(
-                exc=e,
-                countdown=retry_config["countdown"],
-                max_retries=retry_config["max_retries"],
-            )
\ No newline at end of file
+            # Nothing was saved (the claims rolled back too); every image this task claimed goes
+            # through the single-image task instead
+            failed = claimed
+            completed = []
+
+    for job_uuid, image_uuid in completed:
+        mark_task_complete(image_uuid, job_uuid)
+    for job_uuid, image_uuid, file_path in failed:
+        mark_task_failed(image_uuid, job_uuid)
+        if retry_config["max_retries"] < 1:
+            continue
+        # The batch attempt counts as the first try
+        process_image_with_extractor.apply_async(
+            args=[job_uuid, image_uuid, file_path, extractor_type],
+            countdown=get_retry_backoff(retry_config, 0),
+            retries=1,
+            queue=get_extraction_queue(extractor_type),
+        )
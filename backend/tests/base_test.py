@@ -2,16 +2,11 @@
 Base test utilities and fixtures for PDF extractors.
 Provides common test utilities and setup using pytest.
 """
-import os
-import sys
 import pytest
 from pathlib import Path
 from typing import Dict, Any
 
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from src.interface import PDFExtractorInterface
+from src.extractor.pdf.interface import PDFExtractorInterface
 
 
 @pytest.fixture
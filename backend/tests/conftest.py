@@ -1,13 +1,10 @@
 """
 Pytest configuration and shared fixtures for PDF extractor tests.
 """
+import importlib
 import os
-import sys
 import pytest
 
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 
 @pytest.fixture(scope="session")
 def test_pdf_path():
@@ -16,73 +13,113 @@ def test_pdf_path():
     return os.getenv('TEST_PDF_PATH', None)
 
 
+# Extractor fixture name -> (module, class). Modules are imported only when a test asks for
+# that extractor, so heavy optional dependencies (camelot, tesseract, ...) load on demand.
+_EXTRACTOR_CLASSES = {
+    'markitdown_extractor': ('src.extractor.pdf.markitdown_extractor', 'MarkItDownExtractor'),
+    'llamaparse_extractor': ('src.extractor.pdf.llamaparse', 'LlamaParseExtractor'),
+    'unstructured_extractor': ('src.extractor.pdf.unstructured_extractor', 'UnstructuredExtractor'),
+    'pypdf2_extractor': ('src.extractor.pdf.pypdf2_extractor', 'PyPDF2Extractor'),
+    'pymupdf_extractor': ('src.extractor.pdf.pymupdf_extractor', 'PyMuPDFExtractor'),
+    'pdfplumber_extractor': ('src.extractor.pdf.pdfplumber_extractor', 'PDFPlumberExtractor'),
+    'camelot_extractor': ('src.extractor.pdf.camelot_extractor', 'CamelotExtractor'),
+    'tesseract_extractor': ('src.extractor.pdf.tesseract_extractor', 'TesseractExtractor'),
+    'tesseract_image_extractor': ('src.extractor.image.tesseract_extractor', 'TesseractImageExtractor'),
+}
+
+
+def _make_extractor(name):
+    """
+    Import and instantiate the extractor registered under fixture `name`.
+
+    Extractors whose class is currently disabled (commented out in its module, e.g. Camelot
+    and Unstructured) skip the requesting test instead of erroring.
+    """
+    module_name, class_name = _EXTRACTOR_CLASSES[name]
+    extractor_class = getattr(importlib.import_module(module_name), class_name, None)
+    if extractor_class is None:
+        pytest.skip(f"{class_name} is disabled in {module_name}")
+    return extractor_class()
+
+
 @pytest.fixture
 def markitdown_extractor():
     """Fixture for MarkItDown extractor."""
-    from src.extractors.markitdown_extractor import MarkItDownExtractor
-    return MarkItDownExtractor()
+    return _make_extractor('markitdown_extractor')
 
 
 @pytest.fixture
 def llamaparse_extractor():
     """Fixture for LlamaParse extractor."""
-    from src.extractors.llamaparse import LlamaParseExtractor
-    return LlamaParseExtractor()
+    return _make_extractor('llamaparse_extractor')
 
 
 @pytest.fixture
 def unstructured_extractor():
     """Fixture for Unstructured extractor."""
-    from src.extractors.unstructured_extractor import UnstructuredExtractor
-    return UnstructuredExtractor()
+    return _make_extractor('unstructured_extractor')
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pypdf2_extractor():
     """Fixture for PyPDF2 extractor."""
-    from src.extractors.pypdf2_extractor import PyPDF2Extractor
-    return PyPDF2Extractor()
+    return _make_extractor('pypdf2_extractor')
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pymupdf_extractor():
     """Fixture for PyMuPDF extractor."""
-    from src.extractors.pymupdf_extractor import PyMuPDFExtractor
-    return PyMuPDFExtractor()
+    return _make_extractor('pymupdf_extractor')
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pdfplumber_extractor():
     """Fixture for PDFPlumber extractor."""
-    from src.extractors.pdfplumber_extractor import PDFPlumberExtractor
-    return PDFPlumberExtractor()
+    return _make_extractor('pdfplumber_extractor')
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def camelot_extractor():
     """Fixture for Camelot extractor."""
-    from src.extractors.camelot_extractor import CamelotExtractor
-    return CamelotExtractor()
+    return _make_extractor('camelot_extractor')
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tesseract_extractor():
     """Fixture for Tesseract extractor."""
-    from src.extractors.tesseract_extractor import TesseractExtractor
-    return TesseractExtractor()
-
-
-# Parametrized fixture for all extractors
-@pytest.fixture(params=[
-    'markitdown_extractor',
-    'llamaparse_extractor', 
-    'unstructured_extractor',
-    'pypdf2_extractor',
-    'pymupdf_extractor',
-    'pdfplumber_extractor',
-    'camelot_extractor',
-    'tesseract_extractor'
-])
+    # One OpenMP thread per tesseract process; parallel test runs would otherwise oversubscribe
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+    return _make_extractor('tesseract_extractor')
+
+
+@pytest.fixture(scope="session")
+def tesseract_image_extractor():
+    """Fixture for Tesseract image extractor."""
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+    return _make_extractor('tesseract_image_extractor')
+
+
+# Per-read state that shared (session/module-scoped) extractors carry between tests
+_EXTRACTOR_STATE_ATTRS = ('_last_result', '_job_id')
+
+
+@pytest.fixture(autouse=True)
+def _reset_extractor_state(request):
+    """Clear per-read state on the extractors a test used so shared instances start clean."""
+    yield
+    funcargs = getattr(request.node, 'funcargs', {})
+    for name, value in funcargs.items():
+        if name not in ('extractor', 'any_extractor') and name not in _EXTRACTOR_CLASSES:
+            continue
+        for attr in _EXTRACTOR_STATE_ATTRS:
+            if hasattr(value, attr):
+                setattr(value, attr, None)
+
+
+# Parametrized fixture for all extractors. The parameter is an extractor fixture name, resolved
+# through that fixture so its scope (session for the local extractors) is honoured; tests can
+# narrow the set with @pytest.mark.parametrize("any_extractor", [...], indirect=True).
+@pytest.fixture(params=list(_EXTRACTOR_CLASSES))
 def any_extractor(request):
     """Parametrized fixture that provides any extractor."""
     return request.getfixturevalue(request.param)
@@ -4,42 +4,48 @@ Tests for existing PDF extractors using pytest.
 import os
 import sys
 import pytest
-from unittest.mock import patch, MagicMock
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import SimpleNamespace
+from unittest.mock import patch, Mock
 
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+# Mocked library objects are plain stubs exposing only what the extractors touch;
+# MagicMock is kept for patched modules and where calls are asserted.
+def _text_page(text, tables=None):
+    """Page stub with extract_text()/get_text() (and extract_tables() when given)."""
+    page = SimpleNamespace(extract_text=lambda: text, get_text=lambda: text)
+    if tables is not None:
+        page.extract_tables = lambda: tables
+    return page
 
-def test_pypdf2_get_information(pypdf2_extractor):
-    """Test that get_information returns correct information."""
-    info = pypdf2_extractor.get_information()
-    
-    assert info['name'] == 'PyPDF2'
-    assert info['type'] == 'sync'
-    assert 'text' in info['supports']
-    assert 'PyPDF2' in info['description']
 
+class _FakeFitzDocument:
+    """Just enough of a fitz.Document: page_count, indexing and a recorded close()."""
+
+    def __init__(self, pages):
+        self._pages = pages
+        self.page_count = len(pages)
+        self.close = Mock()
+
+    def __getitem__(self, index):
+        return self._pages[index]
 
-@patch('src.extractors.pypdf2_extractor.PdfReader')
-def test_pypdf2_read_success(pypdf2_extractor, mock_pdf_reader):
+
+@patch('src.extractor.pdf.pypdf2_extractor.PdfReader')
+def test_pypdf2_read_success(mock_pdf_reader, pypdf2_extractor):
     """Test successful PDF reading with PyPDF2."""
     # Mock PDF reader and pages
-    mock_page1 = MagicMock()
-    mock_page1.extract_text.return_value = "Page 1 content"
-    
-    mock_page2 = MagicMock()
-    mock_page2.extract_text.return_value = "Page 2 content"
-    
-    mock_reader = MagicMock()
-    mock_reader.pages = [mock_page1, mock_page2]
-    mock_pdf_reader.return_value = mock_reader
+    mock_pdf_reader.return_value = SimpleNamespace(
+        pages=[_text_page("Page 1 content"), _text_page("Page 2 content")]
+    )
     
     # Test the extraction
     result = pypdf2_extractor.read("test.pdf")
     
     # Verify the result
-    assert result is True
-    assert pypdf2_extractor._last_result is not None
+    assert result
+    assert result is pypdf2_extractor._last_result
     
     # Check the stored result structure
     stored_result = pypdf2_extractor._last_result
@@ -58,38 +64,19 @@ def test_pypdf2_read_success(pypdf2_extractor, mock_pdf_reader):
     assert page2_data['content']['TEXT'] == 'Page 2 content'
 
 
-def test_pymupdf_get_information(pymupdf_extractor):
-    """Test that get_information returns correct information."""
-    info = pymupdf_extractor.get_information()
-    
-    assert info['name'] == 'PyMuPDF'
-    assert info['type'] == 'sync'
-    assert 'text' in info['supports']
-    assert 'PyMuPDF' in info['description']
-
-
-@patch('src.extractors.pymupdf_extractor.fitz')
-def test_pymupdf_read_success(pymupdf_extractor, mock_fitz):
+@patch('src.extractor.pdf.pymupdf_extractor.fitz')
+def test_pymupdf_read_success(mock_fitz, pymupdf_extractor):
     """Test successful PDF reading with PyMuPDF."""
     # Mock PDF document
-    mock_doc = MagicMock()
-    mock_doc.page_count = 2
-    
-    mock_page1 = MagicMock()
-    mock_page1.get_text.return_value = "Page 1 content"
-    
-    mock_page2 = MagicMock()
-    mock_page2.get_text.return_value = "Page 2 content"
-    
-    mock_doc.__getitem__.side_effect = lambda x: [mock_page1, mock_page2][x]
+    mock_doc = _FakeFitzDocument([_text_page("Page 1 content"), _text_page("Page 2 content")])
     mock_fitz.open.return_value = mock_doc
     
     # Test the extraction
     result = pymupdf_extractor.read("test.pdf")
     
     # Verify the result
-    assert result is True
-    assert pymupdf_extractor._last_result is not None
+    assert result
+    assert result is pymupdf_extractor._last_result
     
     # Check the stored result structure
     stored_result = pymupdf_extractor._last_result
@@ -108,82 +95,53 @@ def test_pymupdf_read_success(pymupdf_extractor, mock_fitz):
     mock_doc.close.assert_called_once()
 
 
-def test_pdfplumber_get_information(pdfplumber_extractor):
-    """Test that get_information returns correct information."""
-    info = pdfplumber_extractor.get_information()
-    
-    assert info['name'] == 'pdfplumber'
-    assert info['type'] == 'sync'
-    assert 'combined' in info['supports']
-    assert 'tables' in info['supports']
-    assert 'PDFPlumber' in info['description']
-
-
-@patch('src.extractors.pdfplumber_extractor.pdfplumber')
-def test_pdfplumber_read_success(pdfplumber_extractor, mock_pdfplumber):
+@patch('src.extractor.pdf.pdfplumber_extractor.pdfplumber')
+def test_pdfplumber_read_success(mock_pdfplumber, pdfplumber_extractor):
     """Test successful PDF reading with PDFPlumber."""
     # Mock PDF and pages
-    mock_page1 = MagicMock()
-    mock_page1.extract_text.return_value = "Page 1 text content"
-    mock_page1.extract_tables.return_value = [
-        [['Header1', 'Header2'], ['Value1', 'Value2']]
-    ]
-    
-    mock_page2 = MagicMock()
-    mock_page2.extract_text.return_value = "Page 2 text content"
-    mock_page2.extract_tables.return_value = []
-    
-    mock_pdf = MagicMock()
-    mock_pdf.pages = [mock_page1, mock_page2]
+    mock_page1 = _text_page(
+        "Page 1 text content", tables=[[['Header1', 'Header2'], ['Value1', 'Value2']]]
+    )
+    mock_page2 = _text_page("Page 2 text content", tables=[])
+    mock_pdf = SimpleNamespace(pages=[mock_page1, mock_page2])
     mock_pdfplumber.open.return_value.__enter__.return_value = mock_pdf
     
     # Test the extraction
     result = pdfplumber_extractor.read("test.pdf")
     
     # Verify the result
-    assert result is True
-    assert pdfplumber_extractor._last_result is not None
+    assert result
+    assert result is pdfplumber_extractor._last_result
     
     # Check the stored result structure
     stored_result = pdfplumber_extractor._last_result
     assert 1 in stored_result
     assert 2 in stored_result
     
-    # Check page 1
+    # Check page 1: text and table, so COMBINED joins both
     page1_data = stored_result[1]
     content = page1_data['content']
-    assert content['COMBINED'] == 'Page 1 text content'
-    assert 'Header1' in content['TABLE']
-    assert 'Value1' in content['TABLE']
+    assert content['TEXT'] == 'Page 1 text content'
+    assert content['TABLE'] == 'Header1 | Header2\nValue1 | Value2'
+    assert content['COMBINED'] == 'Page 1 text content\n\nHeader1 | Header2\nValue1 | Value2'
     
-    # Check page 2
+    # Check page 2: text only, so neither TABLE nor COMBINED is set
     page2_data = stored_result[2]
-    content = page2_data['content']
-    assert content['COMBINED'] == 'Page 2 text content'
-    assert content['TABLE'] == ''
+    assert page2_data['content'] == {'TEXT': 'Page 2 text content'}
 
 
-def test_camelot_get_information(camelot_extractor):
-    """Test that get_information returns correct information."""
-    info = camelot_extractor.get_information()
-    
-    assert info['name'] == 'Camelot'
-    assert info['type'] == 'sync'
-    assert 'tables' in info['supports']
-    assert 'Camelot' in info['description']
-
-
-@patch('src.extractors.camelot_extractor.camelot_py')
-def test_camelot_read_success(camelot_extractor, mock_camelot):
+@patch('src.extractor.pdf.camelot_extractor.camelot_py')
+def test_camelot_read_success(mock_camelot, camelot_extractor):
     """Test successful PDF reading with Camelot."""
     # Mock table objects
-    mock_table1 = MagicMock()
-    mock_table1.page = 1
-    mock_table1.df.to_string.return_value = "| Col1 | Col2 |\n|------|------|\n| A    | B    |"
-    
-    mock_table2 = MagicMock()
-    mock_table2.page = 2
-    mock_table2.df.to_string.return_value = "| Col3 | Col4 |\n|------|------|\n| C    | D    |"
+    mock_table1 = SimpleNamespace(
+        page=1,
+        df=SimpleNamespace(to_string=lambda: "| Col1 | Col2 |\n|------|------|\n| A    | B    |"),
+    )
+    mock_table2 = SimpleNamespace(
+        page=2,
+        df=SimpleNamespace(to_string=lambda: "| Col3 | Col4 |\n|------|------|\n| C    | D    |"),
+    )
     
     mock_camelot.read_pdf.return_value = [mock_table1, mock_table2]
     
@@ -191,8 +149,8 @@ def test_camelot_read_success(camelot_extractor, mock_camelot):
     result = camelot_extractor.read("test.pdf")
     
     # Verify the result
-    assert result is True
-    assert camelot_extractor._last_result is not None
+    assert result
+    assert result is camelot_extractor._last_result
     
     # Check the stored result structure
     stored_result = camelot_extractor._last_result
@@ -211,90 +169,80 @@ def test_camelot_read_success(camelot_extractor, mock_camelot):
     assert page2_data['metadata']['tables_found'] == 1
 
 
-def test_tesseract_get_information(tesseract_extractor):
-    """Test that get_information returns correct information."""
-    info = tesseract_extractor.get_information()
-    
-    assert info['name'] == 'Tesseract'
-    assert info['type'] == 'sync'
-    assert 'text' in info['supports']
-    assert 'Tesseract' in info['description']
+def _fitz_pages(count):
+    """Page stubs for fitz.open(): page.number plus a get_pixmap() whose save() is a no-op."""
+    pixmap = SimpleNamespace(save=lambda path: None)
+    return [SimpleNamespace(number=i, get_pixmap=lambda dpi: pixmap) for i in range(count)]
 
 
-@patch('src.extractors.tesseract_extractor.convert_from_path')
-@patch('src.extractors.tesseract_extractor.pytesseract')
-@patch('src.extractors.tesseract_extractor.Image')
-def test_tesseract_read_success_pdf(tesseract_extractor, mock_image, mock_pytesseract, mock_convert):
-    """Test successful PDF reading with Tesseract."""
-    # Mock image conversion
-    mock_img1 = MagicMock()
-    mock_img2 = MagicMock()
-    mock_convert.return_value = [mock_img1, mock_img2]
-    
-    # Mock OCR results
-    mock_pytesseract.image_to_string.side_effect = [
-        "Page 1 OCR text",
-        "Page 2 OCR text"
-    ]
+# Tesseract emits one form-feed-terminated segment per page of the image list
+@pytest.mark.parametrize("ocr_output,expected_texts", [
+    ("Page 1 OCR text\fPage 2 OCR text\fPage 3 OCR text\f", ['Page 1 OCR text', 'Page 2 OCR text', 'Page 3 OCR text']),
+    ("Page 1 OCR text\f\fPage 3 OCR text", ['Page 1 OCR text', '', 'Page 3 OCR text']),
+    ("Page 1 OCR text\fPage 2 OCR text", ['Page 1 OCR text', 'Page 2 OCR text', '']),
+], ids=["trailing_form_feed", "blank_middle_page", "short_result"])
+@patch('src.extractor.pdf.tesseract_extractor.pytesseract.image_to_string')
+@patch('src.extractor.pdf.tesseract_extractor.fitz.open')
+def test_tesseract_read_success_pdf(mock_fitz_open, mock_image_to_string, tesseract_extractor,
+                                    ocr_output, expected_texts):
+    """Test that Tesseract OCRs every page of a PDF in one run and maps the output back to pages."""
+    mock_fitz_open.return_value = nullcontext(_fitz_pages(3))
+    
+    # The image list only exists during read(), so capture it from inside the OCR call
+    listed_images = []
+    
+    def fake_image_to_string(list_path):
+        with open(list_path) as f:
+            listed_images.extend(f.read().split())
+        return ocr_output
+    
+    mock_image_to_string.side_effect = fake_image_to_string
     
     # Test the extraction
     result = tesseract_extractor.read("test.pdf")
     
-    # Verify the result
-    assert result is True
-    assert tesseract_extractor._last_result is not None
+    # One tesseract run over a list of all three page images, in page order
+    mock_image_to_string.assert_called_once()
+    assert [os.path.basename(path) for path in listed_images] == ['page_1.png', 'page_2.png', 'page_3.png']
     
-    # Check the stored result structure
-    stored_result = tesseract_extractor._last_result
-    assert 1 in stored_result
-    assert 2 in stored_result
-    
-    # Check page 1
-    page1_data = stored_result[1]
-    assert page1_data['content']['TEXT'] == 'Page 1 OCR text'
-    assert page1_data['metadata']['extractor'] == 'Tesseract'
-    
-    # Check page 2
-    page2_data = stored_result[2]
-    assert page2_data['content']['TEXT'] == 'Page 2 OCR text'
+    # One entry per PDF page, never per OCR segment (the trailing empty segment is dropped)
+    assert result is tesseract_extractor._last_result
+    assert sorted(result) == [1, 2, 3]
+    for page_number, expected_text in enumerate(expected_texts, 1):
+        assert result[page_number]['content']['TEXT'] == expected_text
+        assert result[page_number]['metadata'] == {'extractor': 'Tesseract', 'page_number': page_number}
 
 
-@patch('src.extractors.tesseract_extractor.Image')
-@patch('src.extractors.tesseract_extractor.pytesseract')
-def test_tesseract_read_success_image(tesseract_extractor, mock_pytesseract, mock_image):
+@patch('src.extractor.image.tesseract_extractor.Image')
+@patch('src.extractor.image.tesseract_extractor.pytesseract')
+def test_tesseract_read_success_image(mock_pytesseract, mock_image, tesseract_image_extractor):
     """Test successful image reading with Tesseract."""
     # Mock image opening
-    mock_img = MagicMock()
-    mock_image.open.return_value = mock_img
+    mock_image.open.return_value = SimpleNamespace(width=640, height=480)
     
     # Mock OCR result
-    mock_pytesseract.image_to_string.return_value = "Image OCR text"
+    mock_pytesseract.image_to_string.return_value = "Image OCR text\n"
     
     # Test the extraction
-    result = tesseract_extractor.read("test.jpg")
+    result = tesseract_image_extractor.read("test.jpg")
     
     # Verify the result
-    assert result is True
-    assert tesseract_extractor._last_result is not None
-    
-    # Check the stored result structure
-    stored_result = tesseract_extractor._last_result
-    assert 1 in stored_result
-    page1_data = stored_result[1]
-    assert page1_data['content']['TEXT'] == 'Image OCR text'
+    assert result is tesseract_image_extractor._last_result
+    assert result['content']['TEXT'] == 'Image OCR text'
+    assert result['metadata'] == {'extractor': 'Tesseract', 'width': 640, 'height': 480}
 
 
-# Parametrized tests for all extractors
-@pytest.mark.parametrize("extractor_name", [
-    'pypdf2_extractor',
-    'pymupdf_extractor', 
-    'pdfplumber_extractor',
-    'camelot_extractor',
-    'tesseract_extractor'
-])
-def test_all_extractors_interface(extractor_name, request):
-    """Test that all extractors implement the required interface."""
-    extractor = request.getfixturevalue(extractor_name)
+# Parametrized tests for all extractors: (fixture, name, supports subset, description substring)
+@pytest.mark.parametrize("any_extractor,expected_name,expected_supports,desc_substr", [
+    ('pypdf2_extractor', 'PyPDF2', {'text'}, 'PyPDF2'),
+    ('pymupdf_extractor', 'PyMuPDF', {'text'}, 'PyMuPDF'),
+    ('pdfplumber_extractor', 'PDFPlumber', {'combined', 'tables'}, 'PDFPlumber'),
+    ('camelot_extractor', 'Camelot', {'tables'}, 'Camelot'),
+    ('tesseract_extractor', 'Tesseract', {'text'}, 'Tesseract'),
+], indirect=['any_extractor'])
+def test_all_extractors_interface(any_extractor, expected_name, expected_supports, desc_substr):
+    """Test that all extractors implement the required interface and describe themselves correctly."""
+    extractor = any_extractor
     
     # Test interface methods
     assert hasattr(extractor, 'get_information')
@@ -311,6 +259,10 @@ def test_all_extractors_interface(extractor_name, request):
     assert 'type' in info
     assert 'supports' in info
     assert 'description' in info
+    assert info['name'] == expected_name
+    assert info['type'] == 'sync'
+    assert expected_supports <= set(info['supports'])
+    assert desc_substr in info['description']
     
     # Test get_status
     status = extractor.get_status("test_job_id")
@@ -321,44 +273,72 @@ def test_all_extractors_interface(extractor_name, request):
     assert isinstance(supports, bool)
 
 
+def _exercise_extractor(name, extractor, pdf_path):
+    """
+    Run one extractor end to end.
+
+    Returns the report lines for the caller to print.
+    """
+    lines = [f"\n--- Testing {name} ---"]
+    try:
+        # Test basic functionality
+        info = extractor.get_information()
+        lines.append(f"  Info: {info['name']} - {info['description']}")
+        
+        # Test extraction (this might fail for some extractors without proper setup)
+        result = extractor.read(pdf_path)
+        lines.append(f"  Read result: {result}")
+        
+        status = extractor.get_status("test_job")
+        lines.append(f"  Status: {status}")
+        
+        extraction_result = extractor.get_result("test_job")
+        if isinstance(extraction_result, dict):
+            lines.append(f"  Pages extracted: {len(extraction_result)}")
+        else:
+            lines.append(f"  Result type: {type(extraction_result)}")
+            
+    except Exception as e:
+        lines.append(f"  Error: {e}")
+    return lines
+
+
 # Test with real file if provided
 @pytest.mark.real_file
-def test_all_extractors_with_real_file(test_pdf_path, pypdf2_extractor, pymupdf_extractor, 
-                                      pdfplumber_extractor, camelot_extractor, tesseract_extractor):
+def test_all_extractors_with_real_file(request, test_pdf_path):
     """Test all extractors with a real PDF file."""
     if not test_pdf_path:
         pytest.skip("No PDF file provided")
     
-    extractors = [
-        ('PyPDF2', pypdf2_extractor),
-        ('PyMuPDF', pymupdf_extractor),
-        ('PDFPlumber', pdfplumber_extractor),
-        ('Camelot', camelot_extractor),
-        ('Tesseract', tesseract_extractor)
-    ]
-    
-    for name, extractor in extractors:
-        print(f"\n--- Testing {name} ---")
+    extractors = []
+    for name, fixture_name in [
+        ('PyPDF2', 'pypdf2_extractor'),
+        ('PyMuPDF', 'pymupdf_extractor'),
+        ('PDFPlumber', 'pdfplumber_extractor'),
+        ('Camelot', 'camelot_extractor'),
+        ('Tesseract', 'tesseract_extractor'),
+    ]:
+        # Extractors disabled in their module skip through the conftest fixture; report them
+        # here instead of skipping the whole smoke test
         try:
-            # Test basic functionality
-            info = extractor.get_information()
-            print(f"  Info: {info['name']} - {info['description']}")
-            
-            # Test extraction (this might fail for some extractors without proper setup)
-            result = extractor.read(test_pdf_path)
-            print(f"  Read result: {result}")
-            
-            status = extractor.get_status("test_job")
-            print(f"  Status: {status}")
-            
-            extraction_result = extractor.get_result("test_job")
-            if isinstance(extraction_result, dict):
-                print(f"  Pages extracted: {len(extraction_result)}")
-            else:
-                print(f"  Result type: {type(extraction_result)}")
-                
-        except Exception as e:
-            print(f"  Error: {e}")
+            extractors.append((name, request.getfixturevalue(fixture_name)))
+        except pytest.skip.Exception as skipped:
+            print(f"\n--- Skipping {name}: {skipped.msg} ---")
+    
+    # The extractors spend their time in native code or the tesseract subprocess, so run
+    # them side by side (the tesseract_extractor fixture caps OpenMP at one thread).
+    with ThreadPoolExecutor(max_workers=len(extractors)) as executor:
+        futures = [
+            executor.submit(_exercise_extractor, name, extractor, test_pdf_path)
+            for name, extractor in extractors
+        ]
+        for future in as_completed(futures):
+            print("\n".join(future.result()))
+
+
+def _verbosity_args():
+    """Per-test output only when VERBOSE is set; the default run prints a compact summary."""
+    return ['-v'] if os.environ.get('VERBOSE') else ['-q']
 
 
 if __name__ == '__main__':
@@ -372,9 +352,9 @@ if __name__ == '__main__':
             os.environ['TEST_PDF_PATH'] = test_file
             
             # Run pytest
-            pytest.main([__file__, '-v'])
+            pytest.main([__file__] + _verbosity_args())
         else:
             print(f"File not found: {test_file}")
     else:
         # Run all tests with mocks
-        pytest.main([__file__, '-v'])
+        pytest.main([__file__] + _verbosity_args())
@@ -4,74 +4,102 @@ Provides a unified interface to run all tests with different configurations.
 """
 import os
 import sys
-import subprocess
 import argparse
+import importlib.util
 from pathlib import Path
+from types import MappingProxyType
 
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import pytest
 
+# pytest runs from here so tests/ and pytest.ini resolve; fixed for the life of the process
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-def run_pytest_tests(pdf_file=None, extractor=None, mock_only=False, real_only=False, verbose=False):
-    """Run pytest tests with specified options."""
-    cmd = ['python', '-m', 'pytest']
+# --extractor name (lowercase) -> test file or node id prefix to run
+_EXTRACTOR_TESTS = MappingProxyType({
+    'markitdown': 'test_markitdown_extractor.py',
+    'llamaparse': 'test_llamaparse_extractor.py',
+    'unstructured': 'test_unstructured_extractor.py',
+    'pypdf2': 'test_existing_extractors.py::test_pypdf2',
+    'pymupdf': 'test_existing_extractors.py::test_pymupdf',
+    'pdfplumber': 'test_existing_extractors.py::test_pdfplumber',
+    'camelot': 'test_existing_extractors.py::test_camelot',
+    'tesseract': 'test_existing_extractors.py::test_tesseract'
+})
+_EXTRACTOR_LIST = ', '.join(_EXTRACTOR_TESTS)
+
+# Plugins the mock-only pass never uses: the runner never passes --lf/--ff, so the cache
+# plugin has nothing to do, and the suite has no doctests
+_FAST_FLAGS = ['-p', 'no:cacheprovider', '-p', 'no:doctest', '--no-header']
+
+
+def run_pytest_tests(pdf_file=None, extractor=None, mock_only=False, real_only=False, verbose=False,
+                     jobs='auto'):
+    """
+    Run pytest tests with specified options.
+
+    pytest runs in this interpreter (pytest.main) rather than a `python -m pytest`
+    subprocess, so consecutive runs from run_all_tests share already-imported modules.
+    """
+    args = []
     
     # Add verbosity
     if verbose:
-        cmd.append('-v')
+        args.append('-v')
     else:
-        cmd.append('-q')
+        args.append('-q')
+    
+    # Spread tests over `jobs` worker processes (0 = serial); loadfile keeps each test
+    # module on one worker so its module/session fixtures are built once
+    if importlib.util.find_spec('xdist') is None:
+        print("⚠️  pytest-xdist not installed, running tests serially")
+    elif jobs is not None:
+        args.extend(['-n', str(jobs), '--dist=loadfile'])
     
     # Add markers for test selection
     if mock_only:
-        cmd.extend(['-m', 'not real_file'])
+        args.extend(['-m', 'not real_file'])
+        args.extend(_FAST_FLAGS)
     elif real_only:
-        cmd.extend(['-m', 'real_file'])
+        args.extend(['-m', 'real_file'])
     
     # Add PDF file if provided
     if pdf_file:
-        cmd.extend(['--pdf-file', pdf_file])
+        args.extend(['--pdf-file', pdf_file])
     
     # Add specific test file if extractor specified
     if extractor:
-        test_files = {
-            'markitdown': 'test_markitdown_extractor.py',
-            'llamaparse': 'test_llamaparse_extractor.py',
-            'unstructured': 'test_unstructured_extractor.py',
-            'pypdf2': 'test_existing_extractors.py::test_pypdf2',
-            'pymupdf': 'test_existing_extractors.py::test_pymupdf',
-            'pdfplumber': 'test_existing_extractors.py::test_pdfplumber',
-            'camelot': 'test_existing_extractors.py::test_camelot',
-            'tesseract': 'test_existing_extractors.py::test_tesseract'
-        }
-        
-        if extractor.lower() in test_files:
-            cmd.append(test_files[extractor.lower()])
+        test_file = _EXTRACTOR_TESTS.get(extractor.lower())
+        if test_file:
+            args.append(test_file)
         else:
             print(f"❌ Unknown extractor: {extractor}")
-            print(f"Available extractors: {', '.join(test_files.keys())}")
+            print(f"Available extractors: {_EXTRACTOR_LIST}")
             return False
     
     # Add test directory
-    cmd.append('tests/')
+    args.append('tests/')
     
-    print(f"🧪 Running: {' '.join(cmd)}")
+    print(f"🧪 Running: pytest {' '.join(args)}")
     
+    # Paths and pytest.ini are relative to the backend directory
+    previous_cwd = os.getcwd()
     try:
-        result = subprocess.run(cmd, cwd=os.path.dirname(os.path.dirname(__file__)))
-        return result.returncode == 0
+        os.chdir(_BACKEND_DIR)
+        return pytest.main(args) == 0
     except Exception as e:
         print(f"❌ Error running tests: {e}")
         return False
+    finally:
+        os.chdir(previous_cwd)
 
 
-def run_mock_tests():
+def run_mock_tests(jobs='auto'):
     """Run all tests with mocked dependencies."""
     print("🧪 Running mock tests (no external dependencies)...")
-    return run_pytest_tests(mock_only=True, verbose=True)
+    return run_pytest_tests(mock_only=True, verbose=True, jobs=jobs)
 
 
-def run_real_file_tests(pdf_file_path):
+def run_real_file_tests(pdf_file_path, jobs='auto'):
     """Run tests with a real PDF file."""
     print(f"📄 Running real file tests with: {pdf_file_path}")
     
@@ -79,39 +107,56 @@ def run_real_file_tests(pdf_file_path):
         print(f"❌ File not found: {pdf_file_path}")
         return False
     
-    return run_pytest_tests(pdf_file=pdf_file_path, real_only=True, verbose=True)
+    return run_pytest_tests(pdf_file=pdf_file_path, real_only=True, verbose=True, jobs=jobs)
 
 
-def run_specific_extractor_tests(extractor_name, pdf_file_path=None):
+def run_specific_extractor_tests(extractor_name, pdf_file_path=None, jobs='auto'):
     """Run tests for a specific extractor."""
     print(f"🎯 Running tests for {extractor_name}...")
     
     return run_pytest_tests(
         pdf_file=pdf_file_path, 
         extractor=extractor_name, 
-        verbose=True
+        verbose=True,
+        jobs=jobs
     )
 
 
-def run_all_tests(pdf_file_path=None):
+def run_all_tests(pdf_file_path=None, jobs='auto'):
     """Run all tests."""
     print("🔄 Running all tests...")
     
+    # Check the file once, before spending a mock pass on a run that cannot complete
+    if pdf_file_path and not os.path.exists(pdf_file_path):
+        print(f"❌ File not found: {pdf_file_path}")
+        return False
+    
     # First run mock tests
     print("\n1️⃣ Running mock tests...")
-    mock_success = run_pytest_tests(mock_only=True, verbose=True)
+    mock_success = run_pytest_tests(mock_only=True, verbose=True, jobs=jobs)
     
     # Then run real file tests if file provided
     real_success = True
     if pdf_file_path:
         print(f"\n2️⃣ Running real file tests with: {pdf_file_path}")
-        real_success = run_pytest_tests(pdf_file=pdf_file_path, real_only=True, verbose=True)
+        real_success = run_pytest_tests(pdf_file=pdf_file_path, real_only=True, verbose=True, jobs=jobs)
     else:
         print("\n💡 Tip: Use --file to test with a real PDF file")
     
     return mock_success and real_success
 
 
+def _validate_args(args):
+    """Return an error message for an unusable option combination, or None."""
+    if args.mock_only and args.real_only:
+        return "--mock-only and --real-only cannot be combined"
+    if args.real_only and not args.file:
+        return "Real file tests require --file argument"
+    if args.extractor and args.extractor.lower() not in _EXTRACTOR_TESTS:
+        return f"Unknown extractor: {args.extractor} (available: {_EXTRACTOR_LIST})"
+    return None
+
+
 def main():
     """Main test runner function."""
     parser = argparse.ArgumentParser(description='PDF Extractor Test Runner (pytest-based)')
@@ -120,9 +165,17 @@ def main():
     parser.add_argument('--mock-only', action='store_true', help='Run only mock tests')
     parser.add_argument('--real-only', action='store_true', help='Run only real file tests')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
+    parser.add_argument('--jobs', '-j', default='auto',
+                        help="Parallel pytest-xdist workers, 'auto' for one per CPU or 0 for serial")
     
     args = parser.parse_args()
     
+    # Reject bad option combinations before any pytest run starts
+    error = _validate_args(args)
+    if error:
+        print(f"❌ {error}")
+        return 2
+    
     print("🚀 PDF Extractor Test Runner (pytest)")
     print("=" * 50)
     
@@ -130,22 +183,19 @@ def main():
     
     if args.mock_only:
         # Run only mock tests
-        success = run_mock_tests()
+        success = run_mock_tests(args.jobs)
         
     elif args.real_only:
         # Run only real file tests
-        if not args.file:
-            print("❌ Real file tests require --file argument")
-            return 1
-        success = run_real_file_tests(args.file)
+        success = run_real_file_tests(args.file, args.jobs)
         
     elif args.extractor:
         # Run specific extractor tests
-        success = run_specific_extractor_tests(args.extractor, args.file)
+        success = run_specific_extractor_tests(args.extractor, args.file, args.jobs)
         
     else:
         # Run all tests
-        success = run_all_tests(args.file)
+        success = run_all_tests(args.file, args.jobs)
     
     print("\n" + "=" * 50)
     if success:
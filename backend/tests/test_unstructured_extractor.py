@@ -1,21 +1,84 @@
 """
 Tests for Unstructured extractor using pytest.
 """
+import importlib
 import os
 import sys
 import pytest
-from unittest.mock import patch, MagicMock
+from functools import lru_cache
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from src.extractors.unstructured_extractor import UnstructuredExtractor
+# Element texts for the standard mocked page, shared by the fixture and the assertions
+TEXT_SAMPLE = "This is text content."
+TABLE_SAMPLE = "| Col1 | Col2 |\n|------|------|\n| A    | B    |"
+TITLE_SAMPLE = "Document Title"
 
 
-@pytest.fixture
-def extractor():
-    """Fixture for Unstructured extractor."""
-    return UnstructuredExtractor()
+@pytest.fixture(scope="session")
+def unstructured_module():
+    """
+    The Unstructured extractor module, imported only when a test needs it.
+
+    Every test depends on it (through mock_partition_pdf), so the whole file skips while
+    the extractor class is commented out of the module.
+    """
+    module = importlib.import_module('src.extractor.pdf.unstructured_extractor')
+    if not hasattr(module, 'UnstructuredExtractor'):
+        pytest.skip("UnstructuredExtractor is disabled in src.extractor.pdf.unstructured_extractor")
+    return module
+
+
+@pytest.fixture(scope="session")
+def extractor(unstructured_module):
+    """
+    Fixture for Unstructured extractor, built once per session.
+
+    Tests only change its per-read state (_last_result), which conftest's autouse
+    _reset_extractor_state clears after every test.
+    """
+    return unstructured_module.UnstructuredExtractor()
+
+
+@pytest.fixture(autouse=True)
+def _clear_extractor_caches():
+    """
+    Clear functools caches (lru_cache/cache) in the extractor module before each test, so
+    a result cached under one test's partition_pdf mock cannot leak into the next now
+    that the extractor is shared across the session.
+    """
+    module = sys.modules.get('src.extractor.pdf.unstructured_extractor')
+    for value in (vars(module).values() if module else ()):
+        cache_clear = getattr(value, 'cache_clear', None)
+        if callable(cache_clear):
+            cache_clear()
+    yield
+
+
+@lru_cache(maxsize=None)
+def _element_class(element_type):
+    """A bare class named like the Unstructured element type (the extractor keys on the name)."""
+    return type(element_type, (), {'__str__': lambda self: self.text})
+
+
+def make_elem(element_type, page, text):
+    """Plain stand-in for an Unstructured element: type name, metadata.page_number and str()."""
+    element = _element_class(element_type)()
+    element.metadata = SimpleNamespace(page_number=page)
+    element.text = text
+    return element
+
+
+@pytest.fixture(autouse=True)
+def mock_partition_pdf(unstructured_module, monkeypatch):
+    """
+    Replace partition_pdf for every test so no test reaches the real Unstructured
+    pipeline; tests that read() set return_value/side_effect on it.
+    """
+    mock = MagicMock()
+    monkeypatch.setattr(unstructured_module, 'partition_pdf', mock)
+    return mock
 
 
 def test_get_information(extractor):
@@ -41,34 +104,24 @@ def test_get_status(extractor):
     assert status == 'succeeded'
 
 
-@patch('src.extractors.unstructured_extractor.partition_pdf')
-def test_read_success(extractor, mock_partition_pdf):
+@pytest.fixture
+def extracted_page(extractor, mock_partition_pdf):
+    """
+    Run read() once over a standard single page (Text, Table and Title elements) and
+    return read()'s return value; the success tests each assert their own slice of it.
+    """
+    mock_partition_pdf.return_value = [
+        make_elem('Text', 1, TEXT_SAMPLE),
+        make_elem('Table', 1, TABLE_SAMPLE),
+        make_elem('Title', 1, TITLE_SAMPLE),
+    ]
+    return extractor.read("test.pdf")
+
+
+def test_read_success(extractor, extracted_page):
     """Test successful PDF reading with Unstructured."""
-    # Create mock elements
-    mock_text_element = MagicMock()
-    mock_text_element.__class__.__name__ = 'Text'
-    mock_text_element.metadata = {'page_number': 1}
-    mock_text_element.__str__ = MagicMock(return_value="This is text content.")
-    
-    mock_table_element = MagicMock()
-    mock_table_element.__class__.__name__ = 'Table'
-    mock_table_element.metadata = {'page_number': 1}
-    mock_table_element.__str__ = MagicMock(return_value="| Col1 | Col2 |\n|------|------|\n| A    | B    |")
-    
-    mock_title_element = MagicMock()
-    mock_title_element.__class__.__name__ = 'Title'
-    mock_title_element.metadata = {'page_number': 1}
-    mock_title_element.__str__ = MagicMock(return_value="Document Title")
-    
-    mock_elements = [mock_text_element, mock_table_element, mock_title_element]
-    mock_partition_pdf.return_value = mock_elements
-    
-    # Test the extraction
-    test_file = "test.pdf"
-    result = extractor.read(test_file)
-    
     # Verify the result
-    assert result is True  # Should return True for sync extractors
+    assert extracted_page is True  # Should return True for sync extractors
     assert extractor._last_result is not None
     
     # Check the stored result structure
@@ -86,12 +139,12 @@ def test_read_success(extractor, mock_partition_pdf):
     
     # Check that text content includes all text elements
     text_content = content['TEXT']
-    assert 'This is text content.' in text_content
-    assert 'Document Title' in text_content
+    assert TEXT_SAMPLE in text_content
+    assert TITLE_SAMPLE in text_content
     
     # Check that table content includes table elements
     table_content = content['TABLES']
-    assert '| Col1 | Col2 |' in table_content
+    assert TABLE_SAMPLE in table_content
     
     # Check that elements list includes all elements
     elements = content['ELEMENTS']
@@ -114,24 +167,12 @@ def test_read_success(extractor, mock_partition_pdf):
     assert metadata['tables_found'] == 1
 
 
-@patch('src.extractors.unstructured_extractor.partition_pdf')
 def test_read_multiple_pages(extractor, mock_partition_pdf):
     """Test PDF reading with multiple pages."""
     # Create mock elements for multiple pages
-    mock_page1_text = MagicMock()
-    mock_page1_text.__class__.__name__ = 'Text'
-    mock_page1_text.metadata = {'page_number': 1}
-    mock_page1_text.__str__ = MagicMock(return_value="Page 1 content")
-    
-    mock_page2_text = MagicMock()
-    mock_page2_text.__class__.__name__ = 'Text'
-    mock_page2_text.metadata = {'page_number': 2}
-    mock_page2_text.__str__ = MagicMock(return_value="Page 2 content")
-    
-    mock_page2_table = MagicMock()
-    mock_page2_table.__class__.__name__ = 'Table'
-    mock_page2_table.metadata = {'page_number': 2}
-    mock_page2_table.__str__ = MagicMock(return_value="| Page 2 Table |")
+    mock_page1_text = make_elem('Text', 1, "Page 1 content")
+    mock_page2_text = make_elem('Text', 2, "Page 2 content")
+    mock_page2_table = make_elem('Table', 2, "| Page 2 Table |")
     
     mock_elements = [mock_page1_text, mock_page2_text, mock_page2_table]
     mock_partition_pdf.return_value = mock_elements
@@ -161,7 +202,6 @@ def test_read_multiple_pages(extractor, mock_partition_pdf):
     assert page2_data['metadata']['tables_found'] == 1
 
 
-@patch('src.extractors.unstructured_extractor.partition_pdf')
 def test_read_failure(extractor, mock_partition_pdf):
     """Test PDF reading failure with Unstructured."""
     # Mock the partition_pdf function to raise an exception
@@ -194,28 +234,11 @@ def test_read_failure(extractor, mock_partition_pdf):
     assert metadata['error'] == 'Unstructured error'
 
 
-def test_get_result(extractor):
+def test_get_result(extractor, extracted_page):
     """Test that get_result returns the last extraction result."""
-    # Set up a mock result
-    mock_result = {
-        1: {
-            'content': {
-                'TEXT': 'Test text',
-                'TABLES': 'Test table',
-                'ELEMENTS': ['element1', 'element2']
-            },
-            'metadata': {
-                'extractor': 'Unstructured',
-                'element_types': ['Text', 'Table'],
-                'total_elements': 2,
-                'tables_found': 1
-            }
-        }
-    }
-    extractor._last_result = mock_result
-    
     result = extractor.get_result("any_job_id")
-    assert result == mock_result
+    assert result is extractor._last_result
+    assert result[1]['metadata']['extractor'] == 'Unstructured'
 
 
 def test_handle_webhook(extractor):
@@ -224,26 +247,10 @@ def test_handle_webhook(extractor):
         extractor.handle_webhook({"test": "data"})
 
 
-@patch('src.extractors.unstructured_extractor.partition_pdf')
-def test_extraction_workflow_with_mock(extractor, mock_partition_pdf):
+def test_extraction_workflow_with_mock(extractor, extracted_page):
     """Test the complete extraction workflow with mocked Unstructured."""
-    # Mock successful extraction
-    mock_text_element = MagicMock()
-    mock_text_element.__class__.__name__ = 'Text'
-    mock_text_element.metadata = {'page_number': 1}
-    mock_text_element.__str__ = MagicMock(return_value="Test content")
-    
-    mock_table_element = MagicMock()
-    mock_table_element.__class__.__name__ = 'Table'
-    mock_table_element.metadata = {'page_number': 1}
-    mock_table_element.__str__ = MagicMock(return_value="| A | B |")
-    
-    mock_elements = [mock_text_element, mock_table_element]
-    mock_partition_pdf.return_value = mock_elements
-    
-    # Test read
-    result = extractor.read("test.pdf")
-    assert result is True
+    # read() ran in the fixture; the sync workflow then reports success and the same result
+    assert extracted_page is True
     
     # Test get_status
     status = extractor.get_status("test_job_id")
@@ -251,59 +258,39 @@ def test_extraction_workflow_with_mock(extractor, mock_partition_pdf):
     
     # Test get_result
     extraction_result = extractor.get_result("test_job_id")
-    assert extraction_result is not None
     assert isinstance(extraction_result, dict)
     assert 1 in extraction_result
     
-    # Verify content structure
-    page_data = extraction_result[1]
-    assert 'content' in page_data
-    assert 'metadata' in page_data
-    
-    content = page_data['content']
-    assert 'TEXT' in content
-    assert 'TABLES' in content
-    assert 'ELEMENTS' in content
-    assert 'Test content' in content['TEXT']
-    assert '| A | B |' in content['TABLES']
-    
-    metadata = page_data['metadata']
-    assert metadata['extractor'] == 'Unstructured'
-    assert 'Text' in metadata['element_types']
-    assert 'Table' in metadata['element_types']
-    assert metadata['total_elements'] == 2
-    assert metadata['tables_found'] == 1
+    content = extraction_result[1]['content']
+    assert TEXT_SAMPLE in content['TEXT']
+    assert TABLE_SAMPLE in content['TABLES']
 
 
-# Parametrized test for different element types
-@pytest.mark.parametrize("element_type,expected_in_text", [
+# Element type -> whether its text lands in TEXT (True) or the separate TABLES field (False)
+ELEMENT_TYPE_ROUTING = [
     ('Text', True),
     ('Title', True),
     ('Table', False),  # Tables go to separate field
     ('Header', True),
     ('Footer', True),
-])
-@patch('src.extractors.unstructured_extractor.partition_pdf')
-def test_different_element_types(extractor, mock_partition_pdf, element_type, expected_in_text):
-    """Test handling of different element types."""
-    mock_element = MagicMock()
-    mock_element.__class__.__name__ = element_type
-    mock_element.metadata = {'page_number': 1}
-    mock_element.__str__ = MagicMock(return_value=f"{element_type} content")
-    
-    mock_partition_pdf.return_value = [mock_element]
+]
+ROUTING_TEXTS = {element_type: f"{element_type} content" for element_type, _ in ELEMENT_TYPE_ROUTING}
+
+
+def test_element_type_routing(extractor, mock_partition_pdf):
+    """Test handling of different element types in a single extraction."""
+    mock_partition_pdf.return_value = [
+        make_elem(element_type, 1, ROUTING_TEXTS[element_type])
+        for element_type, _expected_in_text in ELEMENT_TYPE_ROUTING
+    ]
     
     result = extractor.read("test.pdf")
     assert result is True
     
-    stored_result = extractor._last_result
-    page_data = stored_result[1]
-    content = page_data['content']
-    
-    if expected_in_text:
-        assert f"{element_type} content" in content['TEXT']
-    else:
-        assert f"{element_type} content" in content['TABLES']
+    content = extractor._last_result[1]['content']
+    for element_type, expected_in_text in ELEMENT_TYPE_ROUTING:
+        field = 'TEXT' if expected_in_text else 'TABLES'
+        assert ROUTING_TEXTS[element_type] in content[field], element_type
 
 
 if __name__ == '__main__':
@@ -314,6 +301,7 @@ if __name__ == '__main__':
             print(f"Running Unstructured tests with file: {test_file}")
             
             # Run specific tests with real file
+            from src.extractor.pdf.unstructured_extractor import UnstructuredExtractor
             extractor = UnstructuredExtractor()
             
             # Test read with real file